@@ -0,0 +1,81 @@
+"""Sound effects that never hold up the game.
+
+start() returns at once: a background thread initializes the mixer and
+decodes the sound files, and a sound that isn't loaded yet is simply not
+played. Sounds go out on a few reserved mixer channels, taking a free one
+or the one that started playing longest ago, so effects can't be starved by
+other mixer users. The same sound triggered again within dedupe_ms is
+dropped. With no audio device, a missing file, or SDL_AUDIODRIVER=dummy
+(headless runs) the manager, or that one sound, is a no-op.
+"""
+import os
+import threading
+import time
+
+import pygame
+
+HEADLESS_DRIVERS = ('dummy', 'disk')
+
+
+class AudioManager:
+    def __init__(self, paths, channels=4, dedupe_ms=80):
+        # name -> file
+        self.paths = paths
+        self.channel_count = channels
+        self.dedupe = dedupe_ms / 1000
+        self.sounds = {}
+        self.channels = []
+        self.started_at = []
+        self.last_played = {}
+        self.enabled = False
+        self.loader = None
+
+    def start(self):
+        """Load the sounds in the background; returns immediately."""
+        if self.loader is not None or os.environ.get('SDL_AUDIODRIVER') in HEADLESS_DRIVERS:
+            return
+        self.loader = threading.Thread(target=self._load, name='audio-loader', daemon=True)
+        self.loader.start()
+
+    def _load(self):
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            pygame.mixer.set_reserved(self.channel_count)
+            channels = [pygame.mixer.Channel(i) for i in range(self.channel_count)]
+        except pygame.error as error:
+            print(f"Warning: Sound disabled: {error}")
+            return
+        self.started_at = [0.0] * len(channels)
+        self.channels = channels
+        self.enabled = True
+        for name, path in self.paths.items():
+            try:
+                self.sounds[name] = pygame.mixer.Sound(path)
+            except (pygame.error, OSError) as error:
+                print(f"Warning: Could not load sound {path}: {error}")
+
+    def wait_loaded(self, timeout=None):
+        if self.loader is not None:
+            self.loader.join(timeout)
+
+    def play(self, name):
+        """Play a sound if it is loaded and wasn't just played; never blocks."""
+        if not self.enabled:
+            return
+        sound = self.sounds.get(name)
+        if sound is None:
+            return
+        now = time.monotonic()
+        if now - self.last_played.get(name, -self.dedupe) < self.dedupe:
+            return
+        self.last_played[name] = now
+        index = self._pick_channel()
+        self.started_at[index] = now
+        self.channels[index].play(sound)
+
+    def _pick_channel(self):
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+        return self.started_at.index(min(self.started_at))
@@ -0,0 +1,81 @@
+"""Frame-time benchmark for draw_background.
+
+Compares the old per-frame path (load + scale image.png every frame, or
+draw the gradient line by line) with the cached background surfaces.
+
+Run from the repository root:
+    python -m benchmarks.bench_background [--frames N]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+import hangmanGame
+
+
+def legacy_draw_background(surface, image_path="image.png"):
+    try:
+        background_image = pygame.image.load(image_path)
+        background_image = pygame.transform.scale(background_image, (surface.get_width(), surface.get_height()))
+        surface.blit(background_image, (0, 0))
+    except (pygame.error, OSError):
+        background_color1 = (230, 240, 255)
+        background_color2 = (255, 255, 240)
+        for y in range(surface.get_height()):
+            progress = y / surface.get_height()
+            color = tuple(int(background_color1[i] * (1 - progress) + background_color2[i] * progress)
+                        for i in range(3))
+            pygame.draw.line(surface, color, (0, y), (surface.get_width(), y))
+
+
+def time_frames(draw, surface, frames):
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw(surface)
+        times.append(time.perf_counter() - start)
+    times.sort()
+    return {
+        'mean_ms': sum(times) / len(times) * 1000,
+        'p50_ms': times[len(times) // 2] * 1000,
+        'p99_ms': times[min(len(times) - 1, int(len(times) * 0.99))] * 1000,
+    }
+
+
+def report(label, stats):
+    print(f"{label:<28} mean {stats['mean_ms']:8.3f} ms   "
+          f"p50 {stats['p50_ms']:8.3f} ms   p99 {stats['p99_ms']:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=120)
+    args = parser.parse_args()
+
+    surface = hangmanGame.init_display()
+
+    # Image path
+    hangmanGame.clear_background_cache()
+    report("image: legacy", time_frames(legacy_draw_background, surface, args.frames))
+    report("image: cached", time_frames(hangmanGame.draw_background, surface, args.frames))
+
+    # Gradient fallback path (image missing)
+    hangmanGame.clear_background_cache()
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    try:
+        report("gradient: legacy", time_frames(lambda s: legacy_draw_background(s, "missing.png"),
+                                               surface, args.frames))
+        report("gradient: cached", time_frames(hangmanGame.draw_background, surface, args.frames))
+    finally:
+        os.chdir(cwd)
+        hangmanGame.clear_background_cache()
+
+
+if __name__ == "__main__":
+    main()
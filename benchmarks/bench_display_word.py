@@ -0,0 +1,81 @@
+"""Cost of reading the display word and win state every frame.
+
+Plays games on long words and, after every guess, reads
+get_display_word() and is_word_guessed() once per frame for a second's
+worth of frames, as the game screens do. Compares rebuilding both from the
+word on each read (the old implementation) with the values HangmanGame
+keeps up to date in guess_letter.
+
+Run from the repository root:
+    python -m benchmarks.bench_display_word [--length 40] [--fps 240]
+"""
+import argparse
+import random
+import time
+
+from hangmanCore import ALPHABET, HangmanGame
+
+
+def legacy_display_word(game):
+    correct_letters = game.correct_letters
+    return ' '.join([char if char in correct_letters else '_' for char in game.word])
+
+
+def legacy_is_word_guessed(game):
+    correct_letters = game.correct_letters
+    return all(char in correct_letters for char in game.word)
+
+
+def current_display_word(game):
+    return game.get_display_word()
+
+
+def current_is_word_guessed(game):
+    return game.is_word_guessed()
+
+
+def run(words, guesses, fps, display_word, is_word_guessed):
+    """(seconds spent reading, frames read, checksum of what was read)."""
+    elapsed = 0.0
+    frames = 0
+    checksum = 0
+    for word, letters in zip(words, guesses):
+        game = HangmanGame(word)
+        game.max_attempts = len(ALPHABET)
+        for letter in letters:
+            game.guess_letter(letter)
+            start = time.perf_counter()
+            for _ in range(fps):
+                shown = display_word(game)
+                won = is_word_guessed(game)
+            elapsed += time.perf_counter() - start
+            frames += fps
+            checksum += hash(shown) + won
+            if won:
+                break
+    return elapsed, frames, checksum
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=50)
+    parser.add_argument('--length', type=int, default=40, help="letters per word")
+    parser.add_argument('--fps', type=int, default=240, help="reads per guess")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    words = [''.join(rng.choices(ALPHABET, k=args.length)) for _ in range(args.games)]
+    guesses = [rng.sample(ALPHABET, len(ALPHABET)) for _ in words]
+
+    legacy, reads, legacy_checksum = run(words, guesses, args.fps, legacy_display_word, legacy_is_word_guessed)
+    current, _, checksum = run(words, guesses, args.fps, current_display_word, current_is_word_guessed)
+    if checksum != legacy_checksum:
+        raise SystemExit("implementations disagree")
+    print(f"{args.games} games on {args.length}-letter words, {args.fps} frames per guess")
+    print(f"  {'rebuilt per read':<20} {legacy / reads * 1e9:8.0f} ns/frame")
+    print(f"  {'maintained':<20} {current / reads * 1e9:8.0f} ns/frame   ({legacy / current:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
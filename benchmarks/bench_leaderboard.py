@@ -0,0 +1,77 @@
+"""Leaderboard query time over a large game results database.
+
+Fills a scratch database with synthetic finished games through
+ScoreStore's batched writer, then times the top-N queries: overall, per
+category, per category and difficulty, per player, and for the AI.
+
+Run from the repository root:
+    python -m benchmarks.bench_leaderboard [--rows 1000000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import scoreStore
+
+CATEGORIES = ('ANIMALS', 'COUNTRIES', 'FRUITS', 'SPORTS', 'MOVIES', 'SCIENCE')
+DIFFICULTIES = ('EASY', 'MEDIUM', 'HARD', 'EXPERT')
+
+
+def synthetic_rows(count, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        wrong = rng.randint(0, 7)
+        hints = rng.randint(0, 2)
+        game_time = rng.randint(5, 300)
+        components = [rng.randint(-60, 400), max(0, 100 - game_time) // 10, (7 - wrong) * 10,
+                      rng.randint(3, 15) * 2, 50 if hints == 0 else 0, 100 if wrong == 0 else 0]
+        if rng.random() < 0.1:
+            mode, player, category, difficulty = 'ai', 'AI', None, None
+        else:
+            mode, player = 'single', f"player{rng.randrange(1000)}"
+            category, difficulty = rng.choice(CATEGORIES), rng.choice(DIFFICULTIES)
+        yield (time.time(), mode, player, 'WORD', category, difficulty, int(wrong < 7), rng.randint(5, 20), wrong, hints, rng.randint(0, 10),
+               game_time, *components, sum(components))
+
+
+def timed(query, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = query()
+    return (time.perf_counter() - start) / repeat, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = scoreStore.ScoreStore(os.path.join(directory, 'scores.db'), batch_size=10_000)
+        try:
+            start = time.perf_counter()
+            store.add_rows(synthetic_rows(args.rows))
+            store.flush()
+            elapsed = time.perf_counter() - start
+            print(f"Inserted {args.rows} games in {elapsed:.1f}s ({args.rows / elapsed:,.0f} rows/s)")
+
+            queries = [
+                ("overall", lambda: store.leaderboard(limit=args.top)),
+                ("category", lambda: store.leaderboard('SPORTS', limit=args.top)),
+                ("category+difficulty", lambda: store.leaderboard('SPORTS', 'HARD', args.top)),
+                ("player", lambda: store.player_best('player42', args.top)),
+                ("ai", lambda: store.ai_leaderboard(args.top)),
+            ]
+            for name, query in queries:
+                seconds, rows = timed(query, args.repeat)
+                print(f"  top {args.top} {name:<20} {seconds * 1000:8.3f} ms   best {rows[0]['final_score']}")
+        finally:
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark for the AI's min-max letter choice.
+
+Times the list-based partitioning that min_max_guess used to do against the
+bitset engine (hangmanAI.minimax_choice) on dictionaries from 300 to 500k
+words, and checks both pick the same letter.
+
+Run from the repository root:
+    python -m benchmarks.bench_minimax [--sizes 300,5000,50000,500000] [--legacy-max 50000]
+"""
+import argparse
+import random
+import time
+
+import hangmanAI
+from hangmanCore import flatten_words, load_words, LETTER_FREQUENCIES
+
+# Rough English letter weights for synthetic dictionaries
+LETTER_WEIGHTS = {
+    'E': 12.0, 'T': 9.1, 'A': 8.2, 'O': 7.5, 'I': 7.0, 'N': 6.7, 'S': 6.3, 'H': 6.1,
+    'R': 6.0, 'D': 4.3, 'L': 4.0, 'C': 2.8, 'U': 2.8, 'M': 2.4, 'W': 2.4, 'F': 2.2,
+    'G': 2.0, 'Y': 2.0, 'P': 1.9, 'B': 1.5, 'V': 1.0, 'K': 0.8, 'J': 0.15, 'X': 0.15,
+    'Q': 0.1, 'Z': 0.07,
+}
+
+
+def synthetic_words(count, seed=0):
+    rng = random.Random(seed)
+    letters = list(LETTER_WEIGHTS)
+    weights = list(LETTER_WEIGHTS.values())
+    return [''.join(rng.choices(letters, weights, k=rng.randint(3, 12))) for _ in range(count)]
+
+
+def legacy_min_max(words, guessed_letters, correct_letters):
+    """min_max_guess as it was before the bitset engine (letters scanned alphabetically)."""
+    best_letter = None
+    min_max_partition_size = float('inf')
+    for letter in sorted(set('ABCDEFGHIJKLMNOPQRSTUVWXYZ') - guessed_letters):
+        partitions = {}
+        for word in words:
+            pattern = tuple(i for i, c in enumerate(word) if c == letter)
+            if pattern not in partitions:
+                partitions[pattern] = []
+            partitions[pattern].append(word)
+        max_partition_size = max(len(group) for group in partitions.values()) if partitions else 0
+
+        if max_partition_size < min_max_partition_size:
+            min_max_partition_size = max_partition_size
+            best_letter = letter
+        elif max_partition_size == min_max_partition_size:
+            vowels = {'A', 'E', 'I', 'O', 'U'}
+            current_vowels = len(correct_letters & vowels)
+            if (letter in vowels and best_letter not in vowels and current_vowels < 2) or \
+               (letter in vowels and best_letter in vowels and
+                    LETTER_FREQUENCIES.index(letter) < LETTER_FREQUENCIES.index(best_letter)):
+                best_letter = letter
+    return best_letter, min_max_partition_size
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='300,5000,50000,500000')
+    parser.add_argument('--legacy-max', type=int, default=50000,
+                        help="skip the list-based version above this many words")
+    args = parser.parse_args()
+
+    dictionaries = [('words.txt', flatten_words(load_words('words.txt')))]
+    for size in (int(size) for size in args.sizes.split(',')):
+        dictionaries.append((f"synthetic {size}", synthetic_words(size)))
+
+    print(f"{'dictionary':<20}{'words':>8}{'index ms':>11}{'engine ms':>11}{'legacy ms':>11}"
+          f"{'speedup':>9}  letter  worst")
+    for name, words in dictionaries:
+        bitsets, index_ms = timed(hangmanAI.WordBitsets, words)
+        # Second turn: one vowel known, the position matters for the partition
+        guessed, correct = {'E'}, {'E'}
+        (letter, worst), engine_ms = timed(hangmanAI.minimax_choice, bitsets, bitsets.all, guessed, correct)
+
+        legacy = speedup = ''
+        if len(words) <= args.legacy_max:
+            (legacy_letter, legacy_worst), legacy_ms = timed(legacy_min_max, words, guessed, correct)
+            assert (legacy_letter, legacy_worst) == (letter, worst), (legacy_letter, legacy_worst, letter, worst)
+            legacy = f"{legacy_ms:.1f}"
+            speedup = f"{legacy_ms / engine_ms:.0f}x"
+        print(f"{name:<20}{len(words):>8}{index_ms:>11.1f}{engine_ms:>11.2f}{legacy:>11}{speedup:>9}"
+              f"  {letter:^6}  {worst}")
+
+
+if __name__ == "__main__":
+    main()
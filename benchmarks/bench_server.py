@@ -0,0 +1,117 @@
+"""Load generator for hangmanServer: thousands of clients playing at once.
+
+Every simulated client opens its own connection, plays --games games by
+guessing letters in English frequency order from the pattern the server
+sends back, and ends each session. Reports throughput and request latency
+percentiles. Without --port a server is started in a child process on a
+free port, so the clients and the server don't share an event loop.
+
+Run from the repository root:
+    python -m benchmarks.bench_server [--clients 2000] [--games 5]
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+
+import hangmanCore
+import hangmanServer
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def run_client(host, port, games, connect_gate, latencies, totals):
+    async with connect_gate:
+        client = await hangmanServer.GameClient.connect(host, port)
+    try:
+        for _ in range(games):
+            start = time.perf_counter()
+            response = await client.request('new')
+            latencies.append(time.perf_counter() - start)
+            if not response['ok']:
+                totals['errors'] += 1
+                continue
+            state = response['state']
+            for letter in hangmanCore.LETTER_FREQUENCIES:
+                if state['status'] != 'playing':
+                    break
+                start = time.perf_counter()
+                response = await client.request('guess', letter=letter)
+                latencies.append(time.perf_counter() - start)
+                if not response['ok']:
+                    totals['errors'] += 1
+                    break
+                state = response['state']
+            totals['won' if state['status'] == 'won' else 'lost'] += 1
+            start = time.perf_counter()
+            await client.request('end')
+            latencies.append(time.perf_counter() - start)
+    finally:
+        await client.close()
+
+
+async def run_load(host, port, clients, games, connect_concurrency):
+    latencies = []
+    totals = {'won': 0, 'lost': 0, 'errors': 0, 'failed_clients': 0}
+    connect_gate = asyncio.Semaphore(connect_concurrency)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(run_client(host, port, games, connect_gate, latencies, totals)
+                                     for _ in range(clients)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    totals['failed_clients'] = sum(1 for result in results if isinstance(result, BaseException))
+    return latencies, totals, elapsed
+
+
+def start_server(max_connections):
+    """Start hangmanServer in a child process; returns (process, host, port)."""
+    process = subprocess.Popen([sys.executable, '-m', 'hangmanServer', '--port', '0',
+                                '--max-connections', str(max_connections)],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Listening on "):
+        process.kill()
+        raise RuntimeError(f"server did not start: {line!r}")
+    host, port = line.split()[-1].rsplit(':', 1)
+    return process, host, int(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clients', type=int, default=2000)
+    parser.add_argument('--games', type=int, default=5, help="games per client")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=None, help="use a running server instead of starting one")
+    parser.add_argument('--connect-concurrency', type=int, default=256,
+                        help="connections being opened at once, to stay within the listen backlog")
+    args = parser.parse_args()
+
+    hangmanServer.raise_fd_limit()
+    process = None
+    host, port = args.host, args.port
+    if port is None:
+        process, host, port = start_server(args.clients + 100)
+    try:
+        latencies, totals, elapsed = asyncio.run(run_load(host, port, args.clients, args.games,
+                                                          args.connect_concurrency))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    latencies.sort()
+    games = totals['won'] + totals['lost']
+    print(f"{args.clients} clients, {games} games ({totals['won']} won), {len(latencies)} requests "
+          f"in {elapsed:.2f}s")
+    print(f"  throughput   {len(latencies) / elapsed:10,.0f} requests/s {games / elapsed:10,.0f} games/s")
+    print(f"  latency ms   p50 {percentile(latencies, 0.50) * 1000:.2f}  p99 {percentile(latencies, 0.99) * 1000:.2f}"
+          f"  max {latencies[-1] * 1000 if latencies else 0.0:.2f}")
+    print(f"  errors       {totals['errors']} responses, {totals['failed_clients']} clients failed")
+
+
+if __name__ == "__main__":
+    main()
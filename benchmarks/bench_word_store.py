@@ -0,0 +1,72 @@
+"""Memory of the word representations, scaled to bytes per million words.
+
+Compares the load_words() layout (a dict of difficulty lists of str plus
+the flattened copy play_ai_mode builds) against a WordStore holding the
+same words with id views for the groups and the flat list, and reports the
+AI's candidate index built over each.
+
+Run from the repository root:
+    python -m benchmarks.bench_word_store [--words 1000000]
+"""
+import argparse
+import gc
+import tracemalloc
+
+import hangmanAI
+import wordStore
+from benchmarks.bench_minimax import synthetic_words
+
+DIFFICULTIES = ('EASY', 'MEDIUM', 'HARD')
+
+
+def measured(build):
+    """(result, bytes allocated by build() that are still alive)."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def build_lists(lines):
+    categories = {'SYNTHETIC': {difficulty: [] for difficulty in DIFFICULTIES}}
+    for k, line in enumerate(lines):
+        categories['SYNTHETIC'][DIFFICULTIES[k % 3]].append(line.upper())
+    all_words = [word for words in categories['SYNTHETIC'].values() for word in words]
+    return categories, all_words
+
+
+def build_store(lines):
+    store = wordStore.WordStore()
+    for k, line in enumerate(lines):
+        store.add(line.upper(), 'SYNTHETIC', DIFFICULTIES[k % 3])
+    categories = {'SYNTHETIC': {difficulty: store.group('SYNTHETIC', difficulty) for difficulty in DIFFICULTIES}}
+    return categories, store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=250_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    # Distinct lowercase lines, as they would come from a file
+    lines = list(dict.fromkeys(word.lower() for word in synthetic_words(args.words, args.seed)))
+    scale = 1_000_000 / len(lines)
+    print(f"{len(lines)} distinct words, figures in MB per million words")
+
+    (_, list_words), list_bytes = measured(lambda: build_lists(lines))
+    (_, store), store_bytes = measured(lambda: build_store(lines))
+    print(f"  {'lists of str':<24} {list_bytes * scale / 1e6:8.1f}")
+    print(f"  {'WordStore + views':<24} {store_bytes * scale / 1e6:8.1f}   ({list_bytes / store_bytes:.1f}x smaller)")
+
+    _, list_index_bytes = measured(lambda: hangmanAI.CandidateIndex(list_words))
+    _, store_index_bytes = measured(lambda: hangmanAI.CandidateIndex(store))
+    print(f"  {'index over lists':<24} {list_index_bytes * scale / 1e6:8.1f}")
+    print(f"  {'index over WordStore':<24} {store_index_bytes * scale / 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Binary word list compiled from words.txt and words_with_hints.txt.
+
+The text files are parsed once by compile_words() into a single file that is
+read through mmap, so loading the words costs an open() instead of a
+parse. Lookups unpack fixed-size records straight from the mapping and only
+decode the strings that are actually used.
+
+Layout (little-endian, all integers u32):
+    header      magic, version, category/group/word/length counts, string table offset
+    categories  name offset, name length, first group, group count, flat flag
+    groups      difficulty offset, difficulty length, first word, word count
+    words       word offset, word length, hint offset, hint length, category
+    lookup      word ids sorted by (category, word) for hint lookups
+    lengths     length, first position in by_length, count
+    by_length   word ids ordered by word length
+    strings     UTF-8 string table
+
+Compile by hand (the game does this automatically when the text is newer):
+    python compiledWords.py --words words.txt --hints words_with_hints.txt --out words.bin
+"""
+import argparse
+import mmap
+import os
+import struct
+import tempfile
+from collections.abc import Sequence
+
+from hangmanCore import load_words, load_words_with_hints
+
+MAGIC = b'HWRD'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<4s7I')
+CATEGORY = struct.Struct('<5I')
+GROUP = struct.Struct('<4I')
+WORD = struct.Struct('<5I')
+LENGTH = struct.Struct('<3I')
+INDEX = struct.Struct('<I')
+
+
+def compile_words(words_path, hints_path, out_path):
+    """Parse the text word lists and write the binary file to out_path."""
+    categories = load_words(words_path)
+    hints = load_words_with_hints(hints_path) if hints_path and os.path.exists(hints_path) else {}
+
+    strings = bytearray()
+    string_offsets = {}
+
+    def add_string(text):
+        if text not in string_offsets:
+            data = text.encode('utf-8')
+            string_offsets[text] = (len(strings), len(data))
+            strings.extend(data)
+        return string_offsets[text]
+
+    category_records = []
+    group_records = []
+    word_records = []
+    words = []
+    for category_id, (category, category_data) in enumerate(categories.items()):
+        flat = not isinstance(category_data, dict)
+        groups = [('', category_data)] if flat else list(category_data.items())
+        category_records.append(CATEGORY.pack(*add_string(category), len(group_records), len(groups), flat))
+        category_hints = hints.get(category, {})
+        for difficulty, group_words in groups:
+            group_records.append(GROUP.pack(*add_string(difficulty), len(words), len(group_words)))
+            for word in group_words:
+                hint = category_hints.get(word)
+                hint_offset, hint_length = add_string(hint) if hint else (0, 0)
+                word_records.append(WORD.pack(*add_string(word), hint_offset, hint_length, category_id))
+                words.append((category_id, word))
+
+    lookup = sorted(range(len(words)), key=lambda i: (words[i][0], words[i][1].encode('utf-8')))
+    by_length = sorted(range(len(words)), key=lambda i: len(words[i][1]))
+    length_records = []
+    for position, word_id in enumerate(by_length):
+        length = len(words[word_id][1])
+        if not length_records or length_records[-1][0] != length:
+            length_records.append([length, position, 0])
+        length_records[-1][2] += 1
+
+    body = b''.join([
+        b''.join(category_records),
+        b''.join(group_records),
+        b''.join(word_records),
+        b''.join(INDEX.pack(i) for i in lookup),
+        b''.join(LENGTH.pack(*record) for record in length_records),
+        b''.join(INDEX.pack(i) for i in by_length),
+    ])
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, len(category_records), len(group_records),
+                         len(words), len(length_records), HEADER.size + len(body), len(strings))
+
+    directory = os.path.dirname(os.path.abspath(out_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(header)
+            file.write(body)
+            file.write(strings)
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+class WordGroup(Sequence):
+    """Words of one category/difficulty (or length), decoded on access."""
+
+    def __init__(self, words, start, count, ids=None):
+        self._words = words
+        self._start = start
+        self._count = count
+        # Optional offset of a u32 id table to read word ids through
+        self._ids = ids
+
+    def __len__(self):
+        return self._count
+
+    def _word_id(self, i):
+        if isinstance(i, slice):
+            raise TypeError("WordGroup does not support slicing")
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        if self._ids is None:
+            return self._start + i
+        return INDEX.unpack_from(self._words.view, self._ids + (self._start + i) * INDEX.size)[0]
+
+    def __getitem__(self, i):
+        return self._words.word(self._word_id(i))
+
+    def hint(self, i):
+        return self._words.hint(self._word_id(i))
+
+
+class CompiledWords:
+    """Read-only view of a compiled word file.
+
+    Indexing by category returns the same shape as load_words(): a dict of
+    difficulty -> WordGroup, or a WordGroup for categories without
+    difficulties.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self._mmap)
+        (magic, version, self.category_count, self.group_count, self.word_count,
+         self.length_count, self._strings, _) = HEADER.unpack_from(self.view, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Not a compiled word file (version {FORMAT_VERSION}): {path}")
+
+        self._categories = HEADER.size
+        self._groups = self._categories + self.category_count * CATEGORY.size
+        self._words = self._groups + self.group_count * GROUP.size
+        self._lookup = self._words + self.word_count * WORD.size
+        self._lengths = self._lookup + self.word_count * INDEX.size
+        self._by_length = self._lengths + self.length_count * LENGTH.size
+
+        # Only the category names are decoded up front
+        self._category_ids = {}
+        for category_id in range(self.category_count):
+            offset, length = CATEGORY.unpack_from(self.view, self._categories + category_id * CATEGORY.size)[:2]
+            self._category_ids[self.string(offset, length)] = category_id
+
+    def close(self):
+        self.view.release()
+        self._mmap.close()
+
+    def string(self, offset, length):
+        start = self._strings + offset
+        return str(self.view[start:start + length], 'utf-8')
+
+    def word(self, word_id):
+        offset, length = WORD.unpack_from(self.view, self._words + word_id * WORD.size)[:2]
+        return self.string(offset, length)
+
+    def hint(self, word_id):
+        offset, length = WORD.unpack_from(self.view, self._words + word_id * WORD.size)[2:4]
+        return self.string(offset, length) if length else None
+
+    def keys(self):
+        return self._category_ids.keys()
+
+    def __iter__(self):
+        return iter(self._category_ids)
+
+    def __len__(self):
+        return self.category_count
+
+    def __contains__(self, category):
+        return category in self._category_ids
+
+    def __getitem__(self, category):
+        _, _, first_group, group_count, flat = CATEGORY.unpack_from(
+            self.view, self._categories + self._category_ids[category] * CATEGORY.size)
+        groups = {}
+        for group_id in range(first_group, first_group + group_count):
+            offset, length, first_word, word_count = GROUP.unpack_from(self.view, self._groups + group_id * GROUP.size)
+            group = WordGroup(self, first_word, word_count)
+            if flat:
+                return group
+            groups[self.string(offset, length)] = group
+        return groups
+
+    def get_hint(self, category, word):
+        """Hint for word in category, or None (binary search over the lookup table)."""
+        category_id = self._category_ids.get(category)
+        if category_id is None:
+            return None
+        key = (category_id, word.encode('utf-8'))
+        low, high = 0, self.word_count
+        while low < high:
+            middle = (low + high) // 2
+            word_id = INDEX.unpack_from(self.view, self._lookup + middle * INDEX.size)[0]
+            offset, length, _, _, word_category = WORD.unpack_from(self.view, self._words + word_id * WORD.size)
+            start = self._strings + offset
+            if (word_category, bytes(self.view[start:start + length])) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.word_count:
+            word_id = INDEX.unpack_from(self.view, self._lookup + low * INDEX.size)[0]
+            offset, length, _, _, word_category = WORD.unpack_from(self.view, self._words + word_id * WORD.size)
+            if word_category == category_id and self.string(offset, length) == word:
+                return self.hint(word_id)
+        return None
+
+    def words_of_length(self, length):
+        for i in range(self.length_count):
+            bucket_length, first, count = LENGTH.unpack_from(self.view, self._lengths + i * LENGTH.size)
+            if bucket_length == length:
+                return WordGroup(self, first, count, ids=self._by_length)
+        return WordGroup(self, 0, 0)
+
+
+def needs_compile(words_path, hints_path, compiled_path):
+    try:
+        compiled_mtime = os.path.getmtime(compiled_path)
+    except OSError:
+        return True
+    for source in (words_path, hints_path):
+        if source and os.path.exists(source) and os.path.getmtime(source) > compiled_mtime:
+            return True
+    return False
+
+
+def compiled_path_for(words_path):
+    return os.path.splitext(words_path)[0] + '.bin'
+
+
+def open_words(words_path='words.txt', hints_path='words_with_hints.txt', compiled_path=None):
+    """Open the compiled word file, rebuilding it first if the text is newer."""
+    compiled_path = compiled_path or compiled_path_for(words_path)
+    if needs_compile(words_path, hints_path, compiled_path):
+        compile_words(words_path, hints_path, compiled_path)
+    try:
+        return CompiledWords(compiled_path)
+    except (ValueError, struct.error):
+        # Truncated, or written by another version of this module
+        compile_words(words_path, hints_path, compiled_path)
+        return CompiledWords(compiled_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile the word lists into the binary format the game loads.")
+    parser.add_argument('--words', default='words.txt')
+    parser.add_argument('--hints', default='words_with_hints.txt')
+    parser.add_argument('--out', default=None, help="output path (default: words file with a .bin extension)")
+    args = parser.parse_args()
+
+    out = args.out or compiled_path_for(args.words)
+    compile_words(args.words, args.hints, out)
+    words = CompiledWords(out)
+    print(f"Wrote {words.word_count} words in {words.category_count} categories to {out} "
+          f"({os.path.getsize(out)} bytes)")
+    words.close()
+
+
+if __name__ == "__main__":
+    main()
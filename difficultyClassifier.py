@@ -0,0 +1,254 @@
+"""Data-driven difficulty tiers for dictionary words.
+
+Each word is scored on three things:
+    solvability  mean wrong guesses (and failures) of the AI strategies
+                 playing it against the whole dictionary, run in parallel
+                 through the tournament process pool
+    rarity       mean surprisal of its distinct letters, from how many
+                 dictionary words contain each letter
+    ambiguity    how many same-length words differ from it in one position
+                 (CAT/BAT/HAT/RAT), the classic hangman trap
+
+Solver results are cached per word. A dictionary game only ever sees the
+words of its own length, so an entry stays valid while that length's words
+(in order) are unchanged; re-running after an edit replays just the words
+whose length group changed. Words are then re-bucketed into
+EASY/MEDIUM/HARD by score quantile and written back in words.txt format:
+
+    python difficultyClassifier.py --words words.txt --out words_classified.txt
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+
+import hangmanAI
+import tournament
+import wordStore
+
+CACHE_VERSION = 2
+TIERS = ('EASY', 'MEDIUM', 'HARD')
+DEFAULT_STRATEGIES = ('frequency', 'entropy')
+
+# Weights of the normalized components in the final score
+SOLVABILITY_WEIGHT = 0.6
+RARITY_WEIGHT = 0.25
+AMBIGUITY_WEIGHT = 0.15
+
+
+def letter_rarity(words):
+    """Letter -> surprisal in bits of a dictionary word containing it."""
+    counts = dict.fromkeys(hangmanAI.ALPHABET, 0)
+    for word in words:
+        for letter in set(word):
+            if letter in counts:
+                counts[letter] += 1
+    total = max(1, len(words))
+    return {letter: -math.log2((count + 1) / (total + 1)) for letter, count in counts.items()}
+
+
+def neighbour_counts(words):
+    """Word -> number of same-length words that differ from it in one position."""
+    groups = {}
+    for word in set(words):
+        for i in range(len(word)):
+            key = word[:i] + '_' + word[i + 1:]
+            groups[key] = groups.get(key, 0) + 1
+    return {word: sum(groups[word[:i] + '_' + word[i + 1:]] - 1 for i in range(len(word)))
+            for word in set(words)}
+
+
+def length_fingerprints(words):
+    """Word length -> digest of the words of that length, in order.
+
+    These are the candidates a dictionary game for such a word plays
+    against, so they are what its solver result depends on.
+    """
+    digests = {}
+    for word in words:
+        digest = digests.get(len(word))
+        if digest is None:
+            digest = digests[len(word)] = hashlib.blake2b(digest_size=16)
+        digest.update(word.encode())
+        digest.update(b'\n')
+    return {str(length): digest.hexdigest() for length, digest in digests.items()}
+
+
+class SolverCache:
+    """Per-word solver results, stored as JSON with the length fingerprints they were played against."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.fingerprints = {}
+        # strategy -> {word: [won, guesses, wrong]}
+        self.results = {}
+
+    def load(self, fingerprints):
+        """Read the cache, keeping only results whose length group is unchanged."""
+        self.fingerprints = fingerprints
+        self.results = {}
+        if not self.path:
+            return
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return
+        saved = data.get('fingerprints', {})
+        valid = {length for length, fingerprint in fingerprints.items() if saved.get(length) == fingerprint}
+        for name, results in data.get('results', {}).items():
+            self.results[name] = {word: result for word, result in results.items() if str(len(word)) in valid}
+
+    def save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({'version': CACHE_VERSION, 'fingerprints': self.fingerprints, 'results': self.results},
+                      file, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+
+def solve_all(words, strategy_names, workers, cache, chunk_size=128, progress=True):
+    """Fill cache with every strategy's result for every word in words."""
+    for name in strategy_names:
+        known = cache.results.setdefault(name, {})
+        # Only uncached words are played, always against the whole dictionary
+        targets = [i for i, word in enumerate(words) if word not in known]
+        if not targets:
+            continue
+        total = tournament.chunk_count(targets, [name], chunk_size)
+        chunks = tournament.iter_chunk_results(words, [name], workers, chunk_size, targets=targets)
+        for done, (_, positions, results, _) in enumerate(chunks, 1):
+            for position, result in zip(positions, results):
+                known[words[position]] = list(result)
+            if progress:
+                print(f"\r{name}: {done}/{total} chunks", end='', file=sys.stderr)
+        if progress:
+            print(file=sys.stderr)
+
+
+def score_words(words, solver_results, strategy_names):
+    """Word -> {'score', 'wrong', 'rarity', 'neighbours'}; higher score is harder."""
+    rarity = letter_rarity(words)
+    neighbours = neighbour_counts(words)
+    raw = {}
+    for word in dict.fromkeys(words):
+        runs = [solver_results[name][word] for name in strategy_names]
+        # A lost game counts as one more wrong guess than the limit allows
+        wrong = sum(result[2] + (0 if result[0] else 1) for result in runs) / len(runs)
+        letters = set(word)
+        raw[word] = {
+            'wrong': wrong,
+            'rarity': sum(rarity.get(letter, 0.0) for letter in letters) / len(letters),
+            'neighbours': neighbours.get(word, 0),
+        }
+
+    def normalizer(values):
+        low, high = min(values), max(values)
+        return (lambda value: (value - low) / (high - low)) if high > low else (lambda value: 0.0)
+
+    if not raw:
+        return raw
+    wrong_scale = normalizer([entry['wrong'] for entry in raw.values()])
+    rarity_scale = normalizer([entry['rarity'] for entry in raw.values()])
+    ambiguity_scale = normalizer([math.log1p(entry['neighbours']) for entry in raw.values()])
+    for entry in raw.values():
+        entry['score'] = (SOLVABILITY_WEIGHT * wrong_scale(entry['wrong'])
+                          + RARITY_WEIGHT * rarity_scale(entry['rarity'])
+                          + AMBIGUITY_WEIGHT * ambiguity_scale(math.log1p(entry['neighbours'])))
+    return raw
+
+
+def assign_tiers(scores, tiers=TIERS):
+    """Word -> tier, splitting words sorted by score into equal-sized tiers."""
+    ordered = sorted(scores, key=lambda word: (scores[word]['score'], word))
+    return {word: tiers[min(len(tiers) - 1, i * len(tiers) // len(ordered))] for i, word in enumerate(ordered)}
+
+
+def rebucket(store, tiers, default_category='WORDS'):
+    """{category: {tier: [words]}} in load_words() shape, keeping each word's category.
+
+    Sections without a difficulty (like [EXPERT]) are kept as flat lists.
+    """
+    categories = {}
+    for (category, difficulty), ids in store.groups.items():
+        words = [store[word_id] for word_id in ids]
+        if category is not None and difficulty is None:
+            categories.setdefault(category, []).extend(words)
+            continue
+        buckets = categories.setdefault(category or default_category, {tier: [] for tier in TIERS})
+        for word in words:
+            buckets[tiers[word]].append(word)
+    return categories
+
+
+def write_words(categories, path):
+    def write_section(file, header, words):
+        file.write(f"[{header}]\n")
+        file.writelines(word.lower() + '\n' for word in sorted(words, key=lambda word: (len(word), word)))
+        file.write('\n')
+
+    with open(path, 'w') as file:
+        for category, data in categories.items():
+            if isinstance(data, dict):
+                for tier, words in data.items():
+                    write_section(file, f"{category}:{tier}", words)
+            else:
+                write_section(file, category, data)
+
+
+def classify(path, strategy_names=DEFAULT_STRATEGIES, workers=None, cache_path=None, progress=True):
+    """Score and tier every word in the dictionary at path; returns (store, scores, tiers)."""
+    store, _ = wordStore.ingest(path, keep_sections=True)
+    words = list(store)
+    cache = SolverCache(cache_path)
+    cache.load(length_fingerprints(words))
+    solve_all(words, strategy_names, workers or os.cpu_count() or 1, cache, progress=progress)
+    cache.save()
+    scores = score_words(words, cache.results, strategy_names)
+    return store, scores, assign_tiers(scores)
+
+
+def report(store, scores, tiers):
+    print(f"{'':<10}" + ''.join(f"{tier:>8}" for tier in TIERS) + f"{'wrong':>8}{'score':>8}")
+    original = {}
+    for (category, difficulty), ids in store.groups.items():
+        for word_id in ids:
+            original.setdefault(store[word_id], difficulty or '-')
+    for difficulty in dict.fromkeys(original.values()):
+        members = [word for word, value in original.items() if value == difficulty]
+        counts = [sum(1 for word in members if tiers[word] == tier) for tier in TIERS]
+        wrong = sum(scores[word]['wrong'] for word in members) / len(members)
+        score = sum(scores[word]['score'] for word in members) / len(members)
+        print(f"{difficulty:<10}" + ''.join(f"{count:>8}" for count in counts) + f"{wrong:>8.2f}{score:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Classify dictionary words into difficulty tiers.")
+    parser.add_argument('--words', default='words.txt',
+                        help="dictionary (words.txt format or one word per line, optionally .gz)")
+    parser.add_argument('--strategies', default=','.join(DEFAULT_STRATEGIES))
+    parser.add_argument('--workers', type=int, default=None, help="solver processes (default: one per CPU)")
+    parser.add_argument('--cache', default='difficulty_cache.json', help="solver result cache ('' to disable)")
+    parser.add_argument('--out', help="write the re-bucketed dictionary here in words.txt format")
+    args = parser.parse_args()
+
+    strategy_names = [name.strip() for name in args.strategies.split(',') if name.strip()]
+    start = time.perf_counter()
+    store, scores, tiers = classify(args.words, strategy_names, args.workers, args.cache or None)
+    print(f"Classified {len(scores)} words in {time.perf_counter() - start:.1f}s "
+          f"(rows: original difficulty, columns: new tier)")
+    report(store, scores, tiers)
+    if args.out:
+        write_words(rebucket(store, tiers), args.out)
+        print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Frame timing and named spans for finding where frame time goes.
+
+Functions are instrumented by name (instrument(owner, attribute)); while
+the profiler is off they are left untouched, so the only cost is a flag
+check per frame. Turning it on swaps in timing wrappers that record a span
+per call into the current frame. Frames are delimited by the caller
+(hangmanGame's event loop), and spans recorded on other threads, like the
+AI worker, land in whichever frame is current.
+
+Span traces can be written in the Chrome trace event format, which
+chrome://tracing and https://ui.perfetto.dev open directly.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+MAX_TRACE_EVENTS = 500_000
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class FrameProfiler:
+    def __init__(self, history=240):
+        self.enabled = False
+        # (owner, attribute, span name, original)
+        self.targets = []
+        self.frame_times = deque(maxlen=history)
+        self.frame_starts = deque(maxlen=history)
+        # One {span: [seconds, calls]} dict per finished frame
+        self.frame_spans = deque(maxlen=history)
+        self.current = {}
+        self.frame_start = None
+        self.lock = threading.Lock()
+        self.trace = None
+        self.trace_path = None
+        self.trace_dropped = 0
+        self.origin = time.perf_counter()
+
+    def instrument(self, owner, attribute, name=None):
+        """Time calls to owner.attribute (a module function or a method) as span name."""
+        target = [owner, attribute, name or attribute, getattr(owner, attribute)]
+        self.targets.append(target)
+        if self.enabled:
+            self._patch(target)
+
+    def _patch(self, target):
+        owner, attribute, name, original = target
+        record = self.record
+
+        @functools.wraps(original)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(name, start, time.perf_counter())
+
+        setattr(owner, attribute, timed)
+
+    def set_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        for target in self.targets:
+            if enabled:
+                self._patch(target)
+            else:
+                setattr(target[0], target[1], target[3])
+        self.current = {}
+        self.frame_start = None
+
+    def record(self, name, start, end):
+        with self.lock:
+            entry = self.current.get(name)
+            if entry is None:
+                self.current[name] = [end - start, 1]
+            else:
+                entry[0] += end - start
+                entry[1] += 1
+            if self.trace is not None:
+                self._trace_event(name, start, end)
+
+    def _trace_event(self, name, start, end):
+        if len(self.trace) >= MAX_TRACE_EVENTS:
+            self.trace_dropped += 1
+            return
+        self.trace.append({'name': name, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_ident(),
+                           'ts': (start - self.origin) * 1e6, 'dur': (end - start) * 1e6})
+
+    def begin_frame(self):
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Close the frame begun by begin_frame(), if any."""
+        if self.frame_start is None:
+            return
+        end = time.perf_counter()
+        with self.lock:
+            self.frame_times.append(end - self.frame_start)
+            self.frame_starts.append(self.frame_start)
+            self.frame_spans.append(self.current)
+            self.current = {}
+            if self.trace is not None:
+                self._trace_event('frame', self.frame_start, end)
+        self.frame_start = None
+
+    def stats(self):
+        """FPS, frame time percentiles and mean per-frame cost of each span, in ms."""
+        times = sorted(self.frame_times)
+        frames = len(self.frame_spans)
+        spans = {}
+        for frame in list(self.frame_spans):
+            for name, (seconds, calls) in frame.items():
+                total = spans.setdefault(name, [0.0, 0])
+                total[0] += seconds
+                total[1] += calls
+        starts = self.frame_starts
+        elapsed = starts[-1] - starts[0] if len(starts) > 1 else 0.0
+        return {
+            'fps': (len(starts) - 1) / elapsed if elapsed else 0.0,
+            'frames': frames,
+            'p50_ms': percentile(times, 0.50) * 1000,
+            'p99_ms': percentile(times, 0.99) * 1000,
+            'spans': {name: {'ms_per_frame': seconds * 1000 / frames, 'calls_per_frame': calls / frames}
+                      for name, (seconds, calls) in sorted(spans.items(), key=lambda item: -item[1][0])},
+        }
+
+    def start_trace(self, path):
+        self.trace = []
+        self.trace_path = path
+        self.trace_dropped = 0
+
+    def stop_trace(self):
+        """Write the collected trace to its file; returns the path, or None if not tracing."""
+        if self.trace is None:
+            return None
+        with self.lock:
+            events, self.trace = self.trace, None
+        tmp_path = self.trace_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms',
+                       'otherData': {'dropped_events': self.trace_dropped}}, file)
+        os.replace(tmp_path, self.trace_path)
+        return self.trace_path
+
+
+# Shared by the game and the AI worker thread
+profiler = FrameProfiler()
@@ -0,0 +1,644 @@
+"""AI opponent for Hangman, built on the pygame-free game core."""
+import hashlib
+import math
+import random
+import time
+from array import array
+from collections import OrderedDict
+
+from hangmanCore import HangmanGame, LETTER_FREQUENCIES
+from openingBook import OpeningBook
+from partitionCache import PartitionCache
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+LETTER_INDEX = {letter: i for i, letter in enumerate(ALPHABET)}
+# Position of each letter in LETTER_FREQUENCIES, for tiebreaks
+FREQUENCY_RANK = {letter: i for i, letter in enumerate(LETTER_FREQUENCIES)}
+
+
+def _bits_from_flags(flags):
+    return int.from_bytes(flags, 'little')
+
+
+def iter_bits(bits):
+    """Yield the positions of the set bits in bits, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class WordBitsets:
+    """Bitset index over a list of words, usually all of one length.
+
+    Word k of the list is bit k of every bitset. contains[l] marks the words
+    containing letter l and positions[i][l] the words with letter l at position
+    i; letter_masks[k] is the 26-bit set of letters in word k.
+    """
+
+    def __init__(self, words):
+        length = max((len(word) for word in words), default=0)
+        self.length = length
+        self.words = words
+        self.all = (1 << len(words)) - 1
+        self.letter_masks = array('I')
+
+        size = (len(words) + 7) // 8
+        contains = [bytearray(size) for _ in ALPHABET]
+        positions = [[bytearray(size) for _ in ALPHABET] for _ in range(length)]
+        for k, word in enumerate(words):
+            byte, bit = k >> 3, 1 << (k & 7)
+            mask = 0
+            for i, c in enumerate(word):
+                letter = LETTER_INDEX.get(c)
+                if letter is None:
+                    continue
+                positions[i][letter][byte] |= bit
+                if not mask & (1 << letter):
+                    mask |= 1 << letter
+                    contains[letter][byte] |= bit
+            self.letter_masks.append(mask)
+
+        self.contains = [_bits_from_flags(flags) for flags in contains]
+        self.positions = [[_bits_from_flags(flags) for flags in row] for row in positions]
+
+    def filter(self, pattern, wrong_letters, candidates=None):
+        """Bitset of words matching the revealed pattern without any wrong letter."""
+        bits = self.all if candidates is None else candidates
+        for letter in wrong_letters:
+            index = LETTER_INDEX.get(letter)
+            if index is not None:
+                bits &= ~self.contains[index]
+        for i, c in enumerate(pattern):
+            if c != '_':
+                index = LETTER_INDEX.get(c)
+                bits &= self.positions[i][index] if index is not None else 0
+        return bits
+
+    def select(self, bits):
+        words = self.words
+        return [words[k] for k in iter_bits(bits)]
+
+    def letter_counts(self, bits, exclude=()):
+        """Occurrences of each letter over the words in bits, skipping exclude."""
+        counts = {}
+        for letter in ALPHABET:
+            if letter in exclude:
+                continue
+            index = LETTER_INDEX[letter]
+            if not bits & self.contains[index]:
+                continue
+            counts[letter] = sum((bits & row[index]).bit_count() for row in self.positions)
+        return counts
+
+    def partition(self, bits, letter):
+        """Split bits into (absent, groups) by where letter appears.
+
+        absent is the bitset of words without the letter and groups holds one
+        bitset per distinct position pattern. Equivalent to partition_words on
+        the selected words, but computed by splitting bitsets on each position
+        plane instead of building lists.
+        """
+        index = LETTER_INDEX[letter]
+        present = bits & self.contains[index]
+        groups = [present] if present else []
+        for row in self.positions:
+            plane = present & row[index]
+            if not plane or plane == present:
+                continue
+            split = []
+            for group in groups:
+                inside = group & plane
+                if inside and inside != group:
+                    split.append(inside)
+                    split.append(group ^ inside)
+                else:
+                    split.append(group)
+            groups = split
+        return bits ^ present, groups
+
+    def partition_sizes(self, bits, letter):
+        """Sizes of the groups of words in bits that share letter's positions."""
+        absent, groups = self.partition(bits, letter)
+        sizes = [group.bit_count() for group in groups]
+        if absent:
+            sizes.append(absent.bit_count())
+        return sizes
+
+    def first_occurrence(self, bits, letter):
+        """(word, position) of the first occurrence of letter when scanning bits in order."""
+        first = bits & self.contains[LETTER_INDEX[letter]]
+        k = (first & -first).bit_length() - 1
+        return k, self.words[k].index(letter)
+
+
+class CandidateIndex:
+    """Per-length bitset buckets over a word list, built once per list.
+
+    words may be a list or a wordStore view; for views the buckets are
+    views too (id arrays into the same store), not copies of the words.
+    """
+
+    def __init__(self, words):
+        by_length = {}
+        for k, word in enumerate(words):
+            by_length.setdefault(len(word), array('I')).append(k)
+        self.words = words
+        view = getattr(words, 'view', None)
+        self.buckets = {length: WordBitsets(view(positions) if view else [words[k] for k in positions])
+                        for length, positions in by_length.items()}
+        self._full = None
+        self._fingerprint = None
+
+    @property
+    def fingerprint(self):
+        """Stable digest of the word list, the same across processes."""
+        if self._fingerprint is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for word in self.words:
+                digest.update(word.encode())
+                digest.update(b'\n')
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def bucket(self, length):
+        bucket = self.buckets.get(length)
+        if bucket is None:
+            bucket = WordBitsets([])
+            self.buckets[length] = bucket
+        return bucket
+
+    @property
+    def full(self):
+        """Bitsets over the whole list in its original order, built on first use."""
+        if self._full is None:
+            self._full = WordBitsets(self.words)
+        return self._full
+
+
+# Min-max decisions shared by every AIGame unless one is passed in
+shared_partition_cache = PartitionCache()
+
+
+def configure_partition_cache(path=None, max_bytes=16 * 1024 * 1024):
+    """Replace the shared cache, loading it from (and saving it to) path if given."""
+    global shared_partition_cache
+    shared_partition_cache = PartitionCache(max_bytes, path)
+    return shared_partition_cache
+
+
+# Opening moves consulted before live search; empty until configured
+shared_opening_book = OpeningBook()
+
+
+def configure_opening_book(path):
+    """Use the opening book at path for every AIGame; it is read on first use."""
+    global shared_opening_book
+    shared_opening_book = OpeningBook(path)
+    return shared_opening_book
+
+
+VOWELS = frozenset('AEIOU')
+
+
+def minimax_choice(bitsets, bits, guessed_letters, correct_letters, letter_frequencies=LETTER_FREQUENCIES):
+    """Pick the unguessed letter whose worst-case partition of bits is smallest.
+
+    Returns (letter, worst_case_size). Ties follow AIGame.min_max_guess: a vowel
+    replaces a consonant while fewer than two vowels are known, and between
+    vowels the more frequent one wins. Letters are scanned alphabetically.
+    """
+    if letter_frequencies is LETTER_FREQUENCIES:
+        rank = FREQUENCY_RANK
+    else:
+        rank = {letter: i for i, letter in enumerate(letter_frequencies)}
+    current_vowels = len(correct_letters & VOWELS)
+    best_letter = None
+    min_max_partition_size = float('inf')
+
+    for letter in ALPHABET:
+        if letter in guessed_letters:
+            continue
+        sizes = bitsets.partition_sizes(bits, letter)
+        max_partition_size = max(sizes) if sizes else 0
+
+        if max_partition_size < min_max_partition_size:
+            min_max_partition_size = max_partition_size
+            best_letter = letter
+        elif max_partition_size == min_max_partition_size:
+            # Tie-breaker: prefer vowels first if we haven't found many yet
+            if letter in VOWELS and ((best_letter not in VOWELS and current_vowels < 2) or
+                                     (best_letter in VOWELS and rank[letter] < rank[best_letter])):
+                best_letter = letter
+
+    if best_letter is None:
+        return None, 0
+    return best_letter, min_max_partition_size
+
+
+# Indexes for recently used word lists, keyed by id(); each entry keeps a
+# reference to its list so the id can't be reused while cached
+_index_cache = OrderedDict()
+INDEX_CACHE_SIZE = 4
+
+
+def get_candidate_index(word_list):
+    """Return the CandidateIndex for word_list, building it on first use.
+
+    Lists are treated as immutable once indexed.
+    """
+    key = id(word_list)
+    entry = _index_cache.get(key)
+    if entry is not None and entry[0] is word_list and entry[1] == len(word_list):
+        _index_cache.move_to_end(key)
+        return entry[2]
+
+    index = CandidateIndex(word_list)
+    _index_cache[key] = (word_list, len(word_list), index)
+    if len(_index_cache) > INDEX_CACHE_SIZE:
+        _index_cache.popitem(last=False)
+    return index
+
+
+class Strategy:
+    """Chooses the AI's next letter from an AIGame's candidates.
+
+    Subclasses implement choose(game); guess(game) wraps it and records the
+    latency of each move so strategies can be compared on CPU cost as well
+    as solve rate. One instance can be shared by many games to aggregate
+    latencies.
+    """
+
+    name = None
+
+    def __init__(self):
+        self.latencies_ms = array('d')
+
+    def guess(self, game):
+        start = time.perf_counter()
+        letter = self.choose(game)
+        self.latencies_ms.append((time.perf_counter() - start) * 1000)
+        return letter
+
+    def choose(self, game):
+        raise NotImplementedError
+
+    def latency_stats(self):
+        """Count, mean, p50, p90, p99 and max of the per-move latencies in milliseconds."""
+        if not self.latencies_ms:
+            return {'moves': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p90_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+        ordered = sorted(self.latencies_ms)
+        count = len(ordered)
+        return {
+            'moves': count,
+            'mean_ms': sum(ordered) / count,
+            'p50_ms': ordered[count // 2],
+            'p90_ms': ordered[min(count - 1, int(count * 0.90))],
+            'p99_ms': ordered[min(count - 1, int(count * 0.99))],
+            'max_ms': ordered[-1],
+        }
+
+    @staticmethod
+    def last_word_letter(game):
+        """With one candidate left, its first unguessed letter; otherwise None."""
+        if game.candidate_count() != 1:
+            return None
+        guessed = game.guessed_letters
+        for c in game.possible_words[0]:
+            if c not in guessed:
+                return c
+        return None
+
+
+class FrequencyStrategy(Strategy):
+    """Guess the letter occurring most often across the candidates."""
+
+    name = 'frequency'
+
+    def choose(self, game):
+        if game.candidates is not None and not game.words_replaced:
+            # Dictionary-based frequency analysis, counted from the bitset index
+            letter_freq = game.bucket.letter_counts(game.candidates, game.guessed_letters)
+            if not letter_freq:
+                return None
+            best = max(letter_freq.values())
+            tied = [letter for letter, count in letter_freq.items() if count == best]
+            # Same tiebreak as the list scan: the letter met first in word order
+            return min(tied, key=lambda letter: game.bucket.first_occurrence(game.candidates, letter))
+
+        letter_freq = {}
+        guessed = game.guessed_letters
+        for word in game.possible_words:
+            for c in word:
+                if c not in guessed:
+                    letter_freq[c] = letter_freq.get(c, 0) + 1
+        if not letter_freq:
+            return None
+        return max(letter_freq, key=letter_freq.get)
+
+
+class MinimaxStrategy(Strategy):
+    """Guess the letter that minimizes the largest remaining partition."""
+
+    name = 'minimax'
+
+    def choose(self, game):
+        return game.min_max_guess()
+
+
+class EntropyStrategy(Strategy):
+    """Guess the letter whose outcome carries the most information.
+
+    Scores each letter by the Shannon entropy of the partition it induces on
+    the candidates; ties go to the letter present in more candidates, then
+    the more frequent English letter.
+    """
+
+    name = 'entropy'
+
+    def choose(self, game):
+        letter = self.last_word_letter(game)
+        if letter is not None:
+            return letter
+        bitsets, bits = game.candidate_bitsets()
+        total = bits.bit_count()
+        if not total:
+            return None
+
+        best_letter, best_key = None, None
+        guessed = game.guessed_letters
+        for letter in game.letter_frequencies:
+            if letter in guessed:
+                continue
+            absent, groups = bitsets.partition(bits, letter)
+            entropy = 0.0
+            for size in [group.bit_count() for group in groups] + [absent.bit_count()]:
+                if size:
+                    p = size / total
+                    entropy -= p * math.log2(p)
+            key = (entropy, total - absent.bit_count())
+            if best_key is None or key > best_key:
+                best_letter, best_key = letter, key
+        return best_letter
+
+
+class ExpectedWrongStrategy(Strategy):
+    """Guess the letter least likely to be wrong.
+
+    Picks the letter present in the most candidates, which minimizes the
+    expected wrong guesses for this move; ties go to the letter with the
+    higher partition entropy, then the more frequent English letter.
+    """
+
+    name = 'expected-wrong'
+
+    def choose(self, game):
+        letter = self.last_word_letter(game)
+        if letter is not None:
+            return letter
+        bitsets, bits = game.candidate_bitsets()
+        total = bits.bit_count()
+        if not total:
+            return None
+
+        best_letter, best_key = None, None
+        guessed = game.guessed_letters
+        for letter in game.letter_frequencies:
+            if letter in guessed:
+                continue
+            present = (bits & bitsets.contains[LETTER_INDEX[letter]]).bit_count()
+            if best_key is not None and present < best_key[0]:
+                continue
+            entropy = 0.0
+            for size in bitsets.partition_sizes(bits, letter):
+                p = size / total
+                entropy -= p * math.log2(p)
+            key = (present, entropy)
+            if best_key is None or key > best_key:
+                best_letter, best_key = letter, key
+        return best_letter
+
+
+class LookaheadStrategy(Strategy):
+    """Depth-limited search minimizing expected wrong guesses.
+
+    Each candidate letter is scored by the expected number of wrong guesses
+    over the next `depth` moves, assuming every candidate word is equally
+    likely and the search keeps playing optimally. Only the `width` letters
+    present in the most candidates are expanded at each level.
+    """
+
+    name = 'lookahead'
+
+    def __init__(self, depth=2, width=6):
+        super().__init__()
+        self.depth = depth
+        self.width = width
+
+    def _letters(self, bitsets, bits, guessed_letters):
+        present = []
+        for letter in ALPHABET:
+            if letter not in guessed_letters:
+                count = (bits & bitsets.contains[LETTER_INDEX[letter]]).bit_count()
+                if count:
+                    present.append((-count, FREQUENCY_RANK[letter], letter))
+        present.sort()
+        return [letter for _, _, letter in present[:self.width]]
+
+    def _expected_wrong(self, bitsets, bits, guessed_letters, depth):
+        total = bits.bit_count()
+        if depth == 0 or total <= 1:
+            return 0.0, None
+        best_letter, best_cost = None, float('inf')
+        for letter in self._letters(bitsets, bits, guessed_letters):
+            absent, groups = bitsets.partition(bits, letter)
+            guessed = guessed_letters | {letter}
+            cost = 0.0
+            if absent:
+                absent_cost, _ = self._expected_wrong(bitsets, absent, guessed, depth - 1)
+                cost += absent.bit_count() / total * (1 + absent_cost)
+            for group in groups:
+                group_cost, _ = self._expected_wrong(bitsets, group, guessed, depth - 1)
+                cost += group.bit_count() / total * group_cost
+            if cost < best_cost:
+                best_letter, best_cost = letter, cost
+        if best_letter is None:
+            # Every letter of the candidates is known (duplicate words)
+            return 0.0, None
+        return best_cost, best_letter
+
+    def choose(self, game):
+        letter = self.last_word_letter(game)
+        if letter is not None:
+            return letter
+        bitsets, bits = game.candidate_bitsets()
+        if not bits:
+            return None
+        _, letter = self._expected_wrong(bitsets, bits, game.guessed_letters, self.depth)
+        return letter
+
+
+STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (FrequencyStrategy, MinimaxStrategy, EntropyStrategy, ExpectedWrongStrategy, LookaheadStrategy)
+}
+
+
+def make_strategy(name, **options):
+    try:
+        return STRATEGIES[name](**options)
+    except KeyError:
+        raise ValueError(f"Unknown AI strategy: {name}") from None
+
+
+class AIGame(HangmanGame):
+    def __init__(self, word_list, word=None, is_user_word=False, partition_cache=None, opening_book=None,
+                 strategy=None, **kwargs):
+        if word:
+            super().__init__(word, **kwargs)
+        else:
+            super().__init__(random.choice(word_list), **kwargs)
+        self.word_list = word_list
+        self.max_attempts = 7
+        self.is_user_word = is_user_word
+        # English letter frequencies (most common to least common)
+        self.letter_frequencies = LETTER_FREQUENCIES
+        # For min-max algorithm
+        self.partition_cache = partition_cache if partition_cache is not None else shared_partition_cache
+        self.opening_book = opening_book if opening_book is not None else shared_opening_book
+        # Min-max for user words, frequency analysis for dictionary words
+        if strategy is None:
+            strategy = MinimaxStrategy() if is_user_word else FrequencyStrategy()
+        self.strategy = strategy
+
+        self.index = get_candidate_index(word_list)
+        self._reset_candidates()
+
+    def _reset_candidates(self):
+        # Candidates are a bitset over bucket and possible_words is only built
+        # when read. Dictionary games use the bucket for the word's length;
+        # user words keep the whole list as candidates for min-max.
+        if self.is_user_word:
+            self.bucket = self.index.full
+            self.candidates = self.bucket.all
+        else:
+            self.bucket = self.index.bucket(len(self.word))
+            self.candidates = None
+        self._possible_words = None
+        self._words_replaced = False
+
+    def load_snapshot(self, data):
+        super().load_snapshot(data)
+        # The next update_possible_words narrows these to the restored pattern
+        self._reset_candidates()
+
+    @property
+    def possible_words(self):
+        if self._possible_words is None:
+            if self.candidates is None:
+                self._possible_words = list(self.word_list)
+            else:
+                self._possible_words = self.bucket.select(self.candidates)
+        return self._possible_words
+
+    @possible_words.setter
+    def possible_words(self, words):
+        self._possible_words = words
+        self._words_replaced = True
+        self.candidates = None
+
+    @property
+    def words_replaced(self):
+        """True once possible_words was assigned directly; the bitset index no longer applies."""
+        return self._words_replaced
+
+    def update_possible_words(self):
+        if self.is_user_word:
+            return  # Don't update possible words for user-entered words
+
+        pattern = self.pattern
+        wrong_letters = self.guessed_letters - self.correct_letters
+        if self._words_replaced:
+            # The list was replaced by hand, filter it directly
+            self._possible_words = [w for w in self._possible_words if len(w) == len(self.word)
+                                    and all((c == '_' or w[i] == c) for i, c in enumerate(pattern))
+                                    and not any(c in wrong_letters for c in w)]
+            return
+        self.candidates = self.bucket.filter(pattern, wrong_letters, self.candidates)
+        self._possible_words = None
+
+    def get_word_pattern(self, word, guessed_letters):
+        """Get the pattern of a word based on guessed letters"""
+        return ''.join([c if c in guessed_letters else '_' for c in word])
+
+    def partition_words(self, words, letter):
+        """Partition words into groups based on where the letter appears"""
+        partitions = {}
+        for word in words:
+            pattern = tuple(i for i, c in enumerate(word) if c == letter)
+            if pattern not in partitions:
+                partitions[pattern] = []
+            partitions[pattern].append(word)
+        return partitions
+
+    def candidate_bitsets(self):
+        """(bitsets, bits) describing possible_words for the bitset engines."""
+        if self._words_replaced:
+            bitsets = WordBitsets(self._possible_words)
+            return bitsets, bitsets.all
+        if self.candidates is None:
+            return self.index.full, self.index.full.all
+        return self.bucket, self.candidates
+
+    def candidate_count(self):
+        if self._words_replaced or self._possible_words is not None:
+            return len(self._possible_words)
+        if self.candidates is None:
+            return len(self.word_list)
+        return self.candidates.bit_count()
+
+    def min_max_guess(self):
+        """Choose the letter that minimizes the maximum partition size"""
+        if self.candidate_count() == 1:
+            # If only one word left, guess its letters in order
+            remaining_letters = [c for c in self.possible_words[0] if c not in self.guessed_letters]
+            if remaining_letters:
+                return remaining_letters[0]
+            return None
+
+        bitsets, bits = self.candidate_bitsets()
+        key = None
+        if not self._words_replaced:
+            # Pattern and guesses determine the candidates within a word list
+            scope = 'minimax:full' if bitsets is self.index.full else 'minimax'
+            pattern = self.pattern
+            key = PartitionCache.make_key(self.index.fingerprint, scope, pattern, self.guessed_letters)
+            cached = self.partition_cache.get(key)
+            if cached is not None:
+                return cached[0]
+
+        best_letter, worst_case = minimax_choice(bitsets, bits, self.guessed_letters, self.correct_letters,
+                                                 self.letter_frequencies)
+        if key is not None:
+            self.partition_cache.put(key, best_letter, worst_case, bits.bit_count())
+        return best_letter
+
+    def book_move(self):
+        """The opening book's letter for this position, if it has one."""
+        if self._words_replaced or (self.candidates is None and not self.is_user_word):
+            # Book positions assume update_possible_words has filtered the list
+            return None
+        return self.opening_book.lookup(self.index.fingerprint, self.strategy.name, self.pattern,
+                                        self.guessed_letters)
+
+    def ai_guess(self):
+        letter = self.book_move()
+        if letter is not None:
+            return letter
+        return self.strategy.guess(self)
+
+
+def ai_guesser(game):
+    """Headless guesser for hangmanCore.play: narrow the candidates, then guess."""
+    game.update_possible_words()
+    return game.ai_guess()
@@ -0,0 +1,443 @@
+"""Game state for Hangman with no pygame dependency.
+
+HangmanGame holds the rules and scoring. Time comes from an injectable clock
+(a callable returning milliseconds) and sound/UI reactions go through an
+optional event sink, so the same game runs under the pygame UI, in tests and
+in the headless driver at the bottom of this module.
+
+Headless usage:
+    python hangmanCore.py --games 100000
+"""
+import argparse
+import functools
+import random
+import struct
+import time
+
+
+def load_words(filename):
+    categories = {}
+    current_category = None
+    current_difficulty = None
+
+    with open(filename, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+
+            if line.startswith('[') and line.endswith(']'):
+                try:
+                    if ':' in line[1:-1]:
+                        category, difficulty = line[1:-1].split(':')
+                        current_category = category
+                        current_difficulty = difficulty
+                        if current_category not in categories:
+                            categories[current_category] = {'EASY': [], 'MEDIUM': [], 'HARD': []}
+                    else:
+                        current_category = line[1:-1]
+                        current_difficulty = None
+                        if current_category not in categories:
+                            categories[current_category] = []
+                except ValueError:
+                    print(f"Warning: Skipping invalid category line: {line}")
+                    continue
+            elif current_category is not None:
+                if current_difficulty is not None:
+                    categories[current_category][current_difficulty].append(line.upper())
+                else:
+                    categories[current_category].append(line.upper())
+
+    return categories
+
+
+def load_words_with_hints(filename):
+    categories = {}
+    current_category = None
+
+    with open(filename, 'r') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if line.startswith('[') and line.endswith(']'):
+                current_category = line[1:-1]
+                categories[current_category] = {}
+            elif ':' in line:
+                word, hint = line.split(':', 1)
+                categories[current_category][word.upper()] = hint.strip()
+
+    return categories
+
+
+def flatten_words(categories):
+    """Combine all words from all categories and difficulties into one list."""
+    all_words = []
+    for category_data in categories.values():
+        if isinstance(category_data, dict):
+            for difficulty_words in category_data.values():
+                all_words.extend(difficulty_words)
+        else:
+            all_words.extend(category_data)
+    return all_words
+
+
+def system_clock():
+    """Milliseconds from a monotonic clock, the default game clock."""
+    return int(time.monotonic() * 1000)
+
+
+class ManualClock:
+    """Clock that only moves when advanced, for deterministic headless runs."""
+
+    def __init__(self, start=0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms
+
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ALPHABET)}
+# Set in a word's mask when it has characters outside A-Z, which can never
+# be guessed, so the word can never be completed
+UNGUESSABLE_BIT = 1 << 26
+
+
+def is_letters(text):
+    """True if text is non-empty and only letters A-Z (either case)."""
+    return text.isascii() and text.isalpha()
+
+
+def letter_mask(letters):
+    mask = 0
+    for letter in letters:
+        mask |= LETTER_BITS.get(letter, UNGUESSABLE_BIT)
+    return mask
+
+
+@functools.lru_cache(maxsize=4096)
+def letters_of(mask):
+    """The frozenset of letters whose bits are set in mask."""
+    return frozenset(letter for letter, bit in LETTER_BITS.items() if mask & bit)
+
+
+class _RevealTable(dict):
+    # str.translate table: revealed letters map to themselves, anything else to '_'
+    def __missing__(self, key):
+        return '_'
+
+
+@functools.lru_cache(maxsize=4096)
+def reveal_table(mask):
+    return _RevealTable((ord(letter), letter) for letter in letters_of(mask & ~UNGUESSABLE_BIT))
+
+
+DIFFICULTY_CODES = (None, 'EASY', 'MEDIUM', 'HARD', 'EXPERT')
+SNAPSHOT_VERSION = 1
+SNAPSHOT_WORD_BYTES = 16
+# version, word, difficulty, guessed mask, correct mask, wrong guesses,
+# max attempts, score, hints used, streak, max streak, consecutive wrong,
+# ms since start, game time
+SNAPSHOT = struct.Struct(f'<B{SNAPSHOT_WORD_BYTES}sBIIBBiBBBBII')
+
+
+class HangmanGame:
+    """One game's state.
+
+    Guessed and correct letters are 26-bit masks (bit 0 is A);
+    guessed_letters and correct_letters are frozenset views of them. The
+    revealed pattern ('C_T'), its spaced display form and the number of
+    hidden positions are updated by guess_letter, so reading them, and
+    checking for a win, doesn't rescan the word. The play state fits in a
+    fixed-size snapshot() that restore() or load_snapshot() reads back.
+    """
+
+    __slots__ = ('_word', 'word_mask', 'pattern', 'display', 'hidden_count', 'category', 'difficulty', 'hint',
+                 'clock', 'on_event', 'guessed_mask', 'correct_mask', 'wrong_guesses', 'max_attempts', 'score',
+                 'hints_used', 'start_time', 'game_time', 'current_streak', 'max_streak', 'consecutive_wrong')
+
+    def __init__(self, word, category=None, difficulty=None, hint=None, clock=system_clock, on_event=None):
+        self.guessed_mask = 0
+        self.correct_mask = 0
+        self.word = word
+        self.category = category
+        self.difficulty = difficulty
+        self.hint = hint
+        # clock() returns milliseconds; on_event(name, game) receives
+        # 'correct' and 'incorrect' after each guess
+        self.clock = clock
+        self.on_event = on_event
+        self.wrong_guesses = 0
+        self.max_attempts = 7
+        self.score = 0
+        self.hints_used = 0
+        self.start_time = clock()
+        self.game_time = 0
+        self.current_streak = 0
+        self.max_streak = 0
+        self.consecutive_wrong = 0
+
+    @property
+    def word(self):
+        return self._word
+
+    @word.setter
+    def word(self, word):
+        self._word = word.upper()
+        self.word_mask = letter_mask(self._word)
+        self.update_pattern()
+
+    def update_pattern(self):
+        """Recompute pattern, display and hidden_count from correct_mask."""
+        self.pattern = self._word.translate(reveal_table(self.correct_mask))
+        self.display = ' '.join(self.pattern)
+        self.hidden_count = self.pattern.count('_')
+
+    @property
+    def guessed_letters(self):
+        return letters_of(self.guessed_mask)
+
+    @property
+    def correct_letters(self):
+        return letters_of(self.correct_mask)
+
+    def get_difficulty_bonus(self):
+        return {
+            'EASY': 8,
+            'MEDIUM': 12,
+            'HARD': 18,
+            'EXPERT': 25
+        }.get(self.difficulty, 8)  # Default to EASY if difficulty not set
+
+    def get_time_played(self):
+        if self.game_time:
+            return self.game_time
+        return (self.clock() - self.start_time) // 1000
+
+    def emit(self, event):
+        if self.on_event is not None:
+            self.on_event(event, self)
+
+    def guess_letter(self, letter):
+        bit = LETTER_BITS.get(letter.upper())
+        if bit is None:
+            raise ValueError(f"not a letter A-Z: {letter!r}")
+        if self.guessed_mask & bit:
+            return 'already_guessed'
+
+        self.guessed_mask |= bit
+        if self.word_mask & bit:
+            self.correct_mask |= bit
+            self.update_pattern()
+            self.current_streak += 1
+            self.max_streak = max(self.max_streak, self.current_streak)
+            self.consecutive_wrong = 0
+            # Base points + streak bonus
+            self.score += self.get_difficulty_bonus() + (self.current_streak * 5)
+            self.emit('correct')
+            return 'correct'
+        else:
+            self.wrong_guesses += 1
+            self.current_streak = 0
+            self.consecutive_wrong += 1
+            # Penalty for wrong guesses
+            self.score -= (5 + (self.consecutive_wrong * 2))
+            self.emit('incorrect')
+            return 'incorrect'
+
+    def score_breakdown(self):
+        """The components calculate_final_score adds up, and the total."""
+        components = {
+            'base_score': self.score,
+            'time_bonus': max(0, 100 - self.get_time_played()) // 10,
+            'attempts_bonus': (self.max_attempts - self.wrong_guesses) * 10,
+            'word_length_bonus': len(self.word) * 2,
+            'no_hint_bonus': 50 if self.hints_used == 0 else 0,
+            'perfect_bonus': 100 if self.wrong_guesses == 0 else 0,
+        }
+        components['final_score'] = sum(components.values())
+        return components
+
+    def calculate_final_score(self):
+        return self.score_breakdown()['final_score']
+
+    def get_display_word(self):
+        return self.display
+
+    def is_word_guessed(self):
+        return self.hidden_count == 0
+
+    def is_lost(self):
+        return self.wrong_guesses >= self.max_attempts
+
+    def is_over(self):
+        return self.is_lost() or self.is_word_guessed()
+
+    def use_hint(self):
+        if self.hints_used < 2 and self.score >= 25:
+            self.hints_used += 1
+            self.score -= 25
+
+            # Special handling for RANDOM category
+            if self.category == 'RANDOM':
+                disclaimer = "WARNING: For RANDOM category, hints may be incorrect!"
+
+                if random.randint(0, 1) == 0:
+                    unguessed = [c for c in self.word if not self.guessed_mask & LETTER_BITS.get(c, 0)]
+                    if unguessed:
+                        return disclaimer + "\nHint: Letter '" + random.choice(unguessed) + "' is in the word"
+                else:
+                    random_letter = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+                    return disclaimer + "\nHint: Letter '" + random_letter + "' might be in the word"
+
+            # Normal hint handling for other categories
+            if self.hint:
+                return self.hint
+            return f"This is a {self.category.lower()} with {len(self.word)} letters"
+        return None
+
+    def reset_game(self):
+        self.guessed_mask = 0
+        self.correct_mask = 0
+        self.update_pattern()
+        self.wrong_guesses = 0
+        self.score = 0
+        self.hints_used = 0
+        self.start_time = self.clock()
+        self.game_time = 0
+        self.current_streak = 0
+        self.consecutive_wrong = 0
+
+    def snapshot(self):
+        """The play state as SNAPSHOT.size bytes.
+
+        category, hint, clock and on_event are not included; pass them to
+        restore(), or load_snapshot() keeps the game's own. Words longer
+        than SNAPSHOT_WORD_BYTES can't be saved.
+        """
+        word = self._word.encode('ascii')
+        if len(word) > SNAPSHOT_WORD_BYTES:
+            raise ValueError(f"word longer than {SNAPSHOT_WORD_BYTES} letters")
+        try:
+            difficulty = DIFFICULTY_CODES.index(self.difficulty)
+        except ValueError:
+            raise ValueError(f"unknown difficulty {self.difficulty!r}") from None
+        return SNAPSHOT.pack(SNAPSHOT_VERSION, word, difficulty, self.guessed_mask, self.correct_mask,
+                             self.wrong_guesses, self.max_attempts, self.score, self.hints_used,
+                             self.current_streak, self.max_streak, self.consecutive_wrong,
+                             self.clock() - self.start_time, self.game_time)
+
+    def load_snapshot(self, data):
+        """Put this game in the state snapshot() saved; the time played carries over to self.clock.
+
+        category, hint, clock and on_event are left as they are. Subclasses
+        that keep state derived from the word extend this to rebuild it.
+        """
+        (version, word, difficulty, guessed_mask, correct_mask, wrong_guesses, max_attempts, score, hints_used,
+         current_streak, max_streak, consecutive_wrong, elapsed, game_time) = SNAPSHOT.unpack(data)
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported snapshot version {version}")
+        if difficulty >= len(DIFFICULTY_CODES):
+            raise ValueError(f"unknown difficulty code {difficulty}")
+        self.guessed_mask = guessed_mask
+        self.correct_mask = correct_mask
+        self.word = word.rstrip(b'\0').decode('ascii')
+        self.difficulty = DIFFICULTY_CODES[difficulty]
+        self.wrong_guesses = wrong_guesses
+        self.max_attempts = max_attempts
+        self.score = score
+        self.hints_used = hints_used
+        self.current_streak = current_streak
+        self.max_streak = max_streak
+        self.consecutive_wrong = consecutive_wrong
+        self.start_time = self.clock() - elapsed
+        self.game_time = game_time
+
+    @classmethod
+    def restore(cls, data, category=None, hint=None, clock=system_clock, on_event=None):
+        """A new game in the state snapshot() saved; the time played carries over to clock.
+
+        Only for this class: subclasses take other constructor arguments, so
+        build one of those as usual and call its load_snapshot().
+        """
+        if cls is not HangmanGame:
+            raise TypeError(f"{cls.__name__}.restore() is not supported; build the game and call load_snapshot()")
+        game = cls('', category, None, hint, clock=clock, on_event=on_event)
+        game.load_snapshot(data)
+        return game
+
+
+# English letter frequencies (most common to least common)
+LETTER_FREQUENCIES = ['E', 'A', 'R', 'I', 'O', 'T', 'N', 'S', 'L', 'C',
+                      'U', 'D', 'P', 'M', 'H', 'G', 'B', 'F', 'Y', 'W',
+                      'K', 'V', 'X', 'Z', 'J', 'Q']
+
+
+def frequency_guesser(game):
+    """Guess the most common English letter not tried yet."""
+    guessed = game.guessed_mask
+    for letter in LETTER_FREQUENCIES:
+        if not guessed & LETTER_BITS[letter]:
+            return letter
+    return None
+
+
+def play(game, guesser):
+    """Drive game to the end with guesser(game) -> letter or None.
+
+    Stops early if the guesser has nothing left to try. Returns the game.
+    """
+    while not game.is_over():
+        letter = guesser(game)
+        if letter is None:
+            break
+        game.guess_letter(letter)
+    game.game_time = game.get_time_played()
+    return game
+
+
+def simulate(words, guesser, games, seed=None, clock=None):
+    """Play games headless games on random words and return summary counts."""
+    rng = random.Random(seed)
+    clock = clock or ManualClock()
+    wins = 0
+    total_guesses = 0
+    total_wrong = 0
+    for _ in range(games):
+        game = play(HangmanGame(rng.choice(words), clock=clock), guesser)
+        if game.is_word_guessed():
+            wins += 1
+        total_guesses += len(game.guessed_letters)
+        total_wrong += game.wrong_guesses
+    return {
+        'games': games,
+        'wins': wins,
+        'mean_guesses': total_guesses / games if games else 0.0,
+        'mean_wrong': total_wrong / games if games else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Hangman games headless and report throughput.")
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--words', default='words.txt')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    words = flatten_words(load_words(args.words))
+    start = time.perf_counter()
+    summary = simulate(words, frequency_guesser, args.games, args.seed)
+    elapsed = time.perf_counter() - start
+
+    print(f"Games: {summary['games']}  Wins: {summary['wins']}  "
+          f"Mean guesses: {summary['mean_guesses']:.2f}  Mean wrong: {summary['mean_wrong']:.2f}")
+    print(f"Elapsed: {elapsed:.2f}s  ({summary['games'] / elapsed * 60:,.0f} games/minute)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,90 @@
 import pygame
 import random
 import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import messagebox, Toplevel
 from pygame.locals import *
 
-# Initialize Pygame
-pygame.init()
-pygame.mixer.init()  # Initializes sound
-screen = pygame.display.set_mode((1280, 920))  
-pygame.display.set_caption("Hangman Game")
-clock = pygame.time.Clock()
-font = pygame.font.Font(None, 36)
-small_font = pygame.font.Font(None, 28)
-title_font = pygame.font.Font(None, 48)
+import audioManager
+import hangmanCore
+import hangmanAI
+import frameProfiler
+import scoreStore
+import wordRepository
+import wordScheduler
+from hangmanAI import AIGame
+
+# Display, fonts and sounds are created by init_display() so that importing
+# this module doesn't open a window
+screen = None
+
+# Fonts keyed by (face, size); pygame.font.Font is expensive to construct
+_fonts = {}
+
+
+def get_font(size, face=None):
+    key = (face, size)
+    cached_font = _fonts.get(key)
+    if cached_font is None:
+        cached_font = pygame.font.Font(face, size)
+        _fonts[key] = cached_font
+    return cached_font
+
+
+class TextCache:
+    """LRU cache of rendered text surfaces keyed by (text, color, font, antialias)."""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, aa, color):
+        key = (text, tuple(color), font, bool(aa))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, aa, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+        return surface
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.surfaces),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        self.surfaces.clear()
+        self.hits = self.misses = self.evictions = 0
+
+
+text_cache = TextCache()
+
+
+def render_text(font, text, aa, color):
+    return text_cache.render(font, text, aa, color)
+
+
+font = None
+small_font = None
+title_font = None
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -30,233 +101,83 @@ AI_MODE = 1
 SINGLE_PLAYER = 2
 MULTIPLAYER = 3
 
-#sound files
-try:
-    correct_sound = pygame.mixer.Sound("correct.wav")
-    wrong_sound = pygame.mixer.Sound("wrong.wav")
-    win_sound = pygame.mixer.Sound("win.wav")
-    lose_sound = pygame.mixer.Sound("lose.wav")
-except:
-    # If sound files are not found, create dummy sound objects
-    correct_sound = wrong_sound = win_sound = lose_sound = type('DummySound', (), {'play': lambda: None})()
-
-
-def load_words(filename):
-    categories = {}
-    current_category = None
-    current_difficulty = None
-    
-    with open(filename, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith('[') and line.endswith(']'):
-                try:
-                    if ':' in line[1:-1]:
-                        category, difficulty = line[1:-1].split(':')
-                        current_category = category
-                        current_difficulty = difficulty
-                        if current_category not in categories:
-                            categories[current_category] = {'EASY': [], 'MEDIUM': [], 'HARD': []}
-                    else:
-                        current_category = line[1:-1]
-                        current_difficulty = None
-                        if current_category not in categories:
-                            categories[current_category] = []
-                except ValueError:
-                    print(f"Warning: Skipping invalid category line: {line}")
-                    continue
-            elif current_category is not None:
-                if current_difficulty is not None:
-                    categories[current_category][current_difficulty].append(line.upper())
-                else:
-                    categories[current_category].append(line.upper())
-    
-    return categories
-
-
-def load_words_with_hints(filename):
-    categories = {}
-    current_category = None
-    
-    with open(filename, 'r') as file:
-        for line in file:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-                
-            if line.startswith('[') and line.endswith(']'):
-                current_category = line[1:-1]
-                categories[current_category] = {}
-            elif ':' in line:
-                word, hint = line.split(':', 1)
-                categories[current_category][word.upper()] = hint.strip()
-    
-    return categories
-
+# Loaded in the background by init_display(); plays nothing until then
+audio = audioManager.AudioManager({
+    'correct': "correct.wav",
+    'wrong': "wrong.wav",
+    'win': "win.wav",
+    'lose': "lose.wav",
+})
+
+
+def init_display():
+    global screen, font, small_font, title_font
+    # Not pygame.init(), which would open the audio device right here; the
+    # mixer is left to the AudioManager's loader thread
+    pygame.display.init()
+    pygame.font.init()
+    # Starts the timer behind pygame.time.get_ticks(), the games' clock
+    pygame.time.wait(0)
+    screen = pygame.display.set_mode((1280, 920))
+    pygame.display.set_caption("Hangman Game")
+    font = get_font(36)
+    small_font = get_font(28)
+    title_font = get_font(48)
+    audio.start()
+    return screen
+
+
+def play_game_sound(event, game):
+    """Event sink that gives guesses audio feedback."""
+    if event == 'correct':
+        audio.play('correct')
+    elif event == 'incorrect':
+        audio.play('wrong')
+
+
+class HangmanGame(hangmanCore.HangmanGame):
+    """HangmanGame wired to the pygame clock and sound effects."""
 
-class HangmanGame:
     def __init__(self, word, category=None, difficulty=None, hint=None):
-        self.word = word.upper()
-        self.category = category
-        self.difficulty = difficulty
-        self.hint = hint
-        self.guessed_letters = set()
-        self.correct_letters = set()
-        self.wrong_guesses = 0
-        self.max_attempts = 7
-        self.score = 0
-        self.hints_used = 0
-        self.start_time = pygame.time.get_ticks()
-        self.game_time = 0
-        self.current_streak = 0
-        self.max_streak = 0
-        self.consecutive_wrong = 0
-
-    def get_difficulty_bonus(self):
-        return {
-            'EASY': 8,
-            'MEDIUM': 12,
-            'HARD': 18,
-            'EXPERT': 25
-        }.get(self.difficulty, 8)  # Default to EASY if difficulty not set
-
-    def get_time_played(self):
-        if self.game_time:
-            return self.game_time
-        return (pygame.time.get_ticks() - self.start_time) // 1000
-
-    def guess_letter(self, letter):
-        letter = letter.upper()
-        if letter in self.guessed_letters:
-            return 'already_guessed'
-            
-        self.guessed_letters.add(letter)
-        if letter in self.word:
-            self.correct_letters.add(letter)
-            self.current_streak += 1
-            self.max_streak = max(self.max_streak, self.current_streak)
-            self.consecutive_wrong = 0
-            # Base points + streak bonus
-            self.score += self.get_difficulty_bonus() + (self.current_streak * 5)
-            correct_sound.play()
-            return 'correct'
-        else:
-            self.wrong_guesses += 1
-            self.current_streak = 0
-            self.consecutive_wrong += 1
-            # Penalty for wrong guesses
-            self.score -= (5 + (self.consecutive_wrong * 2))
-            wrong_sound.play()
-            return 'incorrect'
-
-    def calculate_final_score(self):
-        # Base score from gameplay
-        final_score = self.score
-        
-        # Time bonus (faster = more points)
-        time_bonus = max(0, 100 - self.get_time_played()) // 10
-        final_score += time_bonus
-        
-        # Remaining attempts bonus
-        attempts_bonus = (self.max_attempts - self.wrong_guesses) * 10
-        final_score += attempts_bonus
-        
-        # Word length bonus
-        length_bonus = len(self.word) * 2
-        final_score += length_bonus
-        
-        # Special bonuses
-        if self.hints_used == 0:
-            final_score += 50  # No-hint bonus
-            
-        if self.wrong_guesses == 0:
-            final_score += 100  # Perfect game bonus
-            
-        return final_score
-
-    def get_display_word(self):
-        return ' '.join([char if char in self.correct_letters else '_' for char in self.word])
-
-    def is_word_guessed(self):
-        return all(char in self.correct_letters for char in self.word)
-
-    def use_hint(self):
-        if self.hints_used < 2 and self.score >= 25:  
-            self.hints_used += 1
-            self.score -= 25  
-            
-            # Special handling for RANDOM category
-            if self.category == 'RANDOM':
-                disclaimer = "WARNING: For RANDOM category, hints may be incorrect!"
-                
-                if random.randint(0, 1) == 0:
-                    unguessed = [c for c in self.word if c not in self.guessed_letters]
-                    if unguessed:
-                        return disclaimer + "\nHint: Letter '" + random.choice(unguessed) + "' is in the word"
-                else:
-                    random_letter = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
-                    return disclaimer + "\nHint: Letter '" + random_letter + "' might be in the word"
-                
-            # Normal hint handling for other categories
-            if self.hint:
-                return self.hint
-            return f"This is a {self.category.lower()} with {len(self.word)} letters"
-        return None
+        super().__init__(word, category, difficulty, hint,
+                         clock=pygame.time.get_ticks, on_event=play_game_sound)
 
     def show_continue_screen(self, screen):
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = event.pos
-                    # Continue button area (centered)
-                    continue_btn = pygame.Rect(490, 400, 300, 50)
-                    exit_btn = pygame.Rect(490, 470, 300, 50)
-                    if continue_btn.collidepoint(mouse_pos):
-                        return True  # User wants to continue
-                    if exit_btn.collidepoint(mouse_pos):
-                        return False  # User wants to exit
-
             screen.fill(WHITE)
             # Draw continue message
-            continue_text = title_font.render("Continue to iterate?", True, BLACK)
+            continue_text = render_text(title_font, "Continue to iterate?", True, BLACK)
             screen.blit(continue_text, (440, 300))
 
             # Draw continue button
             pygame.draw.rect(screen, GREEN, (490, 400, 300, 50))
-            continue_btn_text = font.render("Continue", True, BLACK)
+            continue_btn_text = render_text(font, "Continue", True, BLACK)
             screen.blit(continue_btn_text, (580, 410))
 
             # Draw exit button
             pygame.draw.rect(screen, RED, (490, 470, 300, 50))
-            exit_btn_text = font.render("Exit", True, BLACK)
+            exit_btn_text = render_text(font, "Exit", True, BLACK)
             screen.blit(exit_btn_text, (600, 480))
 
             pygame.display.flip()
-            clock.tick(60)
-
-    def reset_game(self):
-        self.guessed_letters.clear()
-        self.correct_letters.clear()
-        self.wrong_guesses = 0
-        self.score = 0
-        self.hints_used = 0
-        self.start_time = pygame.time.get_ticks()
-        self.game_time = 0
-        self.current_streak = 0
-        self.consecutive_wrong = 0
+
+            for event in event_loop.wait():
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    mouse_pos = event.pos
+                    # Continue button area (centered)
+                    continue_btn = pygame.Rect(490, 400, 300, 50)
+                    exit_btn = pygame.Rect(490, 470, 300, 50)
+                    if continue_btn.collidepoint(mouse_pos):
+                        return True  # User wants to continue
+                    if exit_btn.collidepoint(mouse_pos):
+                        return False  # User wants to exit
 
     def check_game_end(self, screen):
         if self.is_word_guessed() or self.wrong_guesses >= self.max_attempts:
             if self.is_word_guessed():
-                win_sound.play()
+                audio.play('win')
             else:
-                lose_sound.play()
+                audio.play('lose')
             
             # Calculate final score
             final_score = self.calculate_final_score()
@@ -287,12 +208,12 @@ class HangmanGame:
                                      (hard_button, "Hard", (290, 55))]:
                     color = (100, 200, 100) if difficulty == text else (150, 150, 150)
                     pygame.draw.rect(screen, color, btn)
-                    diff_text = small_font.render(text, True, BLACK)
+                    diff_text = render_text(small_font, text, True, BLACK)
                     screen.blit(diff_text, pos)
                 
                 # Display current hint if available
                 if current_hint:
-                    hint_text = small_font.render(f"Hint: {current_hint}", True, (200, 200, 100))
+                    hint_text = render_text(small_font, f"Hint: {current_hint}", True, (200, 200, 100))
                     screen.blit(hint_text, (400, 100))
                 
                 # Handle difficulty selection
@@ -310,10 +231,10 @@ class HangmanGame:
                 max_mistakes = {"Easy": 8, "Medium": 6, "Hard": 4}[difficulty]
                 if mistakes >= max_mistakes:
                     game_active = False
-                    lose_sound.play()
+                    audio.play('lose')
             else:
                 # Display "Continue to iterate?" prompt
-                continue_text = font.render("Continue to iterate?", True, BLACK)
+                continue_text = render_text(font, "Continue to iterate?", True, BLACK)
                 yes_button = pygame.Rect(300, 350, 80, 40)
                 no_button = pygame.Rect(400, 350, 80, 40)
                 
@@ -322,8 +243,8 @@ class HangmanGame:
                 pygame.draw.rect(screen, (200, 100, 100), no_button)
                 
                 # Draw button text
-                yes_text = small_font.render("Yes", True, BLACK)
-                no_text = small_font.render("No", True, BLACK)
+                yes_text = render_text(small_font, "Yes", True, BLACK)
+                no_text = render_text(small_font, "No", True, BLACK)
                 screen.blit(continue_text, (250, 300))
                 screen.blit(yes_text, (320, 360))
                 screen.blit(no_text, (425, 360))
@@ -335,7 +256,7 @@ class HangmanGame:
                         if yes_button.collidepoint(mouse_pos):
                             # Reset game state
                             self.word = random.choice(self.words)
-                            self.guessed_letters.clear()
+                            self.reset_game()
                             mistakes = 0
                             game_active = True
                             current_hint = None
@@ -343,94 +264,6 @@ class HangmanGame:
                             running = False
 
 
-class AIGame(HangmanGame):
-    def __init__(self, word_list, word=None, is_user_word=False):
-        if word:
-            super().__init__(word)
-        else:
-            super().__init__(random.choice(word_list))
-        self.word_list = word_list
-        self.possible_words = word_list.copy()
-        self.max_attempts = 7
-        self.is_user_word = is_user_word
-        # English letter frequencies (most common to least common)
-        self.letter_frequencies = ['E', 'A', 'R', 'I', 'O', 'T', 'N', 'S', 'L', 'C', 
-                                 'U', 'D', 'P', 'M', 'H', 'G', 'B', 'F', 'Y', 'W', 
-                                 'K', 'V', 'X', 'Z', 'J', 'Q']
-        # For min-max algorithm
-        self.partition_cache = {}
-
-    def update_possible_words(self):
-        if self.is_user_word:
-            return  # Don't update possible words for user-entered words
-            
-        pattern = self.get_display_word().replace(' ', '')
-        self.possible_words = [w for w in self.possible_words if len(w) == len(self.word)]
-        self.possible_words = [w for w in self.possible_words if all((c == '_' or w[i] == c)
-                                                                     for i, c in enumerate(pattern))]
-        wrong_letters = self.guessed_letters - self.correct_letters
-        self.possible_words = [w for w in self.possible_words if not any(c in wrong_letters for c in w)]
-
-    def get_word_pattern(self, word, guessed_letters):
-        """Get the pattern of a word based on guessed letters"""
-        return ''.join([c if c in guessed_letters else '_' for c in word])
-
-    def partition_words(self, words, letter):
-        """Partition words into groups based on where the letter appears"""
-        partitions = {}
-        for word in words:
-            pattern = tuple(i for i, c in enumerate(word) if c == letter)
-            if pattern not in partitions:
-                partitions[pattern] = []
-            partitions[pattern].append(word)
-        return partitions
-
-    def min_max_guess(self):
-        """Choose the letter that minimizes the maximum partition size"""
-        if len(self.possible_words) == 1:
-            # If only one word left, guess its letters in order
-            remaining_letters = [c for c in self.possible_words[0] if c not in self.guessed_letters]
-            if remaining_letters:
-                return remaining_letters[0]
-            return None
-
-        unguessed_letters = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ') - self.guessed_letters
-        best_letter = None
-        min_max_partition_size = float('inf')
-
-        for letter in unguessed_letters:
-            partitions = self.partition_words(self.possible_words, letter)
-            max_partition_size = max(len(words) for words in partitions.values()) if partitions else 0
-            
-            if max_partition_size < min_max_partition_size:
-                min_max_partition_size = max_partition_size
-                best_letter = letter
-            elif max_partition_size == min_max_partition_size:
-                # Tie-breaker: prefer vowels first if we haven't found many yet
-                vowels = {'A', 'E', 'I', 'O', 'U'}
-                current_vowels = len(self.correct_letters & vowels)
-                if (letter in vowels and best_letter not in vowels and current_vowels < 2) or \
-                   (letter in vowels and best_letter in vowels and self.letter_frequencies.index(letter) < self.letter_frequencies.index(best_letter)):
-                    best_letter = letter
-
-        return best_letter
-
-    def ai_guess(self):
-        if self.is_user_word:
-            # Use min-max algorithm for user-entered words
-            return self.min_max_guess()
-        else:
-            # Use dictionary-based frequency analysis for AI-selected words
-            letter_freq = {}
-            for word in self.possible_words:
-                for c in word:
-                    if c not in self.guessed_letters:
-                        letter_freq[c] = letter_freq.get(c, 0) + 1
-            if not letter_freq:
-                return None
-            return max(letter_freq, key=letter_freq.get)
-
-
 def draw_hangman(screen, wrong_guesses):
     # For the gallows
     pygame.draw.line(screen, BLACK, (100, 500), (300, 500), 5)
@@ -452,31 +285,339 @@ def draw_hangman(screen, wrong_guesses):
         if i < len(parts):
             parts[i]()
 
+    return HANGMAN_RECT
+
 
-def draw_text(surface, text, color, rect, font=font, aa=False):
-    text_surf = font.render(text, aa, color)
+# Bounding box of everything draw_hangman can touch
+HANGMAN_RECT = pygame.Rect(90, 90, 320, 420)
+
+
+def draw_text(surface, text, color, rect, font=None, aa=False):
+    if font is None:
+        font = get_font(36)
+    text_surf = render_text(font, text, aa, color)
     text_rect = text_surf.get_rect(center=rect.center)
     surface.blit(text_surf, text_rect)
+    return text_rect
 
 
-def draw_background(surface):
+def blit_text(surface, text, color, pos, font=None, aa=True):
+    if font is None:
+        font = get_font(36)
+    text_surf = render_text(font, text, aa, color)
+    return surface.blit(text_surf, pos)
+
+
+def draw_outline_button(surface, rect, text, color, font=None):
+    if font is None:
+        font = get_font(28)
+    pygame.draw.rect(surface, color, rect, 2)
+    return rect.union(draw_text(surface, text, color, rect, font))
+
+
+def draw_filled_button(surface, rect, text, fill, border, text_color=WHITE, font=None, border_radius=10):
+    pygame.draw.rect(surface, fill, rect, border_radius=border_radius)
+    pygame.draw.rect(surface, border, rect, 2, border_radius=border_radius)
+    return rect.union(draw_text(surface, text, text_color, rect, font))
+
+
+def draw_boxed_text(surface, rect, text, color, font=None):
+    pygame.draw.rect(surface, BLACK, rect, 2)
+    return rect.union(draw_text(surface, text, color, rect, font))
+
+
+def draw_guessed_letters(surface, pos, label, guessed_letters, correct_letters, font=None, spacing=None):
+    """Draw the label followed by guessed letters, green if correct and red if wrong.
+
+    With spacing=None letters are packed by their rendered width plus 5 pixels,
+    otherwise they are placed spacing pixels apart.
+    """
+    bounds = blit_text(surface, label, BLACK, pos, font)
+    x_pos = bounds.right
+    for letter in guessed_letters:
+        color = GREEN if letter in correct_letters else RED
+        letter_rect = blit_text(surface, letter, color, (x_pos, pos[1]), font)
+        bounds.union_ip(letter_rect)
+        x_pos += letter_rect.width + 5 if spacing is None else spacing
+    return bounds
+
+
+def draw_input_box(surface, rect, text, border=BLACK, font=None):
+    pygame.draw.rect(surface, border, rect, 2)
+    text_rect = blit_text(surface, text, BLACK, (rect.x + 5, rect.y + 5), font)
+    return rect.union(text_rect)
+
+
+def draw_enter_button(surface, rect, font=None):
+    pygame.draw.rect(surface, (100, 150, 255), rect)
+    pygame.draw.rect(surface, (70, 120, 225), rect, 2)
+    return rect.union(blit_text(surface, "Enter", BLACK, (rect.x + 10, rect.y + 5), font))
+
+
+class DirtyRenderer:
+    """Retained-mode renderer that only repaints widgets whose state changed.
+
+    Screens describe their widgets every frame with set(); a widget is redrawn
+    only when its rect or arguments differ from the previous frame. Widgets not
+    set during a frame are erased. present() restores the background under the
+    damaged areas, redraws the widgets that overlap them and pushes just those
+    rects with pygame.display.update. When nothing changed it does no drawing
+    at all and returns False.
+    """
+
+    def __init__(self, surface):
+        self.surface = surface
+        # name -> [rect, draw, args, drawn bounds]
+        self.widgets = {}
+        self.seen = set()
+        self.dirty = []
+        self.full_redraw = True
+        self.generation = _redraw_generation
+
+    def invalidate(self):
+        self.full_redraw = True
+
+    def set(self, name, rect, draw, *args):
+        self.seen.add(name)
+        widget = self.widgets.get(name)
+        if widget is not None:
+            if widget[0] == rect and widget[1] is draw and widget[2] == args:
+                return
+            self.dirty.append(widget[3])
+            # Keep the widget's paint order stable across updates
+            widget[:] = [rect, draw, args, rect]
+        else:
+            self.widgets[name] = [rect, draw, args, rect]
+        self.dirty.append(rect)
+
+    def _draw_widget(self, widget):
+        bounds = widget[1](self.surface, *widget[2])
+        widget[3] = widget[0].union(bounds) if bounds else widget[0]
+        return widget[3]
+
+    def present(self):
+        for name in list(self.widgets):
+            if name not in self.seen:
+                self.dirty.append(self.widgets.pop(name)[3])
+        self.seen.clear()
+
+        if self.full_redraw or self.generation != _redraw_generation:
+            self.generation = _redraw_generation
+            draw_background(self.surface)
+            for widget in self.widgets.values():
+                self._draw_widget(widget)
+            pygame.display.flip()
+            self.full_redraw = False
+            self.dirty.clear()
+            return True
+
+        if not self.dirty:
+            return False
+
+        background = get_background(self.surface.get_size())
+        screen_rect = self.surface.get_rect()
+        damaged = [rect.clip(screen_rect) for rect in self.dirty]
+        self.dirty.clear()
+        # A widget may paint outside its declared rect (e.g. long centered text);
+        # the grown bounds are damaged as well so nothing stale is left behind.
+        i = 0
+        while i < len(damaged):
+            area = damaged[i]
+            self.surface.set_clip(area)
+            self.surface.blit(background, area, area)
+            for widget in self.widgets.values():
+                if widget[3].colliderect(area):
+                    old_bounds = widget[3]
+                    new_bounds = self._draw_widget(widget)
+                    if not old_bounds.contains(new_bounds):
+                        damaged.append(new_bounds.clip(screen_rect))
+            i += 1
+        self.surface.set_clip(None)
+        pygame.display.update(damaged)
+        return True
+
+
+# Background surfaces keyed by (width, height); built once per resolution
+_background_cache = {}
+
+
+def _build_background(size):
+    width, height = size
     try:
-        # Try to load and draw the background image
-        background_image = pygame.image.load("image.png")
-        # Scale the image to fit the screen
-        background_image = pygame.transform.scale(background_image, (surface.get_width(), surface.get_height()))
-        surface.blit(background_image, (0, 0))
-    except:
+        # Decode and scale the background image once for this resolution
+        background = pygame.image.load("image.png")
+        background = pygame.transform.scale(background, size)
+    except (pygame.error, OSError):
         # Fallback to gradient background if image loading fails
         background_color1 = (230, 240, 255)
         background_color2 = (255, 255, 240)
-        
-        # Draw gradient background
-        for y in range(surface.get_height()):
-            progress = y / surface.get_height()
-            color = tuple(int(background_color1[i] * (1 - progress) + background_color2[i] * progress) 
+
+        background = pygame.Surface(size)
+        for y in range(height):
+            progress = y / height
+            color = tuple(int(background_color1[i] * (1 - progress) + background_color2[i] * progress)
                         for i in range(3))
-            pygame.draw.line(surface, color, (0, y), (surface.get_width(), y))
+            pygame.draw.line(background, color, (0, y), (width, y))
+
+    # Match the display pixel format so blits don't convert every frame
+    if pygame.display.get_surface() is not None:
+        background = background.convert()
+    return background
+
+
+def get_background(size):
+    background = _background_cache.get(size)
+    if background is None:
+        background = _build_background(size)
+        _background_cache[size] = background
+    return background
+
+
+def clear_background_cache():
+    _background_cache.clear()
+
+
+def draw_background(surface):
+    surface.blit(get_background(surface.get_size()), (0, 0))
+
+
+# Bumped to make every DirtyRenderer repaint the whole screen on its next
+# present(), e.g. when the profiler overlay goes away
+_redraw_generation = 0
+
+
+def request_full_redraw():
+    global _redraw_generation
+    _redraw_generation += 1
+
+
+profiler = frameProfiler.profiler
+PROFILER_KEY = K_F3
+TRACE_KEY = K_F4
+TRACE_PATH = "frame_trace.json"
+OVERLAY_WIDTH = 300
+
+
+def draw_profiler_overlay(surface):
+    """FPS, frame time percentiles and per-span cost in the top-right corner."""
+    stats = profiler.stats()
+    lines = [f"{stats['fps']:5.1f} fps   p50 {stats['p50_ms']:5.2f} ms   p99 {stats['p99_ms']:5.2f} ms"]
+    for name, span in stats['spans'].items():
+        lines.append(f"{name:<22}{span['ms_per_frame']:7.2f} ms {span['calls_per_frame']:6.1f}x")
+    if profiler.trace is not None:
+        lines.append(f"tracing to {profiler.trace_path} (F4 to stop)")
+    # Numbers change every frame, so skip the text cache
+    font = get_font(20)
+    line_height = font.get_linesize()
+    rect = pygame.Rect(surface.get_width() - OVERLAY_WIDTH - 10, 10, OVERLAY_WIDTH,
+                       line_height * len(lines) + 10)
+    surface.fill((20, 20, 20), rect)
+    for i, line in enumerate(lines):
+        surface.blit(font.render(line, True, WHITE), (rect.x + 5, rect.y + 5 + i * line_height))
+    pygame.display.update(rect)
+
+
+class EventLoop:
+    """The one place screens get their events from.
+
+    Instead of polling pygame.event.get() and ticking a clock, a screen draws
+    its frame and calls wait(): it sleeps in pygame.event.wait until input
+    arrives, or until timeout_ms has passed for screens with something to
+    animate, then returns every queued event. An idle screen therefore wakes
+    only for input. QUIT is handled here for every screen.
+
+    A frame, for the profiler, runs from one wakeup to the next wait(), so
+    frame time is the work done per wakeup and idle time isn't counted.
+    Within it, event_fetch is draining the queue and event_handling is the
+    screen's loop over the returned events. Screens run nested screens from
+    inside that loop, so an inner wait() pauses the outer screen's span and
+    it only picks up again at the outer screen's next event. F3 toggles
+    profiling and its overlay, F4 starts and stops writing a span trace to
+    TRACE_PATH.
+    """
+
+    def __init__(self):
+        self.wakeups = 0
+        self.show_overlay = False
+        # [start] of each screen loop being timed, innermost last; start is
+        # None while a nested screen has it paused
+        self.handling = []
+
+    def toggle_overlay(self):
+        self.show_overlay = not self.show_overlay
+        profiler.set_enabled(self.show_overlay or profiler.trace is not None)
+        request_full_redraw()
+
+    def toggle_trace(self):
+        if profiler.trace is None:
+            profiler.start_trace(TRACE_PATH)
+            profiler.set_enabled(True)
+        else:
+            print(f"Wrote frame trace to {profiler.stop_trace()}")
+            profiler.set_enabled(self.show_overlay)
+
+    def wait(self, timeout_ms=None):
+        if self.handling and self.handling[-1][0] is not None:
+            # A nested screen: stop charging its frames to the outer handler
+            span = self.handling[-1]
+            if profiler.enabled:
+                profiler.record('event_handling', span[0], time.perf_counter())
+            span[0] = None
+        if profiler.enabled:
+            profiler.end_frame()
+            if self.show_overlay:
+                draw_profiler_overlay(pygame.display.get_surface())
+        if timeout_ms is None:
+            first = pygame.event.wait()
+        else:
+            # pygame treats 0 as "wait forever"
+            first = pygame.event.wait(max(1, int(timeout_ms)))
+        events = [] if first.type == NOEVENT else [first]
+        if profiler.enabled:
+            profiler.begin_frame()
+        events.extend(pygame.event.get())
+        self.wakeups += 1
+        handled = []
+        for event in events:
+            if event.type == QUIT:
+                if profiler.trace is not None:
+                    profiler.stop_trace()
+                # Write out any game results still queued
+                scoreStore.close_score_store()
+                pygame.quit()
+                sys.exit()
+            elif event.type == KEYDOWN and event.key == PROFILER_KEY:
+                self.toggle_overlay()
+            elif event.type == KEYDOWN and event.key == TRACE_KEY:
+                self.toggle_trace()
+            else:
+                handled.append(event)
+        if profiler.enabled and profiler.frame_start is not None:
+            profiler.record('event_fetch', profiler.frame_start, time.perf_counter())
+            return self.timed_handling(handled)
+        return handled
+
+    def timed_handling(self, events):
+        """Yield events, recording the screen's handling of them as a span.
+
+        The span runs until the screen's loop over the events ends, including
+        when it breaks or returns out of the loop, minus any time a nested
+        wait() had it paused.
+        """
+        span = [time.perf_counter()]
+        self.handling.append(span)
+        try:
+            for event in events:
+                yield event
+                if span[0] is None:
+                    span[0] = time.perf_counter()
+        finally:
+            self.handling = [other for other in self.handling if other is not span]
+            if span[0] is not None and profiler.enabled:
+                profiler.record('event_handling', span[0], time.perf_counter())
+
+
+event_loop = EventLoop()
 
 
 def get_input_from_gui(prompt):
@@ -488,11 +629,11 @@ def get_input_from_gui(prompt):
         draw_background(screen)
         draw_text(screen, prompt, BLACK, pygame.Rect(400, 200, 400, 50))
         pygame.draw.rect(screen, BLACK, input_rect, 2)
+        txt_surface = render_text(font, input_text, True, BLACK)
+        screen.blit(txt_surface, (input_rect.x + 5, input_rect.y + 5))
+        pygame.display.flip()
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+        for event in event_loop.wait():
             if event.type == KEYDOWN:
                 if event.key == K_RETURN:
                     input_active = False
@@ -501,11 +642,6 @@ def get_input_from_gui(prompt):
                 else:
                     input_text += event.unicode
 
-        txt_surface = font.render(input_text, True, BLACK)
-        screen.blit(txt_surface, (input_rect.x + 5, input_rect.y + 5))
-        pygame.display.flip()
-        clock.tick(30)
-
     return input_text.strip()
 
 
@@ -596,12 +732,12 @@ def about_game():
         
         # Title with page indicator
         title_y = 50
-        title_font = pygame.font.Font(None, 72)
+        title_font = get_font(72)
         page_info = f"{pages[current_page]['title']} ({current_page + 1}/{len(pages)})"
         draw_text(screen, page_info, BLACK, pygame.Rect(0, title_y, 1280, 60), title_font)
         
         # Content
-        content_font = pygame.font.Font(None, 36)
+        content_font = get_font(36)
         content_spacing = 40
         start_y = 140
         
@@ -650,11 +786,10 @@ def about_game():
                         back_btn, border_radius=10)
         pygame.draw.rect(screen, (70, 120, 225), back_btn, 2, border_radius=10)
         draw_text(screen, "Back", WHITE, back_btn, content_font)
-        
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+
+        pygame.display.flip()
+
+        for event in event_loop.wait():
             if event.type == MOUSEBUTTONDOWN:
                 if prev_btn.collidepoint(event.pos) and prev_enabled:
                     current_page -= 1
@@ -662,9 +797,6 @@ def about_game():
                     current_page += 1
                 elif back_btn.collidepoint(event.pos):
                     return
-        
-        pygame.display.flip()
-        clock.tick(30)
 
 
 def main_menu():
@@ -693,31 +825,11 @@ def main_menu():
         shadow_rect.x += title_shadow_offset
         shadow_rect.y += title_shadow_offset
         
-        title_font = pygame.font.Font(None, 96)
+        title_font = get_font(96)
         draw_text(screen, "Hangman Game", (100, 100, 100), shadow_rect, title_font)
 
         draw_text(screen, "Hangman Game", (0, 0, 100), title_rect, title_font)
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == MOUSEBUTTONDOWN:
-                mouse_pos = event.pos
-                for i, button in enumerate(buttons):
-                    if button.collidepoint(mouse_pos):
-                        if i == 0:
-                            ai_mode()
-                        elif i == 1:
-                            single_player()
-                        elif i == 2:
-                            multiplayer()
-                        elif i == 3:
-                            about_game()
-                        elif i == 4:
-                            pygame.quit()
-                            sys.exit()
-
         for i, button in enumerate(buttons):
             is_hovered = button.collidepoint(pygame.mouse.get_pos())
             
@@ -739,7 +851,27 @@ def main_menu():
             draw_text(screen, labels[i], text_color, button, font)
 
         pygame.display.flip()
-        clock.tick(30)
+
+        for event in event_loop.wait():
+            if event.type == MOUSEBUTTONDOWN:
+                mouse_pos = event.pos
+                for i, button in enumerate(buttons):
+                    if button.collidepoint(mouse_pos):
+                        if i == 0:
+                            ai_mode()
+                        elif i == 1:
+                            single_player()
+                        elif i == 2:
+                            multiplayer()
+                        elif i == 3:
+                            about_game()
+                        elif i == 4:
+                            scoreStore.close_score_store()
+                            pygame.quit()
+                            sys.exit()
+                        if i <= 2:
+                            # Between games is the only time the word files are checked
+                            wordRepository.get_repository().refresh()
 
 
 def ai_mode():
@@ -749,7 +881,7 @@ def ai_mode():
         
         # Draw title
         title_rect = pygame.Rect(0, 200, 1280, 60) 
-        draw_text(screen, "Select AI Mode", BLACK, title_rect, pygame.font.Font(None, 72))
+        draw_text(screen, "Select AI Mode", BLACK, title_rect, get_font(72))
         
         button_width = 600
         button_x = (1280 - button_width) // 2  # Center horizontally
@@ -764,16 +896,15 @@ def ai_mode():
             color = (120, 170, 255) if is_hovered else (100, 150, 255)
             pygame.draw.rect(screen, color, rect, border_radius=15)
             pygame.draw.rect(screen, (70, 120, 225), rect, 3, border_radius=15)
-            draw_text(screen, text, WHITE, rect, pygame.font.Font(None, 40))
+            draw_text(screen, text, WHITE, rect, get_font(40))
         
         back_btn = pygame.Rect(50, 50, 80, 30)
         pygame.draw.rect(screen, BLACK, back_btn, 2)
         draw_text(screen, "Back", BLACK, back_btn, small_font)
-        
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+
+        pygame.display.flip()
+
+        for event in event_loop.wait():
             if event.type == MOUSEBUTTONDOWN:
                 if option1_rect.collidepoint(event.pos):
                     selection_active = False
@@ -783,21 +914,65 @@ def ai_mode():
                     play_ai_mode(False)
                 elif back_btn.collidepoint(event.pos):
                     return
-        
-        pygame.display.flip()
-        clock.tick(30)
+
+
+# Posted by AITurnWorker when a move is ready, to wake the event loop
+AI_MOVE_READY = pygame.USEREVENT + 1
+
+# (label, ms between revealed moves); the choice is kept between games
+AI_PLAYBACK_SPEEDS = [("Slow", 2000), ("Normal", 1000), ("Fast", 300), ("Instant", 0)]
+ai_playback_speed = 1
+
+
+class AITurnWorker:
+    """Works out the AI's next letter on a background thread.
+
+    The UI thread asks for a move with request(), keeps handling events and
+    drawing, and picks the letter up with take() once AI_MOVE_READY
+    arrives. The game is only read by the worker while a request is
+    pending, and only changed by the UI thread in between.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ai-turn')
+        self.future = None
+
+    def request(self):
+        self.future = self.executor.submit(hangmanAI.ai_guesser, self.game)
+        self.future.add_done_callback(self._notify)
+
+    @staticmethod
+    def _notify(future):
+        if not future.cancelled():
+            try:
+                pygame.event.post(pygame.event.Event(AI_MOVE_READY))
+            except pygame.error:
+                pass  # Display already closed
+
+    def ready(self):
+        return self.future is not None and self.future.done()
+
+    def take(self):
+        """The computed letter (or None); only call once ready()."""
+        future, self.future = self.future, None
+        return future.result()
+
+    def cancel(self):
+        """Drop any pending move; a running computation finishes in the background.
+
+        It may still write to the partition cache, which is thread-safe, so
+        the cache can be saved without waiting for it.
+        """
+        if self.future is not None:
+            self.future.cancel()
+            self.future = None
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 
 def play_ai_mode(user_entered_word):
-    categories = load_words("words.txt")
-    # Combine all words from all categories and difficulties
-    all_words = []
-    for category_data in categories.values():
-        if isinstance(category_data, dict):
-            for difficulty_words in category_data.values():
-                all_words.extend(difficulty_words)
-        else:
-            all_words.extend(category_data)
+    # Every word from all categories and difficulties
+    all_words = wordRepository.get_repository().all_words
     
     # Get the word based on the mode
     if user_entered_word:
@@ -805,7 +980,7 @@ def play_ai_mode(user_entered_word):
         while instruction_screen:
             draw_background(screen)
             title_rect = pygame.Rect(150, 100, 1024, 60)
-            draw_text(screen, "Word Entry Instructions", BLACK, title_rect, pygame.font.Font(None, 72))
+            draw_text(screen, "Word Entry Instructions", BLACK, title_rect, get_font(72))
             
             instructions = [
                 "Rules for entering a word:",
@@ -825,35 +1000,42 @@ def play_ai_mode(user_entered_word):
             pygame.draw.rect(screen, (100, 150, 255), continue_btn, border_radius=10)
             pygame.draw.rect(screen, (70, 120, 225), continue_btn, 2, border_radius=10)
             draw_text(screen, "Continue", WHITE, continue_btn, font)
-            
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    pygame.quit()
-                    sys.exit()
+
+            pygame.display.flip()
+
+            for event in event_loop.wait():
                 if event.type == MOUSEBUTTONDOWN and continue_btn.collidepoint(event.pos):
                     instruction_screen = False
-            
-            pygame.display.flip()
-            clock.tick(30)
         
         # Get the word from user
         word = get_input_from_gui("Enter a word for AI to guess:").upper()
-        if not word or not word.isalpha() or len(word) < 3 or len(word) > 15:
+        if not word or not hangmanCore.is_letters(word) or len(word) < 3 or len(word) > 15:
             message = "Invalid word! Word must be 3-15 letters long and contain only letters."
             show_message_screen(message)
             return
-        game = AIGame(all_words, word, is_user_word=True)  # Use is_user_word=True for user words
+        # Use is_user_word=True for user words
+        game = AIGame(all_words, word, is_user_word=True,
+                      clock=pygame.time.get_ticks, on_event=play_game_sound)
     else:
-        word = random.choice(all_words)
-        game = AIGame(all_words, word, is_user_word=False)  # Use is_user_word=False for AI words
+        word = wordScheduler.get_scheduler().next_dictionary_word()
+        # Use is_user_word=False for AI words
+        game = AIGame(all_words, word, is_user_word=False,
+                      clock=pygame.time.get_ticks, on_event=play_game_sound)
     
+    global ai_playback_speed
     message = ''
     game_active = True
     ai_guesses = 0  # Track total AI guesses
 
+    # The first move is worked out while the empty board is on screen
+    worker = AITurnWorker(game)
+    worker.request()
+    last_reveal = pygame.time.get_ticks()
+
+    renderer = DirtyRenderer(screen)
+
     while game_active:
-        draw_background(screen)
-        draw_hangman(screen, game.wrong_guesses)
+        renderer.set('hangman', HANGMAN_RECT, draw_hangman, game.wrong_guesses)
 
         # Display game information 
         center_x = 640  
@@ -862,100 +1044,117 @@ def play_ai_mode(user_entered_word):
 
         # Show the word that AI needs to guess 
         if not user_entered_word:
-            draw_text(screen, f"Word to guess: {game.word}", BLUE, 
-                     pygame.Rect(0, info_y, 1280, 50), pygame.font.Font(None, 42))
+            target_rect = pygame.Rect(0, info_y, 1280, 50)
+            renderer.set('target', target_rect, draw_text, f"Word to guess: {game.word}", BLUE, 
+                     target_rect, get_font(42))
             info_y += info_spacing + 10
 
         # Game information
         info_y += 20
         # Word display 
         word_rect = pygame.Rect(center_x - 200, info_y, 400, 60)
-        pygame.draw.rect(screen, BLACK, word_rect, 2)
-        draw_text(screen, game.get_display_word(), BLACK, word_rect, pygame.font.Font(None, 48))
+        renderer.set('word', word_rect, draw_boxed_text, word_rect, game.get_display_word(), BLACK, get_font(48))
         
         # Guessed letters section 
         info_y += info_spacing + 30
-        guessed_text = "Guessed Letters: "
-        guessed_surface = pygame.font.Font(None, 36).render(guessed_text, True, BLACK)
-        screen.blit(guessed_surface, (center_x - 200, info_y))
-        
-        letter_x = center_x - 200 + guessed_surface.get_width()
-        letter_spacing = 25 
-        for letter in sorted(game.guessed_letters):
-            color = GREEN if letter in game.correct_letters else RED
-            letter_surface = pygame.font.Font(None, 36).render(letter, True, color)
-            screen.blit(letter_surface, (letter_x, info_y))
-            letter_x += letter_spacing
+        guessed_rect = pygame.Rect(center_x - 200, info_y, 840, 30)
+        renderer.set('guessed', guessed_rect, draw_guessed_letters, guessed_rect.topleft, "Guessed Letters: ",
+                     tuple(sorted(game.guessed_letters)), frozenset(game.correct_letters), get_font(36), 25)
 
         # AI thinking and message display
         info_y += info_spacing + 20
         if message:
-            draw_text(screen, message, RED if "wrong" in message.lower() else GREEN, 
-                     pygame.Rect(0, info_y, 1280, 50), pygame.font.Font(None, 36))
+            message_rect = pygame.Rect(0, info_y, 1280, 50)
+            renderer.set('message', message_rect, draw_text, message, RED if "wrong" in message.lower() else GREEN, 
+                     message_rect, get_font(36))
 
         # Statistics display
         info_y += info_spacing
-        draw_text(screen, f"AI Guesses: {ai_guesses}", BLACK, 
-                 pygame.Rect(0, info_y, 1280, 40), pygame.font.Font(None, 36))
+        guesses_rect = pygame.Rect(0, info_y, 1280, 40)
+        renderer.set('ai_guesses', guesses_rect, draw_text, f"AI Guesses: {ai_guesses}", BLACK, 
+                 guesses_rect, get_font(36))
         
         info_y += info_spacing - 10
-        draw_text(screen, f"Wrong Guesses: {game.wrong_guesses}", 
+        wrong_rect = pygame.Rect(0, info_y, 1280, 40)
+        renderer.set('wrong_guesses', wrong_rect, draw_text, f"Wrong Guesses: {game.wrong_guesses}", 
                  RED if game.wrong_guesses > 0 else BLACK,
-                 pygame.Rect(0, info_y, 1280, 40), pygame.font.Font(None, 36))
+                 wrong_rect, get_font(36))
 
         back_btn = pygame.Rect(center_x - 40, info_y + info_spacing + 20, 80, 40)
-        pygame.draw.rect(screen, (100, 150, 255), back_btn, border_radius=10)
-        pygame.draw.rect(screen, (70, 120, 225), back_btn, 2, border_radius=10)
-        draw_text(screen, "Back", WHITE, back_btn, pygame.font.Font(None, 36))
-
-        game.update_possible_words()
-        ai_guess = game.ai_guess()
-        if ai_guess and game.wrong_guesses < game.max_attempts:
-            result = game.guess_letter(ai_guess)
-            ai_guesses += 1
-            pygame.time.wait(1000)  # Delay for better visualization
-            message = f"AI guessed '{ai_guess}' - {'Correct!' if result == 'correct' else 'Wrong!'}"
-            
-            if game.is_word_guessed():
-                message = f"AI won! Word guessed in {ai_guesses} attempts!"
-                game_active = False
-            elif game.wrong_guesses >= game.max_attempts:
-                message = f"AI lost! The word was '{game.word}'"
-                game_active = False
-        else:
-            if game.wrong_guesses >= game.max_attempts:
-                message = f"AI lost! The word was '{game.word}'"
+        renderer.set('back_btn', back_btn, draw_filled_button, back_btn, "Back", (100, 150, 255), (70, 120, 225),
+                     WHITE, get_font(36))
+        speed_btn = pygame.Rect(back_btn.right + 20, back_btn.y, 160, 40)
+        renderer.set('speed_btn', speed_btn, draw_outline_button, speed_btn,
+                     f"Speed: {AI_PLAYBACK_SPEEDS[ai_playback_speed][0]}", BLACK)
+
+        renderer.present()
+
+        # Reveal the computed move once its turn comes round
+        now = pygame.time.get_ticks()
+        if worker.ready() and now >= last_reveal + AI_PLAYBACK_SPEEDS[ai_playback_speed][1]:
+            last_reveal = now
+            ai_guess = worker.take()
+            if ai_guess and game.wrong_guesses < game.max_attempts:
+                result = game.guess_letter(ai_guess)
+                ai_guesses += 1
+                message = f"AI guessed '{ai_guess}' - {'Correct!' if result == 'correct' else 'Wrong!'}"
+
+                if game.is_word_guessed():
+                    message = f"AI won! Word guessed in {ai_guesses} attempts!"
+                    game_active = False
+                elif game.wrong_guesses >= game.max_attempts:
+                    message = f"AI lost! The word was '{game.word}'"
+                    game_active = False
+                else:
+                    worker.request()
             else:
-                message = "AI couldn't find a letter to guess!"
-            game_active = False
+                if game.wrong_guesses >= game.max_attempts:
+                    message = f"AI lost! The word was '{game.word}'"
+                else:
+                    message = "AI couldn't find a letter to guess!"
+                game_active = False
+            if not game_active:
+                scoreStore.get_score_store().record(game, 'ai', 'AI')
+            continue
+
+        # Sleep until input, the worker's result or the next reveal is due
+        timeout = None
+        if worker.ready():
+            timeout = last_reveal + AI_PLAYBACK_SPEEDS[ai_playback_speed][1] - now
+        for event in event_loop.wait(timeout):
+            if event.type == MOUSEBUTTONDOWN:
+                if back_btn.collidepoint(event.pos):
+                    worker.cancel()
+                    return
+                if speed_btn.collidepoint(event.pos):
+                    ai_playback_speed = (ai_playback_speed + 1) % len(AI_PLAYBACK_SPEEDS)
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
-            if event.type == MOUSEBUTTONDOWN and back_btn.collidepoint(event.pos):
-                return
+    worker.cancel()
 
-        pygame.display.flip()
-        clock.tick(2)  # Slowed down for better visualization
+    # Keep the AI's decisions for the next session
+    if game.partition_cache.dirty:
+        try:
+            game.partition_cache.save()
+        except OSError as error:
+            print(f"Warning: Could not save AI cache: {error}")
 
     # Game over screen
+    renderer = DirtyRenderer(screen)
     while True:
-        draw_background(screen)
-        draw_hangman(screen, game.wrong_guesses)
+        renderer.set('hangman', HANGMAN_RECT, draw_hangman, game.wrong_guesses)
 
         info_y = 150
         info_spacing = 45
 
         # Game result title
-        draw_text(screen, "Game Over!", BLUE, 
-                 pygame.Rect(0, info_y, 1280, 60), pygame.font.Font(None, 48))
+        title_rect = pygame.Rect(0, info_y, 1280, 60)
+        renderer.set('title', title_rect, draw_text, "Game Over!", BLUE, 
+                 title_rect, get_font(48))
         
         info_y += info_spacing + 20
         # Final word display
         word_rect = pygame.Rect(center_x - 200, info_y, 400, 60)
-        pygame.draw.rect(screen, BLACK, word_rect, 2)
-        draw_text(screen, game.word, BLACK, word_rect, pygame.font.Font(None, 48))
+        renderer.set('word', word_rect, draw_boxed_text, word_rect, game.word, BLACK, get_font(48))
 
         # Game statistics 
         info_y += info_spacing + 30
@@ -966,26 +1165,22 @@ def play_ai_mode(user_entered_word):
             (message, BLUE)
         ]
 
-        for stat, color in stats:
-            draw_text(screen, stat, color, 
-                     pygame.Rect(0, info_y, 1280, 40), pygame.font.Font(None, 36))
+        for i, (stat, color) in enumerate(stats):
+            stat_rect = pygame.Rect(0, info_y, 1280, 40)
+            renderer.set(('stat', i), stat_rect, draw_text, stat, color, 
+                     stat_rect, get_font(36))
             info_y += info_spacing
 
         back_btn = pygame.Rect(center_x - 40, info_y + 20, 80, 40)
-        pygame.draw.rect(screen, (100, 150, 255), back_btn, border_radius=10)
-        pygame.draw.rect(screen, (70, 120, 225), back_btn, 2, border_radius=10)
-        draw_text(screen, "Back", WHITE, back_btn, pygame.font.Font(None, 36))
+        renderer.set('back_btn', back_btn, draw_filled_button, back_btn, "Back", (100, 150, 255), (70, 120, 225),
+                     WHITE, get_font(36))
 
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+        renderer.present()
+
+        for event in event_loop.wait():
             if event.type == MOUSEBUTTONDOWN and back_btn.collidepoint(event.pos):
                 return
 
-        pygame.display.flip()
-        clock.tick(30)
-
 
 def show_message_screen(message):
     message_active = True
@@ -996,43 +1191,35 @@ def show_message_screen(message):
         back_btn = pygame.Rect(700, 550, 80, 30)
         pygame.draw.rect(screen, BLACK, back_btn, 2)
         draw_text(screen, "Back", BLACK, back_btn, small_font)
-        
-        for event in pygame.event.get():
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+
+        pygame.display.flip()
+
+        for event in event_loop.wait():
             if event.type == MOUSEBUTTONDOWN and back_btn.collidepoint(event.pos):
                 return
-        
-        pygame.display.flip()
-        clock.tick(30)
 
 
 def single_player():
-    categories = load_words("words.txt")
-    hints_data = load_words_with_hints("words_with_hints.txt")
-    category_list = list(categories.keys())
+    words = wordRepository.get_repository()
+    scheduler = wordScheduler.get_scheduler()
+    category_list = list(words.categories.keys())
     current_category = category_list[0]
     current_difficulty = 'MEDIUM'
     
     def get_random_word():
         nonlocal current_category, current_difficulty
         if current_difficulty == 'EXPERT':
-            # For expert mode, randomly select a word from any HARD difficulty
-            possible_words = []
-            for cat in categories:
-                if cat != 'EXPERT' and cat != 'RANDOM':  # Exclude EXPERT and RANDOM categories
-                    possible_words.extend(categories[cat]['HARD'])
-            word = random.choice(possible_words)
+            # For expert mode, select a word from any HARD difficulty
+            # (EXPERT and RANDOM categories excluded)
+            word = scheduler.next_word(current_category, 'EXPERT')
             # Don't provide category info for expert mode
             return word, None
         elif current_category == 'EXPERT':
-            word = random.choice(categories['EXPERT'])
+            word = scheduler.next_word('EXPERT')
             return word, None
         else:
-            word_list = categories[current_category][current_difficulty]
-            word = random.choice(word_list)
-            hint = hints_data.get(current_category, {}).get(word, None)
+            word = scheduler.next_word(current_category, current_difficulty)
+            hint = words.get_hint(current_category, word)
             return word, hint
 
     word, hint = get_random_word()
@@ -1051,53 +1238,58 @@ def single_player():
         game_active = True
         show_word = False
 
+    renderer = DirtyRenderer(screen)
+    cat_btn_width = max(len(cat) * 10 + 20 for cat in category_list)
+    cat_spacing = 20
+    difficulties = ['EASY', 'MEDIUM', 'HARD', 'EXPERT']
+    diff_btn_width = 100
+    diff_spacing = 20
+
+    # Game info section
+    info_x = 600
+    hint_btn = pygame.Rect(info_x, 400, 80, 30)
+    new_game_btn = pygame.Rect(info_x + 100, 400, 120, 30)
+    input_box = pygame.Rect(info_x, 450, 200, 32)
+    enter_button = pygame.Rect(info_x + 220, 450, 80, 32)
+    back_btn = pygame.Rect(900, 700, 80, 30)
+
     while True:
-        draw_background(screen) 
         # Move hangman drawing to the left
-        draw_hangman(screen, game.wrong_guesses)
+        renderer.set('hangman', HANGMAN_RECT, draw_hangman, game.wrong_guesses)
 
-        # Game info section
-        info_x = 600
-        draw_text(screen, f"Score: {game.score}", BLACK, pygame.Rect(info_x, 30, 200, 30))
+        score_rect = pygame.Rect(info_x, 30, 200, 30)
+        renderer.set('score', score_rect, draw_text, f"Score: {game.score}", BLACK, score_rect)
         if current_difficulty != 'EXPERT':
-            draw_text(screen, f"Category: {game.category}", BLUE, pygame.Rect(info_x, 70, 200, 30))
-        draw_text(screen, f"Difficulty: {game.difficulty}", 
+            category_rect = pygame.Rect(info_x, 70, 200, 30)
+            renderer.set('category', category_rect, draw_text, f"Category: {game.category}", BLUE, category_rect)
+        difficulty_rect = pygame.Rect(info_x, 110, 200, 30)
+        renderer.set('difficulty', difficulty_rect, draw_text, f"Difficulty: {game.difficulty}", 
                  GREEN if game.difficulty == 'EASY' else 
                  YELLOW if game.difficulty == 'MEDIUM' else 
                  RED if game.difficulty == 'HARD' else 
-                 BLUE, pygame.Rect(info_x, 110, 200, 30))
-        draw_text(screen, f"Time: {game.get_time_played()}s", BLACK, pygame.Rect(info_x, 150, 200, 30))
-        draw_text(screen, f"Attempts Left: {game.max_attempts - game.wrong_guesses}", 
+                 BLUE, difficulty_rect)
+        time_rect = pygame.Rect(info_x, 150, 200, 30)
+        renderer.set('time', time_rect, draw_text, f"Time: {game.get_time_played()}s", BLACK, time_rect)
+        attempts_rect = pygame.Rect(info_x, 190, 200, 30)
+        renderer.set('attempts', attempts_rect, draw_text, f"Attempts Left: {game.max_attempts - game.wrong_guesses}", 
                  GREEN if game.wrong_guesses < game.max_attempts - 2 else 
                  YELLOW if game.wrong_guesses < game.max_attempts - 1 else RED, 
-                 pygame.Rect(info_x, 190, 200, 30))
+                 attempts_rect)
 
         # Category selection - moved down and spread out
-        cat_text = "Category: "
-        cat_surface = small_font.render(cat_text, True, BLACK)
-        screen.blit(cat_surface, (50, 650))
-        x_pos = 50 + cat_surface.get_width()
-        
-        cat_btn_width = max(len(cat) * 10 + 20 for cat in category_list)
-        cat_spacing = 20 
-        
+        cat_label_rect = pygame.Rect(50, 650, 100, 30)
+        renderer.set('category_label', cat_label_rect, blit_text, "Category: ", BLACK, cat_label_rect.topleft, small_font)
+        x_pos = 50 + render_text(small_font, "Category: ", True, BLACK).get_width()
         for i, cat in enumerate(category_list):
             color = BLUE if cat == current_category else BLACK
             cat_btn = pygame.Rect(x_pos, 645, cat_btn_width, 30)
-            pygame.draw.rect(screen, color, cat_btn, 2)
-            draw_text(screen, cat, color, cat_btn, small_font)
+            renderer.set(('category_btn', cat), cat_btn, draw_outline_button, cat_btn, cat, color)
             x_pos += cat_btn_width + cat_spacing
 
         # Difficulty selection - moved down and spread out
-        diff_text = "Difficulty: "
-        diff_surface = small_font.render(diff_text, True, BLACK)
-        screen.blit(diff_surface, (50, 600))
-        x_pos = 50 + diff_surface.get_width()
-        
-        difficulties = ['EASY', 'MEDIUM', 'HARD', 'EXPERT']
-        diff_btn_width = 100  
-        diff_spacing = 20  
-        
+        diff_label_rect = pygame.Rect(50, 600, 100, 30)
+        renderer.set('difficulty_label', diff_label_rect, blit_text, "Difficulty: ", BLACK, diff_label_rect.topleft, small_font)
+        x_pos = 50 + render_text(small_font, "Difficulty: ", True, BLACK).get_width()
         for diff in difficulties:
             color = (GREEN if diff == 'EASY' else 
                     YELLOW if diff == 'MEDIUM' else 
@@ -1106,75 +1298,48 @@ def single_player():
             if diff == current_difficulty:
                 color = BLUE
             diff_btn = pygame.Rect(x_pos, 595, diff_btn_width, 30)
-            pygame.draw.rect(screen, color, diff_btn, 2)
-            draw_text(screen, diff, color, diff_btn, small_font)
+            renderer.set(('difficulty_btn', diff), diff_btn, draw_outline_button, diff_btn, diff, color)
             x_pos += diff_btn_width + diff_spacing
 
         # Word display
         word_rect = pygame.Rect(info_x, 250, 400, 50)
-        pygame.draw.rect(screen, BLACK, word_rect, 2)
-        draw_text(screen, game.get_display_word(), BLACK, word_rect)
+        renderer.set('word', word_rect, draw_boxed_text, word_rect, game.get_display_word(), BLACK)
 
         # Guessed letters with color coding
-        guessed_text = "Guessed: "
-        guessed_surface = small_font.render(guessed_text, True, BLACK)
-        screen.blit(guessed_surface, (info_x, 300))
-        x_pos = info_x + guessed_surface.get_width()
-        for letter in sorted(game.guessed_letters):
-            color = GREEN if letter in game.correct_letters else RED
-            letter_surface = small_font.render(letter, True, color)
-            screen.blit(letter_surface, (x_pos, 300))
-            x_pos += letter_surface.get_width() + 5
+        guessed_rect = pygame.Rect(info_x, 300, 680, 30)
+        renderer.set('guessed', guessed_rect, draw_guessed_letters, guessed_rect.topleft, "Guessed: ",
+                     tuple(sorted(game.guessed_letters)), frozenset(game.correct_letters), small_font)
 
         # Message display
         message_rect = pygame.Rect(info_x, 350, 400, 50)
-        draw_text(screen, message, RED, message_rect)
+        renderer.set('message', message_rect, draw_text, message, RED, message_rect)
 
         # Game control buttons
         if current_difficulty != 'EXPERT':
-            hint_btn = pygame.Rect(info_x, 400, 80, 30)
             btn_color = BLACK if game.score >= 25 and game_active else GRAY
-            pygame.draw.rect(screen, btn_color, hint_btn, 2)
-            draw_text(screen, "Hint", btn_color, hint_btn, small_font)
+            renderer.set('hint_btn', hint_btn, draw_outline_button, hint_btn, "Hint", btn_color)
 
-        new_game_btn = pygame.Rect(info_x + 100, 400, 120, 30)
-        pygame.draw.rect(screen, BLUE, new_game_btn, 2)
-        draw_text(screen, "New Game", BLUE, new_game_btn, small_font)
+        renderer.set('new_game_btn', new_game_btn, draw_outline_button, new_game_btn, "New Game", BLUE)
 
         if game_active:
-            # Draw input box
-            input_box = pygame.Rect(info_x, 450, 200, 32)
-            enter_button = pygame.Rect(info_x + 220, 450, 80, 32)
-            
-            # Draw input elements
-            pygame.draw.rect(screen, WHITE, input_box, 2)
-            pygame.draw.rect(screen, (100, 150, 255), enter_button)
-            pygame.draw.rect(screen, (70, 120, 225), enter_button, 2)
-            
-            # Draw text
-            txt_surface = font.render(input_text, True, BLACK)
-            enter_text = font.render("Enter", True, BLACK)
-            note_text = small_font.render("Type letter + Enter/click button", True, GRAY)
-            
-            # Position text
-            screen.blit(txt_surface, (input_box.x + 5, input_box.y + 5))
-            screen.blit(enter_text, (enter_button.x + 10, enter_button.y + 5))
-            screen.blit(note_text, (info_x, 490))
-
-        back_btn = pygame.Rect(900, 700, 80, 30)
-        pygame.draw.rect(screen, BLACK, back_btn, 2)
-        draw_text(screen, "Back", BLACK, back_btn, small_font)
-
-        # Handle events in single player mode
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
+            renderer.set('input_box', input_box, draw_input_box, input_box, input_text, WHITE)
+            renderer.set('enter_btn', enter_button, draw_enter_button, enter_button)
+            note_rect = pygame.Rect(info_x, 490, 400, 30)
+            renderer.set('note', note_rect, blit_text, "Type letter + Enter/click button", GRAY, note_rect.topleft, small_font)
+
+        renderer.set('back_btn', back_btn, draw_outline_button, back_btn, "Back", BLACK)
+        renderer.present()
+
+        # Handle events in single player mode; while a game runs, wake on the
+        # next whole second so the time display keeps counting
+        timeout = 1000 - (game.clock() - game.start_time) % 1000 if game_active else None
+        for event in event_loop.wait(timeout):
             if event.type == pygame.MOUSEBUTTONDOWN:
                 # Get mouse position
                 mouse_pos = pygame.mouse.get_pos()
                 # Check if enter button is clicked
                 if enter_button.collidepoint(mouse_pos):
-                    if len(input_text) == 1 and input_text.isalpha():
+                    if len(input_text) == 1 and hangmanCore.is_letters(input_text):
                         guess = input_text.upper()
                         if guess not in game.guessed_letters:
                             result = game.guess_letter(guess)
@@ -1200,12 +1365,12 @@ def single_player():
                         input_text = ''
                     else:
                         message = "Please enter a single letter!"
-                elif event.unicode.isalpha():
+                elif hangmanCore.is_letters(event.unicode):
                     input_text += event.unicode.upper()
             if event.type == MOUSEBUTTONDOWN:
                 mouse_pos = pygame.mouse.get_pos()
                 # Category buttons
-                x_pos = 50 + small_font.render("Category: ", True, BLACK).get_width()
+                x_pos = 50 + render_text(small_font, "Category: ", True, BLACK).get_width()
                 for i, cat in enumerate(category_list):
                     cat_btn = pygame.Rect(x_pos, 645, cat_btn_width, 30)
                     if cat_btn.collidepoint(mouse_pos):
@@ -1214,7 +1379,7 @@ def single_player():
                     x_pos += cat_btn_width + cat_spacing
 
                 # Difficulty buttons
-                x_pos = 50 + small_font.render("Difficulty: ", True, BLACK).get_width()
+                x_pos = 50 + render_text(small_font, "Difficulty: ", True, BLACK).get_width()
                 for diff in difficulties:
                     diff_btn = pygame.Rect(x_pos, 595, diff_btn_width, 30)
                     if diff_btn.collidepoint(mouse_pos):
@@ -1238,6 +1403,7 @@ def single_player():
         if game.is_word_guessed() and game_active:
             game.game_time = game.get_time_played()
             final_score = game.calculate_final_score()
+            scoreStore.get_score_store().record(game, 'single')
             
             # Display score breakdown
             score_lines = [
@@ -1254,7 +1420,8 @@ def single_player():
                 
             score_lines.append(f"Final Score: {final_score}")
             
-            # Create a semi-transparent overlay
+            # Create a semi-transparent overlay over the current frame
+            renderer.present()
             overlay = pygame.Surface((1280, 920))
             overlay.fill((255, 255, 255))
             overlay.set_alpha(230)
@@ -1280,31 +1447,26 @@ def single_player():
             pygame.draw.rect(screen, (70, 120, 225), continue_btn, 2, border_radius=10)
             draw_text(screen, "Continue", WHITE, continue_btn, font)
             
-            win_sound.play()
+            audio.play('win')
             game_active = False
+            pygame.display.flip()
             
-            # Wait for continue button click
+            # Wait for continue button click; the overlay is static so nothing is redrawn
             waiting_for_click = True
             while waiting_for_click:
-                for event in pygame.event.get():
-                    if event.type == QUIT:
-                        pygame.quit()
-                        sys.exit()
+                for event in event_loop.wait():
                     if event.type == MOUSEBUTTONDOWN:
                         if continue_btn.collidepoint(event.pos):
                             waiting_for_click = False
                             start_new_game()
-                pygame.display.flip()
-                clock.tick(30)
+            renderer.invalidate()
         elif game.wrong_guesses >= game.max_attempts and game_active:
             game.game_time = game.get_time_played()
+            scoreStore.get_score_store().record(game, 'single')
             message = f"Game Over! The word was '{game.word}'"
-            lose_sound.play()
+            audio.play('lose')
             game_active = False
 
-        pygame.display.flip()
-        clock.tick(30)
-
 
 def multiplayer():
     player1 = get_input_from_gui("Enter Player 1 name:")
@@ -1314,24 +1476,24 @@ def multiplayer():
     round_details = {player1: [], player2: []}  # Store detailed score for each round
     message = ''
     
-    # Load all words with categories and difficulties
-    categories = load_words("words.txt")
-    hints_data = load_words_with_hints("words_with_hints.txt")
+    # Shared word lists and hints, already in memory
+    words = wordRepository.get_repository()
+    scheduler = wordScheduler.get_scheduler()
     
     for current_round in range(rounds):
         # Select random category and difficulty for player 1
-        valid_categories = [cat for cat in categories.keys() if cat not in ['EXPERT', 'RANDOM']]
+        valid_categories = words.playable_categories
         p1_category = random.choice(valid_categories)
         p1_difficulty = random.choice(['EASY', 'MEDIUM', 'HARD'])
         
         # Get word for player 1
-        p1_word = random.choice(categories[p1_category][p1_difficulty])
-        p1_hint = hints_data.get(p1_category, {}).get(p1_word, None)
+        p1_word = scheduler.next_word(p1_category, p1_difficulty)
+        p1_hint = words.get_hint(p1_category, p1_word)
         
         # For player 2, use same difficulty but different category
         p2_category = random.choice([cat for cat in valid_categories if cat != p1_category])
-        p2_word = random.choice(categories[p2_category][p1_difficulty])
-        p2_hint = hints_data.get(p2_category, {}).get(p2_word, None)
+        p2_word = scheduler.next_word(p2_category, p1_difficulty)
+        p2_hint = words.get_hint(p2_category, p2_word)
         
         for current_player, word, hint, category in [(player1, p1_word, p1_hint, p1_category),
                                                    (player2, p2_word, p2_hint, p2_category)]:
@@ -1339,9 +1501,10 @@ def multiplayer():
             input_text = ''
             game_active = True
 
+            renderer = DirtyRenderer(screen)
+
             while game_active:
-                draw_background(screen)
-                draw_hangman(screen, game.wrong_guesses)
+                renderer.set('hangman', HANGMAN_RECT, draw_hangman, game.wrong_guesses)
 
                 # Display game information 
                 center_x = 640  
@@ -1351,77 +1514,64 @@ def multiplayer():
 
                 # Player scores 
                 score_y = info_y
-                draw_text(screen, f"{player1}: {scores[player1]}", BLACK, 
-                         pygame.Rect(center_x - 300, score_y, 200, 50))
-                draw_text(screen, f"{player2}: {scores[player2]}", BLACK, 
-                         pygame.Rect(center_x + 100, score_y, 200, 50))
+                p1_rect = pygame.Rect(center_x - 300, score_y, 200, 50)
+                p2_rect = pygame.Rect(center_x + 100, score_y, 200, 50)
+                renderer.set('p1_score', p1_rect, draw_text, f"{player1}: {scores[player1]}", BLACK, p1_rect)
+                renderer.set('p2_score', p2_rect, draw_text, f"{player2}: {scores[player2]}", BLACK, p2_rect)
                 
                 # Current player and round info
                 info_y += info_spacing + 20
-                draw_text(screen, f"Current Player: {current_player}", BLUE, 
-                         pygame.Rect(0, info_y, 1280, 50))
+                player_rect = pygame.Rect(0, info_y, 1280, 50)
+                renderer.set('player', player_rect, draw_text, f"Current Player: {current_player}", BLUE, player_rect)
                 
                 info_y += info_spacing
-                draw_text(screen, f"Round: {current_round + 1}/{rounds}", BLACK, 
-                         pygame.Rect(0, info_y, 1280, 50))
+                round_rect = pygame.Rect(0, info_y, 1280, 50)
+                renderer.set('round', round_rect, draw_text, f"Round: {current_round + 1}/{rounds}", BLACK, round_rect)
                 
                 info_y += info_spacing
-                draw_text(screen, f"Category: {category}", BLACK, 
-                         pygame.Rect(0, info_y, 1280, 50))
+                category_rect = pygame.Rect(0, info_y, 1280, 50)
+                renderer.set('category', category_rect, draw_text, f"Category: {category}", BLACK, category_rect)
                 
                 info_y += info_spacing
                 difficulty_color = (GREEN if p1_difficulty == 'EASY' else 
                                  YELLOW if p1_difficulty == 'MEDIUM' else 
                                  RED)
-                draw_text(screen, f"Difficulty: {p1_difficulty}", difficulty_color, 
-                         pygame.Rect(0, info_y, 1280, 50))
+                difficulty_rect = pygame.Rect(0, info_y, 1280, 50)
+                renderer.set('difficulty', difficulty_rect, draw_text, f"Difficulty: {p1_difficulty}", difficulty_color, 
+                             difficulty_rect)
 
                 info_y += info_spacing + 20
                 word_rect = pygame.Rect(center_x - 200, info_y, 400, 60)
-                pygame.draw.rect(screen, BLACK, word_rect, 2)
-                draw_text(screen, game.get_display_word(), BLACK, word_rect, pygame.font.Font(None, 48))
+                renderer.set('word', word_rect, draw_boxed_text, word_rect, game.get_display_word(), BLACK, get_font(48))
 
                 info_y += info_spacing + 30
-                guessed_text = "Guessed Letters: "
-                guessed_surface = font.render(guessed_text, True, BLACK)
-                screen.blit(guessed_surface, (center_x - 200, info_y))
-                
-                letter_x = center_x - 200 + guessed_surface.get_width()
-                letter_spacing = 25 
-                for letter in sorted(game.guessed_letters):
-                    color = GREEN if letter in game.correct_letters else RED
-                    letter_surface = font.render(letter, True, color)
-                    screen.blit(letter_surface, (letter_x, info_y))
-                    letter_x += letter_spacing
+                guessed_rect = pygame.Rect(center_x - 200, info_y, 840, 30)
+                renderer.set('guessed', guessed_rect, draw_guessed_letters, guessed_rect.topleft, "Guessed Letters: ",
+                             tuple(sorted(game.guessed_letters)), frozenset(game.correct_letters), font, 25)
 
                 info_y += info_spacing
-                draw_text(screen, message, RED, pygame.Rect(0, info_y, 1280, 50))
+                message_rect = pygame.Rect(0, info_y, 1280, 50)
+                renderer.set('message', message_rect, draw_text, message, RED, message_rect)
 
                 if game_active:
                     input_box = pygame.Rect(center_x - 150, center_y + 50, 140, 40) 
-                    pygame.draw.rect(screen, BLACK, input_box, 2)
-                    text_surface = font.render(input_text, True, BLACK)
-                    screen.blit(text_surface, (input_box.x + 5, input_box.y + 5))
+                    renderer.set('input_box', input_box, draw_input_box, input_box, input_text)
 
                     enter_btn = pygame.Rect(input_box.x + input_box.width + 10, input_box.y, 100, 40)
-                    pygame.draw.rect(screen, BLACK, enter_btn, 2)
-                    draw_text(screen, "Enter", BLACK, enter_btn, small_font)
+                    renderer.set('enter_btn', enter_btn, draw_outline_button, enter_btn, "Enter", BLACK)
 
                     instruction_text = "Type a letter and press Enter or click Enter button"
-                    instruction_surface = small_font.render(instruction_text, True, BLACK)
-                    screen.blit(instruction_surface, (input_box.x, input_box.y + 50))
+                    instruction_rect = pygame.Rect(input_box.x, input_box.y + 50, 500, 30)
+                    renderer.set('instructions', instruction_rect, blit_text, instruction_text, BLACK,
+                                 instruction_rect.topleft, small_font)
 
                     hint_btn = pygame.Rect(center_x - 110, input_box.y + 100, 100, 40)  
                     back_btn = pygame.Rect(center_x + 10, input_box.y + 100, 100, 40)  
-                    pygame.draw.rect(screen, BLACK, hint_btn, 2)
-                    pygame.draw.rect(screen, BLACK, back_btn, 2)
-                    draw_text(screen, "Hint", BLACK, hint_btn, small_font)
-                    draw_text(screen, "Back", BLACK, back_btn, small_font)
+                    renderer.set('hint_btn', hint_btn, draw_outline_button, hint_btn, "Hint", BLACK)
+                    renderer.set('back_btn', back_btn, draw_outline_button, back_btn, "Back", BLACK)
+                renderer.present()
 
-                for event in pygame.event.get():
-                    if event.type == QUIT:
-                        pygame.quit()
-                        sys.exit()
+                for event in event_loop.wait():
                     if event.type == KEYDOWN:
                         if event.key == K_BACKSPACE:
                             input_text = input_text[:-1]
@@ -1437,7 +1587,7 @@ def multiplayer():
                                 input_text = ''
                             else:
                                 message = "Enter single letter!"
-                        elif event.unicode.isalpha():
+                        elif hangmanCore.is_letters(event.unicode):
                             input_text += event.unicode.upper()
                     if event.type == MOUSEBUTTONDOWN:
                         if hint_btn.collidepoint(event.pos):
@@ -1469,20 +1619,13 @@ def multiplayer():
                     final_score = game.calculate_final_score()
                     
                     # Store round details
-                    round_info = {
-                        'word': game.word,
-                        'base_score': game.score,
-                        'time_bonus': max(0, 100 - game.game_time) // 10,
-                        'attempts_bonus': (game.max_attempts - game.wrong_guesses) * 10,
-                        'word_length_bonus': len(game.word) * 2,
-                        'no_hint_bonus': 50 if game.hints_used == 0 else 0,
-                        'perfect_bonus': 100 if game.wrong_guesses == 0 else 0,
-                        'final_score': final_score
-                    }
+                    round_info = {'word': game.word, **game.score_breakdown()}
                     round_details[current_player].append(round_info)
                     scores[current_player] += final_score
+                    scoreStore.get_score_store().record(game, 'multiplayer', current_player)
                     
-                    # Show round end screen
+                    # Show round end screen over the current frame
+                    renderer.present()
                     overlay = pygame.Surface((1280, 920))
                     overlay.fill((255, 255, 255))
                     overlay.set_alpha(230)
@@ -1517,26 +1660,19 @@ def multiplayer():
                     draw_text(screen, "Continue", WHITE, continue_btn, font)
                     
                     if game.is_word_guessed():
-                        win_sound.play()
+                        audio.play('win')
                     else:
-                        lose_sound.play()
+                        audio.play('lose')
                         
                     game_active = False
                     waiting_for_click = True
+                    pygame.display.flip()
                     
                     while waiting_for_click:
-                        for event in pygame.event.get():
-                            if event.type == QUIT:
-                                pygame.quit()
-                                sys.exit()
+                        for event in event_loop.wait():
                             if event.type == MOUSEBUTTONDOWN:
                                 if continue_btn.collidepoint(event.pos):
                                     waiting_for_click = False
-                        pygame.display.flip()
-                        clock.tick(30)
-
-                pygame.display.flip()
-                clock.tick(30)
 
     # Final score screen
     screen.fill(WHITE)
@@ -1619,13 +1755,23 @@ def multiplayer():
     pygame.display.flip()
     
     while True:
-        for event in pygame.event.get():
+        for event in event_loop.wait():
             if event.type == MOUSEBUTTONDOWN and menu_btn.collidepoint(pygame.mouse.get_pos()):
                 return
-            if event.type == QUIT:
-                pygame.quit()
-                sys.exit()
+
+
+# Spans the profiler records while it is on
+profiler.instrument(sys.modules[__name__], 'draw_background')
+profiler.instrument(sys.modules[__name__], 'draw_hangman')
+profiler.instrument(sys.modules[__name__], 'draw_text')
+profiler.instrument(AIGame, 'update_possible_words')
+profiler.instrument(AIGame, 'ai_guess')
 
 
 if __name__ == "__main__":
+    hangmanAI.configure_partition_cache("ai_cache.json")
+    hangmanAI.configure_opening_book("opening_book.json")
+    wordRepository.get_repository("words.txt", "words_with_hints.txt")
+    scoreStore.get_score_store("scores.db")
+    init_display()
     main_menu()
@@ -0,0 +1,347 @@
+"""Hangman as a service: many concurrent games over a line-based JSON protocol.
+
+Clients connect over TCP and send one JSON object per line; every request
+gets exactly one JSON line back, in order:
+
+    {"op": "new", "category": "ANIMALS", "difficulty": "EASY"}
+        -> {"ok": true, "session": "9f2c...", "state": {...}}
+    {"op": "guess", "session": "9f2c...", "letter": "e"}
+        -> {"ok": true, "result": "correct", "state": {...}}
+    {"op": "hint", "session": "9f2c..."}
+        -> {"ok": true, "hint": "...", "state": {...}}
+    {"op": "state", "session": "9f2c..."}
+        -> {"ok": true, "state": {...}}
+    {"op": "end", "session": "9f2c..."}
+        -> {"ok": true, "state": {...}}        (the session is dropped)
+
+Failures answer {"ok": false, "error": "..."}; an "id" field in a request is
+echoed in its response. category and difficulty are optional for "new".
+As in single player, expert games (EXPERT difficulty or the EXPERT
+category) don't reveal the category and don't offer hints.
+
+Sessions are not tied to a connection, so a client can reconnect and carry
+on, and are dropped after session_timeout seconds without a request.
+Connections are closed after idle_timeout seconds of silence. Each
+connection is served one request at a time and the next line isn't read
+until the previous response has been flushed, so a client that stops
+reading stalls only itself; one that stays stalled past write_timeout is
+disconnected.
+
+    python hangmanServer.py --port 7777
+"""
+import argparse
+import asyncio
+import json
+import random
+import secrets
+import time
+
+import hangmanCore
+import wordRepository
+import wordScheduler
+
+MAX_LINE = 4096
+
+
+class ProtocolError(Exception):
+    """A request the server can't carry out; its message goes back to the client."""
+
+
+def raise_fd_limit():
+    """Allow as many open sockets as the hard limit permits (Unix only)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        try:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+        except (ValueError, OSError):
+            pass
+
+
+class Session:
+    __slots__ = ('id', 'game', 'last_seen')
+
+    def __init__(self, session_id, game, now):
+        self.id = session_id
+        self.game = game
+        self.last_seen = now
+
+
+def is_expert(game):
+    return game.difficulty == 'EXPERT' or game.category == 'EXPERT'
+
+
+def game_state(game):
+    state = {
+        'display': game.get_display_word(),
+        'length': len(game.word),
+        'difficulty': game.difficulty,
+        'guessed': ''.join(sorted(game.guessed_letters)),
+        'wrong_guesses': game.wrong_guesses,
+        'max_attempts': game.max_attempts,
+        'score': game.score,
+        'hints_used': game.hints_used,
+        'status': 'won' if game.is_word_guessed() else 'lost' if game.is_lost() else 'playing',
+    }
+    if not is_expert(game):
+        state['category'] = game.category
+    if state['status'] != 'playing':
+        state['word'] = game.word
+        state['final_score'] = game.calculate_final_score()
+    return state
+
+
+class GameServer:
+    def __init__(self, repository=None, session_timeout=300.0, idle_timeout=60.0, write_timeout=10.0,
+                 max_sessions=100_000, max_connections=10_000, clock=time.monotonic):
+        self.repository = repository or wordRepository.get_repository()
+        self.scheduler = wordScheduler.WordScheduler(self.repository)
+        self.session_timeout = session_timeout
+        self.idle_timeout = idle_timeout
+        self.write_timeout = write_timeout
+        self.max_sessions = max_sessions
+        self.max_connections = max_connections
+        self.clock = clock
+        self.sessions = {}
+        self.connections = 0
+        self.stats = {'requests': 0, 'errors': 0, 'sessions_started': 0, 'sessions_expired': 0,
+                      'connections_refused': 0, 'connections_timed_out': 0}
+        self.server = None
+        self.reaper = None
+
+    # Requests
+
+    def dispatch(self, request):
+        """Carry out one decoded request and return the response object."""
+        self.stats['requests'] += 1
+        try:
+            if not isinstance(request, dict):
+                raise ProtocolError("request must be a JSON object")
+            op = request.get('op')
+            handler = self.handlers.get(op)
+            if handler is None:
+                raise ProtocolError(f"unknown op {op!r}")
+            response = handler(self, request)
+            response['ok'] = True
+        except ProtocolError as error:
+            self.stats['errors'] += 1
+            response = {'ok': False, 'error': str(error)}
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        return response
+
+    def session(self, request):
+        session_id = request.get('session')
+        session = self.sessions.get(session_id) if isinstance(session_id, str) else None
+        if session is None:
+            raise ProtocolError("unknown or expired session")
+        session.last_seen = self.clock()
+        return session
+
+    def pick_word(self, category, difficulty):
+        categories = self.repository.categories
+        if not isinstance(category, (str, type(None))) or not isinstance(difficulty, (str, type(None))):
+            raise ProtocolError("category and difficulty must be strings")
+        if category is None:
+            category = random.choice(self.repository.playable_categories)
+        if category not in categories:
+            raise ProtocolError(f"unknown category {category!r}")
+        if isinstance(categories[category], dict):
+            difficulty = difficulty or 'MEDIUM'
+            if difficulty != 'EXPERT' and difficulty not in categories[category]:
+                raise ProtocolError(f"unknown difficulty {difficulty!r}")
+        elif difficulty is not None:
+            raise ProtocolError(f"category {category!r} has no difficulties")
+        try:
+            word = self.scheduler.next_word(category, difficulty)
+        except IndexError:
+            raise ProtocolError(f"no words in {category}:{difficulty}")
+        if difficulty == 'EXPERT' or category == 'EXPERT':
+            # As in single player, expert words come without a hint
+            return word, category, difficulty, None
+        return word, category, difficulty, self.repository.get_hint(category, word)
+
+    def op_new(self, request):
+        if len(self.sessions) >= self.max_sessions:
+            raise ProtocolError("server full")
+        word, category, difficulty, hint = self.pick_word(request.get('category'), request.get('difficulty'))
+        game = hangmanCore.HangmanGame(word, category, difficulty, hint)
+        session_id = secrets.token_hex(8)
+        self.sessions[session_id] = Session(session_id, game, self.clock())
+        self.stats['sessions_started'] += 1
+        return {'session': session_id, 'state': game_state(game)}
+
+    def op_guess(self, request):
+        game = self.session(request).game
+        letter = request.get('letter')
+        if not isinstance(letter, str) or len(letter) != 1 or not letter.isalpha() or not letter.isascii():
+            raise ProtocolError("letter must be a single letter A-Z")
+        if game.is_over():
+            raise ProtocolError("game is over")
+        return {'result': game.guess_letter(letter), 'state': game_state(game)}
+
+    def op_hint(self, request):
+        game = self.session(request).game
+        if game.is_over():
+            raise ProtocolError("game is over")
+        if is_expert(game):
+            raise ProtocolError("no hints in expert games")
+        hint = game.use_hint()
+        if hint is None:
+            raise ProtocolError("no hint available")
+        return {'hint': hint, 'state': game_state(game)}
+
+    def op_state(self, request):
+        return {'state': game_state(self.session(request).game)}
+
+    def op_end(self, request):
+        session = self.session(request)
+        del self.sessions[session.id]
+        return {'state': game_state(session.game)}
+
+    handlers = {'new': op_new, 'guess': op_guess, 'hint': op_hint, 'state': op_state, 'end': op_end}
+
+    def expire_sessions(self):
+        cutoff = self.clock() - self.session_timeout
+        expired = [session_id for session_id, session in self.sessions.items() if session.last_seen < cutoff]
+        for session_id in expired:
+            del self.sessions[session_id]
+        self.stats['sessions_expired'] += len(expired)
+        return len(expired)
+
+    # Networking
+
+    async def handle_connection(self, reader, writer):
+        if self.connections >= self.max_connections:
+            self.stats['connections_refused'] += 1
+            writer.write(b'{"ok": false, "error": "too many connections"}\n')
+            await self.close(writer)
+            return
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.stats['connections_timed_out'] += 1
+                    break
+                except ValueError:
+                    # Line longer than the stream limit; framing is lost
+                    writer.write(b'{"ok": false, "error": "request too long"}\n')
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    self.stats['requests'] += 1
+                    self.stats['errors'] += 1
+                    response = {'ok': False, 'error': "invalid JSON"}
+                else:
+                    response = self.dispatch(request)
+                writer.write(json.dumps(response).encode() + b'\n')
+                # Backpressure: don't read more from a client that isn't reading
+                await asyncio.wait_for(writer.drain(), self.write_timeout)
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            self.connections -= 1
+            await self.close(writer)
+
+    @staticmethod
+    async def close(writer):
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def reap(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            self.expire_sessions()
+
+    async def start(self, host='127.0.0.1', port=7777, backlog=4096):
+        self.server = await asyncio.start_server(self.handle_connection, host, port,
+                                                 limit=MAX_LINE, backlog=backlog)
+        self.reaper = asyncio.create_task(self.reap(min(self.session_timeout, 30.0) / 2))
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        if self.reaper is not None:
+            self.reaper.cancel()
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+
+class GameClient:
+    """One connection to a GameServer, for frontends and the load generator."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.session = None
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=7777):
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE * 4)
+        return cls(reader, writer)
+
+    async def request(self, op, **fields):
+        """Send one request and return the decoded response.
+
+        The session of the last "new" is filled in when none is given.
+        """
+        fields['op'] = op
+        if op != 'new' and 'session' not in fields:
+            fields['session'] = self.session
+        self.writer.write(json.dumps(fields).encode() + b'\n')
+        await self.writer.drain()
+        line = await self.reader.readline()
+        if not line:
+            raise ConnectionError("server closed the connection")
+        response = json.loads(line)
+        if op == 'new' and response.get('ok'):
+            self.session = response['session']
+        return response
+
+    async def close(self):
+        await GameServer.close(self.writer)
+
+
+async def serve(args):
+    raise_fd_limit()
+    server = GameServer(session_timeout=args.session_timeout, idle_timeout=args.idle_timeout,
+                        max_sessions=args.max_sessions, max_connections=args.max_connections)
+    host, port = await server.start(args.host, args.port)
+    # Flushed so a parent process (e.g. the load generator) can read the port
+    print(f"Listening on {host}:{port}", flush=True)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Hangman games over a line-based JSON protocol.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=7777, help="0 picks a free port")
+    parser.add_argument('--session-timeout', type=float, default=300.0,
+                        help="seconds before an untouched session is dropped")
+    parser.add_argument('--idle-timeout', type=float, default=60.0,
+                        help="seconds before a silent connection is closed")
+    parser.add_argument('--max-sessions', type=int, default=100_000)
+    parser.add_argument('--max-connections', type=int, default=10_000)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
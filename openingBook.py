@@ -0,0 +1,125 @@
+"""Precomputed opening moves for the AI.
+
+The first few guesses of an AI game depend only on the word list, the word
+length and what has been revealed so far, so they can be worked out once.
+The builder plays the live AI against every word in a dictionary for the
+first `depth` guesses and records each decision; AIGame consults the book
+before falling back to live search.
+
+Build a book for the default dictionary:
+    python openingBook.py --words words.txt --depth 3 --out opening_book.json
+"""
+import argparse
+import json
+import os
+import time
+
+BOOK_VERSION = 1
+
+
+def state_key(pattern, guessed_letters):
+    return f"{pattern}/{''.join(sorted(guessed_letters))}"
+
+
+class OpeningBook:
+    """Opening moves for one word list, loaded from path on first lookup."""
+
+    def __init__(self, path=None, fingerprint=None, depth=0, moves=None):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.depth = depth
+        # strategy -> {state_key: letter}
+        self.moves = moves if moves is not None else {}
+        self.loaded = path is None
+
+    def load(self):
+        self.loaded = True
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict) or data.get('version') != BOOK_VERSION:
+            print(f"Warning: Ignoring opening book with unknown format: {self.path}")
+            return False
+        self.fingerprint = data['fingerprint']
+        self.depth = data['depth']
+        self.moves = data['moves']
+        return True
+
+    def lookup(self, fingerprint, strategy, pattern, guessed_letters):
+        """Return the book letter for this position, or None to search live."""
+        if not self.loaded:
+            self.load()
+        if fingerprint != self.fingerprint:
+            return None
+        return self.moves.get(strategy, {}).get(state_key(pattern, guessed_letters))
+
+    def save(self, path=None):
+        path = path or self.path
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump({
+                'version': BOOK_VERSION,
+                'fingerprint': self.fingerprint,
+                'depth': self.depth,
+                'moves': self.moves,
+            }, file, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def __len__(self):
+        return sum(len(moves) for moves in self.moves.values())
+
+
+def build_opening_book(words, depth=3, user_words=True):
+    """Walk the AI's decisions over every word in words to the given depth.
+
+    Dictionary-mode ('frequency') moves are recorded for every word length;
+    with user_words the min-max moves used for player-entered words are
+    recorded too, for the positions those dictionary words lead to.
+    """
+    import hangmanAI
+
+    book = OpeningBook(fingerprint=hangmanAI.get_candidate_index(words).fingerprint, depth=depth)
+    modes = [('frequency', False)] + ([('minimax', True)] if user_words else [])
+    for strategy, is_user_word in modes:
+        moves = book.moves.setdefault(strategy, {})
+        for word in dict.fromkeys(words):
+            # Live search only: the book must not answer its own questions
+            game = hangmanAI.AIGame(words, word, is_user_word=is_user_word, opening_book=OpeningBook())
+            for _ in range(depth):
+                if game.is_over():
+                    break
+                game.update_possible_words()
+                key = state_key(game.pattern, game.guessed_letters)
+                letter = moves.get(key)
+                if letter is None:
+                    letter = game.ai_guess()
+                    if letter is None:
+                        break
+                    moves[key] = letter
+                game.guess_letter(letter)
+    return book
+
+
+def main():
+    from hangmanCore import flatten_words, load_words
+
+    parser = argparse.ArgumentParser(description="Build an opening book for the Hangman AI.")
+    parser.add_argument('--words', default='words.txt', help="dictionary in words.txt format")
+    parser.add_argument('--depth', type=int, default=3, help="number of opening guesses to precompute")
+    parser.add_argument('--out', default='opening_book.json')
+    parser.add_argument('--no-user-words', action='store_true',
+                        help="only record dictionary-mode (frequency) moves")
+    args = parser.parse_args()
+
+    words = flatten_words(load_words(args.words))
+    start = time.perf_counter()
+    book = build_opening_book(words, args.depth, not args.no_user_words)
+    book.save(args.out)
+    print(f"Wrote {len(book)} positions for {len(words)} words to {args.out} "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Bounded memo of AI decisions, optionally persisted to disk.
+
+Entries are keyed by (word-list fingerprint, strategy, revealed pattern,
+guessed letters), which fully determines the candidate set an AIGame sees,
+and store the chosen letter with its partition stats. The cache evicts least
+recently used entries once its estimated size passes max_bytes. It is
+safe to share between threads, e.g. the AI worker filling it while the UI
+thread saves it; file I/O happens outside the lock.
+"""
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+
+CACHE_VERSION = 1
+
+# Fixed per-entry overhead: key/value tuples, their ints and OrderedDict links
+ENTRY_OVERHEAD = 360
+
+
+class PartitionCache:
+    def __init__(self, max_bytes=16 * 1024 * 1024, path=None):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.dirty = False
+        self.lock = threading.Lock()
+        if path is not None:
+            self.load()
+
+    @staticmethod
+    def make_key(fingerprint, strategy, pattern, guessed_letters):
+        return (fingerprint, strategy, pattern, ''.join(sorted(guessed_letters)))
+
+    @staticmethod
+    def entry_size(key):
+        return ENTRY_OVERHEAD + sum(sys.getsizeof(part) for part in key)
+
+    def get(self, key):
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, letter, worst_case, candidates):
+        """Store the letter chosen for key with its worst-case bucket size and candidate count."""
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+            else:
+                self.bytes += self.entry_size(key)
+            self.entries[key] = (letter, worst_case, candidates)
+            self.dirty = True
+            while self.bytes > self.max_bytes and self.entries:
+                old_key, _ = self.entries.popitem(last=False)
+                self.bytes -= self.entry_size(old_key)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.dirty = True
+
+    def stats(self):
+        with self.lock:
+            return {
+                'entries': len(self.entries),
+                'bytes': self.bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+    def _read(self, path):
+        try:
+            with open(path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return []
+        if not isinstance(data, dict) or data.get('version') != CACHE_VERSION:
+            return []
+        return data.get('entries', [])
+
+    def load(self, path=None):
+        """Merge entries from disk; entries already in memory win. Returns the count read."""
+        path = path or self.path
+        rows = self._read(path)
+        with self.lock:
+            self._merge(rows)
+        return len(rows)
+
+    def _merge(self, rows):
+        # Rows are saved least recently used first; walking them newest
+        # first and pushing each to the front keeps that order, behind
+        # everything used this session
+        for fingerprint, strategy, pattern, guessed, letter, worst_case, candidates in reversed(rows):
+            key = (fingerprint, strategy, pattern, guessed)
+            if key not in self.entries:
+                self.entries[key] = (letter, worst_case, candidates)
+                self.entries.move_to_end(key, last=False)
+                self.bytes += self.entry_size(key)
+        while self.bytes > self.max_bytes and self.entries:
+            old_key, _ = self.entries.popitem(last=False)
+            self.bytes -= self.entry_size(old_key)
+
+    def save(self, path=None):
+        """Write the cache to disk, merging what other processes saved meanwhile."""
+        path = path or self.path
+        if path is None:
+            return False
+        saved = self._read(path)
+        with self.lock:
+            self._merge(saved)
+            rows = [list(key) + list(value) for key, value in self.entries.items()]
+            # Cleared now so entries put while writing mark it dirty again
+            self.dirty = False
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.partition-cache-')
+        try:
+            with os.fdopen(fd, 'w') as file:
+                json.dump({'version': CACHE_VERSION, 'entries': rows}, file, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            self.dirty = True
+            raise
+        return True
@@ -0,0 +1,259 @@
+"""Every finished game, kept in SQLite, with leaderboards.
+
+record() turns a finished game into a row (the calculate_final_score
+components, time, hints, streaks, word) and queues it; a writer thread
+inserts queued rows in batches, one transaction each, so the UI never
+waits on the disk. Each leaderboard (overall, per category, per category
+and difficulty, per player, and the AI's own board) has an index ending in
+final_score, so a top-N query reads N index entries however many games are
+stored. The player boards leave out AI games through partial indexes.
+
+    python scoreStore.py --top 10 --category ANIMALS --difficulty EASY
+"""
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+
+SCHEMA_VERSION = 1
+
+COLUMNS = ('played_at', 'mode', 'player', 'word', 'category', 'difficulty', 'won', 'guesses', 'wrong_guesses',
+           'hints_used', 'max_streak', 'game_time', 'base_score', 'time_bonus', 'attempts_bonus',
+           'word_length_bonus', 'no_hint_bonus', 'perfect_bonus', 'final_score')
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    mode TEXT NOT NULL,
+    player TEXT,
+    word TEXT NOT NULL,
+    category TEXT,
+    difficulty TEXT,
+    won INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    wrong_guesses INTEGER NOT NULL,
+    hints_used INTEGER NOT NULL,
+    max_streak INTEGER NOT NULL,
+    game_time INTEGER NOT NULL,
+    base_score INTEGER NOT NULL,
+    time_bonus INTEGER NOT NULL,
+    attempts_bonus INTEGER NOT NULL,
+    word_length_bonus INTEGER NOT NULL,
+    no_hint_bonus INTEGER NOT NULL,
+    perfect_bonus INTEGER NOT NULL,
+    final_score INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_human_leaderboard ON games (category, difficulty, final_score DESC)
+    WHERE mode != 'ai';
+CREATE INDEX IF NOT EXISTS games_human_category ON games (category, final_score DESC) WHERE mode != 'ai';
+CREATE INDEX IF NOT EXISTS games_human_top ON games (final_score DESC) WHERE mode != 'ai';
+CREATE INDEX IF NOT EXISTS games_mode ON games (mode, final_score DESC);
+CREATE INDEX IF NOT EXISTS games_player ON games (player, final_score DESC);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+INSERT = f"INSERT INTO games ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})"
+
+
+def game_row(game, mode, player=None, played_at=None):
+    """The games row for a finished game, in COLUMNS order."""
+    breakdown = game.score_breakdown()
+    return (time.time() if played_at is None else played_at, mode, player, game.word, game.category,
+            game.difficulty, int(game.is_word_guessed()), len(game.guessed_letters), game.wrong_guesses,
+            game.hints_used, game.max_streak, game.get_time_played(), breakdown['base_score'],
+            breakdown['time_bonus'], breakdown['attempts_bonus'], breakdown['word_length_bonus'],
+            breakdown['no_hint_bonus'], breakdown['perfect_bonus'], breakdown['final_score'])
+
+
+class ScoreStore:
+    def __init__(self, path='scores.db', batch_size=512, flush_interval=0.5):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        # Rows, or an Event for flush()/close() to wait on
+        self.queue = queue.Queue()
+        self.local = threading.local()
+        self.closed = False
+        connection = self.connect()
+        try:
+            connection.executescript(SCHEMA)
+        finally:
+            connection.close()
+        self.writer = threading.Thread(target=self._write_loop, name='score-writer', daemon=True)
+        self.writer.start()
+
+    def connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        # WAL lets leaderboard reads run while the writer commits
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def reader(self):
+        """This thread's read connection (sqlite3 connections are per thread)."""
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.local.connection = self.connect()
+            connection.row_factory = sqlite3.Row
+        return connection
+
+    # Writing
+
+    def record(self, game, mode, player=None):
+        """Queue a finished game; returns immediately."""
+        self.add_rows([game_row(game, mode, player)])
+
+    def add_rows(self, rows):
+        if self.closed:
+            raise ValueError("score store is closed")
+        for row in rows:
+            self.queue.put(row)
+
+    def _write_loop(self):
+        connection = self.connect()
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            waiters = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                if isinstance(batch[-1], threading.Event):
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            rows = []
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    rows.append(item)
+            if rows:
+                try:
+                    with connection:
+                        connection.executemany(INSERT, rows)
+                except sqlite3.Error as error:
+                    print(f"Warning: Could not save {len(rows)} game results: {error}")
+            for waiter in waiters:
+                running = running and not self.closed
+                waiter.set()
+        connection.close()
+
+    def flush(self, timeout=None):
+        """Wait until every game recorded so far has been written."""
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout=5.0):
+        """Write what is queued and stop the writer."""
+        if self.closed:
+            return
+        self.closed = True
+        self.flush(timeout)
+        self.writer.join(timeout)
+        connection = getattr(self.local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self.local.connection = None
+
+    # Reading
+
+    def leaderboard(self, category=None, difficulty=None, limit=10):
+        """Top games played by people, best first, as sqlite3.Row objects.
+
+        With no category the leaderboard is over every category; difficulty
+        only applies together with a category. AI games are on ai_leaderboard().
+        """
+        # mode != 'ai' is spelled out literally so SQLite can use the partial indexes
+        if category is None:
+            return self.reader().execute(
+                "SELECT * FROM games WHERE mode != 'ai' ORDER BY final_score DESC LIMIT ?", (limit,)).fetchall()
+        if difficulty is None:
+            return self.reader().execute(
+                "SELECT * FROM games WHERE mode != 'ai' AND category = ? ORDER BY final_score DESC LIMIT ?",
+                (category, limit)).fetchall()
+        return self.reader().execute(
+            "SELECT * FROM games WHERE mode != 'ai' AND category = ? AND difficulty = ? "
+            "ORDER BY final_score DESC LIMIT ?", (category, difficulty, limit)).fetchall()
+
+    def ai_leaderboard(self, limit=10):
+        return self.reader().execute(
+            "SELECT * FROM games WHERE mode = 'ai' ORDER BY final_score DESC LIMIT ?", (limit,)).fetchall()
+
+    def player_best(self, player, limit=10):
+        return self.reader().execute(
+            "SELECT * FROM games WHERE player = ? ORDER BY final_score DESC LIMIT ?", (player, limit)).fetchall()
+
+    def summary(self, category=None, difficulty=None, ai=False):
+        """Games, wins, mean and best final score, best streak and mean time.
+
+        Covers games played by people, or only AI games if ai is set.
+        """
+        where, args = ["mode = 'ai'" if ai else "mode != 'ai'"], []
+        for column, value in (('category', category), ('difficulty', difficulty)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                args.append(value)
+        row = self.reader().execute(
+            "SELECT COUNT(*) AS games, COALESCE(SUM(won), 0) AS wins, AVG(final_score) AS mean_score, "
+            "MAX(final_score) AS best_score, MAX(max_streak) AS best_streak, AVG(game_time) AS mean_time "
+            "FROM games WHERE " + " AND ".join(where), args).fetchone()
+        return dict(row)
+
+
+_store = None
+
+
+def get_score_store(path='scores.db'):
+    """The shared store, opened on first use (path only applies then)."""
+    global _store
+    if _store is None:
+        _store = ScoreStore(path)
+    return _store
+
+
+def close_score_store():
+    """Flush and close the shared store if it was opened."""
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show leaderboards from the game results database.")
+    parser.add_argument('--db', default='scores.db')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--category')
+    parser.add_argument('--difficulty')
+    parser.add_argument('--player')
+    parser.add_argument('--ai', action='store_true', help="show the AI's games instead of the players'")
+    args = parser.parse_args()
+
+    store = ScoreStore(args.db)
+    try:
+        start = time.perf_counter()
+        if args.player:
+            rows = store.player_best(args.player, args.top)
+        elif args.ai:
+            rows = store.ai_leaderboard(args.top)
+        else:
+            rows = store.leaderboard(args.category, args.difficulty, args.top)
+        elapsed = time.perf_counter() - start
+        summary = store.summary(args.category, args.difficulty, args.ai)
+    finally:
+        store.close()
+
+    print(f"{summary['games']} games, {summary['wins']} won, best streak {summary['best_streak'] or 0}")
+    for rank, row in enumerate(rows, 1):
+        print(f"{rank:>3}. {row['final_score']:>5}  {row['word']:<16} {row['player'] or row['mode']:<16} "
+              f"{row['category'] or '-'}:{row['difficulty'] or '-'}")
+    print(f"({elapsed * 1000:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
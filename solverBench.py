@@ -0,0 +1,150 @@
+"""Batch benchmark of the AI strategies over whole dictionaries, without the UI.
+
+Every selected strategy plays every word of each word list and the run
+reports win rate, mean and p99 guesses, the wrong-guess distribution,
+per-move latency percentiles and peak memory as JSON, so results can be
+compared across commits.
+
+    python solverBench.py                               # all strategies, words.txt
+    python solverBench.py --words big.txt --strategies frequency,entropy --out run.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+import hangmanAI
+from hangmanCore import play
+from partitionCache import PartitionCache
+import wordStore
+
+
+def load_word_list(path):
+    """WordStore of the unique valid words in a words.txt-style file or plain list (optionally .gz)."""
+    return wordStore.ingest(path)[0]
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def summarize(results, strategy, max_attempts=7):
+    """Aggregate (won, guesses, wrong) tuples and the strategy's latencies."""
+    games = len(results)
+    guesses = sorted(result[1] for result in results)
+    wrong_distribution = {str(n): 0 for n in range(max_attempts + 1)}
+    for _, _, wrong in results:
+        wrong_distribution[str(wrong)] += 1
+    return {
+        'games': games,
+        'wins': sum(1 for result in results if result[0]),
+        'win_rate': sum(1 for result in results if result[0]) / games if games else 0.0,
+        'mean_guesses': sum(guesses) / games if games else 0.0,
+        'p99_guesses': percentile(guesses, 0.99),
+        'wrong_guess_distribution': wrong_distribution,
+        'latency': strategy.latency_stats(),
+    }
+
+
+def solve_words(word_list, targets, strategy, is_user_word=False, partition_cache=None):
+    """Play strategy against each target word; returns (won, guesses, wrong) per game."""
+    results = []
+    for word in targets:
+        game = hangmanAI.AIGame(word_list, word, is_user_word=is_user_word, strategy=strategy,
+                                partition_cache=partition_cache)
+        play(game, hangmanAI.ai_guesser)
+        results.append((game.is_word_guessed(), len(game.guessed_letters), game.wrong_guesses))
+    return results
+
+
+def peak_rss_bytes():
+    if resource is None:
+        return None
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(path, strategy_names, limit=None, is_user_word=False, trace_memory=False, cache=True):
+    word_list = load_word_list(path)
+    targets = word_list[:limit] if limit else word_list
+    report = {'words_file': path, 'dictionary_size': len(word_list), 'targets': len(targets), 'strategies': {}}
+
+    start = time.perf_counter()
+    hangmanAI.get_candidate_index(word_list)
+    report['index_build_s'] = time.perf_counter() - start
+
+    for name in strategy_names:
+        strategy = hangmanAI.make_strategy(name)
+        partition_cache = PartitionCache() if cache else PartitionCache(max_bytes=0)
+        if trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        results = solve_words(word_list, targets, strategy, is_user_word, partition_cache)
+        elapsed = time.perf_counter() - start
+        summary = summarize(results, strategy)
+        summary['elapsed_s'] = elapsed
+        if trace_memory:
+            summary['peak_traced_bytes'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        report['strategies'][name] = summary
+        print(f"{path}: {name:<15} win {summary['win_rate']:.1%}  guesses {summary['mean_guesses']:.2f} "
+              f"(p99 {summary['p99_guesses']})  move p99 {summary['latency']['p99_ms']:.3f} ms  "
+              f"{elapsed:.1f}s", file=sys.stderr)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the AI strategies over whole dictionaries.")
+    parser.add_argument('--words', action='append',
+                        help="word list to solve (repeatable; words.txt format or one word per line)")
+    parser.add_argument('--strategies', default=','.join(hangmanAI.STRATEGIES))
+    parser.add_argument('--limit', type=int, default=None, help="only solve the first N words of each list")
+    parser.add_argument('--user-words', action='store_true',
+                        help="play as if each word were entered by a user (no dictionary filtering)")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="report per-strategy peak Python allocations (slower)")
+    parser.add_argument('--no-cache', action='store_true', help="disable the min-max partition cache")
+    parser.add_argument('--out', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    strategy_names = [name.strip() for name in args.strategies.split(',') if name.strip()]
+    runs = [run_benchmark(path, strategy_names, args.limit, args.user_words, args.trace_memory,
+                          not args.no_cache)
+            for path in (args.words or ['words.txt'])]
+
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'mode': 'user-words' if args.user_words else 'dictionary',
+        'runs': runs,
+        'peak_rss_bytes': peak_rss_bytes(),
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from hangmanAI import AIGame, CandidateIndex, ai_guesser, make_strategy
+from hangmanCore import play
+from openingBook import OpeningBook
+from partitionCache import PartitionCache
+
+
+def random_words(count, seed):
+    rng = random.Random(seed)
+    letters = 'EEEAAARRIIOOTTNNSSLCUDPMHGBFYWKVXZJQ'
+    return sorted({''.join(rng.choice(letters) for _ in range(rng.randint(3, 8))) for _ in range(count)})
+
+
+def legacy_filter(words, length, pattern, wrong_letters):
+    """The list filter update_possible_words used before the bitset index."""
+    words = [w for w in words if len(w) == length]
+    words = [w for w in words if all((c == '_' or w[i] == c) for i, c in enumerate(pattern))]
+    return [w for w in words if not any(c in wrong_letters for c in w)]
+
+
+def test_bitset_filter_matches_list_filter():
+    words = random_words(2000, seed=1)
+    index = CandidateIndex(words)
+    rng = random.Random(2)
+    for _ in range(300):
+        word = rng.choice(words)
+        guessed = set(rng.sample('ABCDEFGHIJKLMNOPQRSTUVWXYZ', rng.randint(0, 12)))
+        pattern = ''.join(c if c in guessed else '_' for c in word)
+        wrong_letters = guessed - set(word)
+        bucket = index.bucket(len(word))
+        assert bucket.select(bucket.filter(pattern, wrong_letters)) == \
+            legacy_filter(words, len(word), pattern, wrong_letters)
+
+
+def guesses(game):
+    sequence = []
+
+    def guesser(game):
+        letter = ai_guesser(game)
+        sequence.append(letter)
+        return letter
+
+    play(game, guesser)
+    return sequence
+
+
+@pytest.mark.parametrize('strategy', ['frequency', 'minimax', 'entropy', 'expected-wrong'])
+def test_guess_sequences_match_list_filter(strategy):
+    words = random_words(1500, seed=3)
+    for word in random.Random(4).sample(words, 25):
+        def new_game():
+            return AIGame(words, word, partition_cache=PartitionCache(), opening_book=OpeningBook(),
+                          strategy=make_strategy(strategy))
+
+        indexed = new_game()
+        listed = new_game()
+        # Replacing the list sends the game down the plain list filter
+        listed.possible_words = [w for w in words if len(w) == len(word)]
+        assert guesses(indexed) == guesses(listed)
@@ -0,0 +1,60 @@
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+from hangmanGame import EventLoop, profiler
+
+
+@pytest.fixture
+def event_loop():
+    pygame.display.init()
+    pygame.display.set_mode((100, 100))
+    pygame.event.get()
+    profiler.set_enabled(True)
+    try:
+        yield EventLoop()
+    finally:
+        profiler.set_enabled(False)
+        profiler.frame_spans.clear()
+        pygame.display.quit()
+
+
+def post_key():
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+
+
+def test_nested_screen_frames_are_not_charged_to_the_outer_handler(event_loop):
+    def nested_screen():
+        for _ in range(5):
+            post_key()
+            for _ in event_loop.wait(1):
+                time.sleep(0.02)
+
+    post_key()
+    for _ in event_loop.wait(1):
+        nested_screen()
+    event_loop.wait(1)
+
+    handling = [frame['event_handling'][0] for frame in profiler.frame_spans if 'event_handling' in frame]
+    assert len(handling) >= 6
+    assert max(handling) < 0.05
+    assert event_loop.handling == []
+
+
+def test_handling_span_closes_when_the_screen_returns(event_loop):
+    def screen():
+        post_key()
+        for _ in event_loop.wait(1):
+            time.sleep(0.01)
+            return
+
+    screen()
+    event_loop.wait(1)
+    seconds, calls = profiler.frame_spans[-1]['event_handling']
+    assert calls == 1 and seconds >= 0.01
+    assert event_loop.handling == []
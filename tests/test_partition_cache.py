@@ -0,0 +1,68 @@
+import threading
+
+from partitionCache import PartitionCache
+
+
+def make_key(pattern):
+    return ('fingerprint', 'minimax', pattern, '')
+
+
+def test_save_load_keeps_lru_order(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    cache = PartitionCache()
+    patterns = ['_', '__', '___', '____', '']
+    for pattern in patterns:
+        cache.put(make_key(pattern), 'E', 1, 2)
+    cache.save(path)
+
+    reloaded = PartitionCache(path=path)
+    assert [key[2] for key in reloaded.entries] == patterns
+
+
+def test_reload_evicts_least_recently_used(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    cache = PartitionCache()
+    patterns = ['_', '__', '___', '____', '']
+    for pattern in patterns:
+        cache.put(make_key(pattern), 'E', 1, 2)
+    cache.save(path)
+
+    newest = patterns[-3:]
+    limit = sum(PartitionCache.entry_size(make_key(pattern)) for pattern in newest)
+    small = PartitionCache(max_bytes=limit, path=path)
+    assert [key[2] for key in small.entries] == newest
+
+
+def test_disk_entries_rank_behind_this_sessions(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    cache = PartitionCache()
+    cache.put(make_key('_'), 'E', 1, 2)
+    cache.put(make_key('__'), 'A', 1, 2)
+    cache.save(path)
+
+    other = PartitionCache()
+    other.put(make_key('___'), 'S', 1, 2)
+    other.load(path)
+    assert [key[2] for key in other.entries] == ['_', '__', '___']
+
+
+def test_save_while_another_thread_puts(tmp_path):
+    path = str(tmp_path / 'cache.json')
+    cache = PartitionCache(max_bytes=2000 * PartitionCache.entry_size(make_key('_' * 8)))
+    stop = threading.Event()
+
+    def fill():
+        count = 0
+        while not stop.is_set():
+            cache.put(make_key(format(count, 'x')), 'E', 1, 2)
+            count += 1
+
+    worker = threading.Thread(target=fill)
+    worker.start()
+    try:
+        for _ in range(20):
+            cache.save(path)
+    finally:
+        stop.set()
+        worker.join()
+    assert cache.entries
@@ -0,0 +1,40 @@
+import shutil
+
+import pytest
+
+import hangmanServer
+import wordRepository
+
+
+@pytest.fixture(scope='module')
+def server(tmp_path_factory):
+    # A copy of the word files, so words.bin is compiled next to them and not in the repo
+    directory = tmp_path_factory.mktemp('words')
+    for name in ('words.txt', 'words_with_hints.txt'):
+        shutil.copy(name, directory / name)
+    repository = wordRepository.WordRepository(str(directory / 'words.txt'), str(directory / 'words_with_hints.txt'))
+    return hangmanServer.GameServer(repository)
+
+
+def new_game(server, **fields):
+    response = server.dispatch(dict(op='new', **fields))
+    assert response['ok']
+    return response
+
+
+def test_state_shows_category(server):
+    response = new_game(server, category='COLORS', difficulty='EASY')
+    assert response['state']['category'] == 'COLORS'
+
+
+@pytest.mark.parametrize('fields', [{'category': 'COLORS', 'difficulty': 'EXPERT'}, {'category': 'EXPERT'}])
+def test_expert_games_hide_category_and_refuse_hints(server, fields):
+    response = new_game(server, **fields)
+    session = response['session']
+    assert 'category' not in response['state']
+    server.sessions[session].game.score = 100
+    hint = server.dispatch({'op': 'hint', 'session': session})
+    assert hint == {'ok': False, 'error': "no hints in expert games"}
+    state = server.dispatch({'op': 'guess', 'session': session, 'letter': 'E'})['state']
+    assert 'category' not in state
+    assert 'category' not in server.dispatch({'op': 'end', 'session': session})['state']
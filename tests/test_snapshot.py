@@ -0,0 +1,92 @@
+import pytest
+
+import hangmanCore
+from hangmanAI import AIGame, ai_guesser
+from hangmanCore import SNAPSHOT, HangmanGame, ManualClock, play
+from openingBook import OpeningBook
+from partitionCache import PartitionCache
+
+STATE = ('word', 'category', 'difficulty', 'hint', 'guessed_mask', 'correct_mask', 'pattern', 'display',
+         'hidden_count', 'wrong_guesses', 'max_attempts', 'score', 'hints_used', 'current_streak', 'max_streak',
+         'consecutive_wrong', 'game_time')
+
+
+def played_game():
+    clock = ManualClock(1000)
+    game = HangmanGame('ELEPHANT', 'ANIMALS', 'HARD', 'Big ears', clock=clock)
+    for letter in 'EAZPQT':
+        clock.advance(1500)
+        game.guess_letter(letter)
+    game.use_hint()
+    return game, clock
+
+
+def state(game):
+    return {name: getattr(game, name) for name in STATE}
+
+
+def test_snapshot_is_fixed_size():
+    game, _ = played_game()
+    assert len(game.snapshot()) == SNAPSHOT.size == 44
+
+
+def test_snapshot_round_trip():
+    game, clock = played_game()
+    data = game.snapshot()
+
+    restored = HangmanGame.restore(data, game.category, game.hint, clock=clock)
+    assert state(restored) == state(game)
+    assert restored.guessed_letters == game.guessed_letters
+    assert restored.get_time_played() == game.get_time_played()
+    assert restored.snapshot() == data
+
+    # Play carries on from the restored state
+    assert restored.guess_letter('L') == game.guess_letter('L')
+    assert state(restored) == state(game)
+
+
+def test_restore_refuses_subclasses():
+    game, _ = played_game()
+    with pytest.raises(TypeError):
+        AIGame.restore(game.snapshot())
+
+
+def test_load_snapshot_into_ai_game():
+    words = ['ELEPHANT', 'ANTELOPE', 'ELEGANCE', 'PLATYPUS', 'CAT']
+
+    def ai_game(word, clock):
+        return AIGame(words, word, partition_cache=PartitionCache(), opening_book=OpeningBook(),
+                      category='ANIMALS', difficulty='HARD', hint='Big ears', clock=clock)
+
+    clock = ManualClock(1000)
+    game = ai_game('ELEPHANT', clock)
+    for _ in range(2):
+        game.guess_letter(ai_guesser(game))
+    data = game.snapshot()
+
+    restored = ai_game('CAT', ManualClock(5000))
+    restored.load_snapshot(data)
+    assert state(restored) == state(game)
+    assert restored.snapshot() == data
+
+    # The AI keeps playing from the restored position exactly as it would have
+    play(game, ai_guesser)
+    play(restored, ai_guesser)
+    assert restored.guessed_letters == game.guessed_letters
+    assert restored.is_word_guessed() == game.is_word_guessed()
+
+
+def test_restore_rejects_unknown_difficulty_code():
+    game, _ = played_game()
+    data = bytearray(game.snapshot())
+    data[1 + hangmanCore.SNAPSHOT_WORD_BYTES] = len(hangmanCore.DIFFICULTY_CODES)
+    with pytest.raises(ValueError, match="difficulty"):
+        HangmanGame.restore(bytes(data))
+
+
+def test_restore_rejects_other_versions():
+    game, _ = played_game()
+    data = bytearray(game.snapshot())
+    data[0] += 1
+    with pytest.raises(ValueError, match="version"):
+        HangmanGame.restore(bytes(data))
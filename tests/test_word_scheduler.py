@@ -0,0 +1,20 @@
+import random
+
+from wordScheduler import WordPool
+
+WORDS = ['ANT', 'BEE', 'CAT', 'DOG', 'EEL']
+
+
+def test_every_word_can_open_a_session():
+    first = {WordPool(WORDS, random.Random(seed)).next() for seed in range(200)}
+    assert first == set(WORDS)
+
+
+def test_passes_use_every_word_and_never_repeat_across_the_boundary():
+    pool = WordPool(WORDS, random.Random(0))
+    previous = None
+    for _ in range(50):
+        picks = [pool.next() for _ in WORDS]
+        assert sorted(picks) == WORDS
+        assert picks[0] != previous
+        previous = picks[-1]
@@ -0,0 +1,168 @@
+"""Parallel AI tournament over a dictionary.
+
+The word list is split into chunks that a process pool solves with each
+strategy. The list is written once to shared memory in WordStore layout
+(word offsets, then the word bytes), and each worker attaches a read-only
+WordStore to that block without copying it, so the words exist once however
+many workers run. The candidate index bitsets are Python ints, which can't
+live in shared memory, so each worker still builds its own index (once, in
+its initializer) over the shared words. Tasks only carry a strategy name and
+word positions; results stream back as chunks finish and are aggregated with
+the same summary as solverBench.
+
+    python tournament.py --words words.txt --workers 1,2,4,8 --out tournament.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+import hangmanAI
+import wordStore
+from solverBench import git_revision, load_word_list, solve_words, summarize
+
+# Set in each worker by _init_worker; the block stays attached for the
+# worker's lifetime since _word_list reads straight from it
+_shm = None
+_word_list = None
+
+
+def _init_worker(shm_name, count, size):
+    global _shm, _word_list
+    _shm = SharedMemory(name=shm_name)
+    offsets_size = 4 * (count + 1)
+    _word_list = wordStore.WordStore.attach(_shm.buf[:offsets_size], _shm.buf[offsets_size:size])
+    # Built once per worker and reused by every chunk
+    hangmanAI.get_candidate_index(_word_list)
+
+
+def _solve_chunk(task):
+    strategy_name, positions, is_user_word = task
+    strategy = hangmanAI.make_strategy(strategy_name)
+    results = solve_words(_word_list, [_word_list[i] for i in positions], strategy, is_user_word)
+    return strategy_name, positions, results, strategy.latencies_ms
+
+
+def share_words(words):
+    """Copy words, in order, into a new shared memory block in WordStore layout.
+
+    Returns (block, used size); the block starts with len(words) + 1 uint32
+    offsets followed by the encoded words.
+    """
+    offsets = array('I', [0])
+    data = bytearray()
+    for word in words:
+        data += word.encode('utf-8')
+        offsets.append(len(data))
+    header = offsets.tobytes()
+    size = len(header) + len(data)
+    shm = SharedMemory(create=True, size=size)
+    shm.buf[:len(header)] = header
+    shm.buf[len(header):size] = data
+    return shm, size
+
+
+def iter_chunk_results(words, strategy_names, workers, chunk_size=256, is_user_word=False, targets=None):
+    """Yield (strategy, positions, results, latencies) for each chunk as it finishes.
+
+    Every word is played unless targets (positions in words) is given;
+    either way the whole list is the AI's dictionary. results[i] is the
+    (won, guesses, wrong) tuple for words[positions[i]].
+    """
+    shm, size = share_words(words)
+    targets = range(len(words)) if targets is None else targets
+    tasks = [(name, targets[start:start + chunk_size], is_user_word)
+             for name in strategy_names
+             for start in range(0, len(targets), chunk_size)]
+    try:
+        with Pool(workers, initializer=_init_worker, initargs=(shm.name, len(words), size)) as pool:
+            yield from pool.imap_unordered(_solve_chunk, tasks)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def chunk_count(targets, strategy_names, chunk_size):
+    return len(strategy_names) * -(-len(targets) // chunk_size)
+
+
+def run_tournament(words, strategy_names, workers, chunk_size=256, is_user_word=False, progress=True):
+    """Solve every word with every strategy on `workers` processes.
+
+    Returns {strategy: summary} plus the elapsed wall time in seconds.
+    """
+    results = {name: [] for name in strategy_names}
+    latency = {name: hangmanAI.make_strategy(name) for name in strategy_names}
+    total = chunk_count(words, strategy_names, chunk_size)
+
+    start_time = time.perf_counter()
+    chunks = iter_chunk_results(words, strategy_names, workers, chunk_size, is_user_word)
+    for done, (name, _, chunk_results, latencies) in enumerate(chunks, 1):
+        results[name].extend(chunk_results)
+        latency[name].latencies_ms.extend(latencies)
+        if progress:
+            print(f"\r{workers} workers: {done}/{total} chunks", end='', file=sys.stderr)
+    elapsed = time.perf_counter() - start_time
+    if progress:
+        print(file=sys.stderr)
+
+    return {name: summarize(results[name], latency[name]) for name in strategy_names}, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the AI strategies over a dictionary on a process pool.")
+    parser.add_argument('--words', default='words.txt',
+                        help="word list to solve (words.txt format or one word per line)")
+    parser.add_argument('--strategies', default=','.join(hangmanAI.STRATEGIES))
+    parser.add_argument('--workers', default=str(os.cpu_count() or 1),
+                        help="worker count, or a comma-separated list to measure scaling")
+    parser.add_argument('--chunk-size', type=int, default=256)
+    parser.add_argument('--limit', type=int, default=None, help="only solve the first N words")
+    parser.add_argument('--user-words', action='store_true',
+                        help="play as if each word were entered by a user (no dictionary filtering)")
+    parser.add_argument('--out', help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    words = load_word_list(args.words)
+    if args.limit:
+        words = words[:args.limit]
+    strategy_names = [name.strip() for name in args.strategies.split(',') if name.strip()]
+    worker_counts = [int(count) for count in args.workers.split(',')]
+
+    scaling = []
+    summaries = None
+    for workers in worker_counts:
+        summaries, elapsed = run_tournament(words, strategy_names, workers, args.chunk_size, args.user_words)
+        scaling.append({'workers': workers, 'elapsed_s': elapsed,
+                        'games_per_s': len(words) * len(strategy_names) / elapsed})
+
+    baseline = scaling[0]
+    for row in scaling:
+        row['speedup'] = baseline['elapsed_s'] / row['elapsed_s']
+        row['efficiency'] = row['speedup'] * baseline['workers'] / row['workers']
+        print(f"{row['workers']:>3} workers  {row['elapsed_s']:8.2f}s  {row['games_per_s']:10.0f} games/s  "
+              f"speedup {row['speedup']:.2f}x  efficiency {row['efficiency']:.0%}", file=sys.stderr)
+
+    report = {
+        'revision': git_revision(),
+        'words_file': args.words,
+        'words': len(words),
+        'mode': 'user-words' if args.user_words else 'dictionary',
+        'cpu_count': os.cpu_count(),
+        'scaling': scaling,
+        'strategies': summaries,
+    }
+    output = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, 'w') as file:
+            file.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
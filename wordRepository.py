@@ -0,0 +1,165 @@
+"""Process-wide, in-memory word lists shared by every game mode.
+
+The repository loads words.txt and words_with_hints.txt once (through the
+compiled file from compiledWords) and keeps the category/difficulty lists,
+hints, the flattened list used by the AI and a few indexes in memory, so
+entering a mode does no I/O. refresh() checks the source files for changes
+by mtime and size, confirms with a content hash, and reloads if needed.
+"""
+import hashlib
+import os
+from array import array
+
+import compiledWords
+import wordStore
+
+LETTER_BITS = {chr(ord('A') + i): 1 << i for i in range(26)}
+
+
+def letter_mask(letters):
+    mask = 0
+    for letter in letters:
+        mask |= LETTER_BITS.get(letter.upper(), 0)
+    return mask
+
+
+class WordRepository:
+    def __init__(self, words_path='words.txt', hints_path='words_with_hints.txt'):
+        self.words_path = words_path
+        self.hints_path = hints_path
+        self.signature = None
+        self.digest = None
+        self.generation = 0
+        self.load()
+
+    def _stat_signature(self):
+        signature = []
+        for path in (self.words_path, self.hints_path):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _content_digest(self):
+        digest = hashlib.blake2b(digest_size=16)
+        for path in (self.words_path, self.hints_path):
+            try:
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+            except OSError:
+                pass
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def load(self, recompile=False):
+        if recompile:
+            compiledWords.compile_words(self.words_path, self.hints_path,
+                                        compiledWords.compiled_path_for(self.words_path))
+        compiled = compiledWords.open_words(self.words_path, self.hints_path)
+        # Each distinct word is stored once; categories, the flat list and
+        # query results are id views into the store
+        self.store = store = wordStore.WordStore()
+        order = array('I')
+        try:
+            self.categories = {}
+            self.hints = {}
+            self._groups = {}
+            for category in compiled:
+                data = compiled[category]
+                groups = data.items() if isinstance(data, dict) else [(None, data)]
+                category_hints = self.hints.setdefault(category, {})
+                for difficulty, group in groups:
+                    ids = array('I')
+                    for i, word in enumerate(group):
+                        ids.append(store.intern(word)[0])
+                        hint = group.hint(i)
+                        if hint is not None:
+                            category_hints[word] = hint
+                    self._groups[category, difficulty] = range(len(order), len(order) + len(ids))
+                    order.extend(ids)
+                    if difficulty is None:
+                        self.categories[category] = store.view(ids)
+                    else:
+                        self.categories.setdefault(category, {})[difficulty] = store.view(ids)
+        finally:
+            compiled.close()
+        # Every word in file order, duplicates included, like flatten_words()
+        self.all_words = store.view(order)
+
+        self._masks = array('I', (letter_mask(word) for word in store))
+        self._lengths = {}
+        for position, word_id in enumerate(order):
+            self._lengths.setdefault(len(store[word_id]), array('I')).append(position)
+
+        # Lists the game modes used to rebuild on every entry
+        self.playable_categories = [category for category in self.categories
+                                    if category not in ('EXPERT', 'RANDOM')]
+        expert_ids = array('I')
+        for category in self.playable_categories:
+            if isinstance(self.categories[category], dict) and 'HARD' in self.categories[category]:
+                expert_ids.extend(self.categories[category]['HARD'].ids)
+        self.expert_words = store.view(expert_ids)
+
+        self.signature = self._stat_signature()
+        self.digest = self._content_digest()
+        self.generation += 1
+
+    def refresh(self):
+        """Reload if the source files changed; returns True if they did."""
+        signature = self._stat_signature()
+        if signature == self.signature:
+            return False
+        digest = self._content_digest()
+        if digest == self.digest:
+            # Touched but not edited
+            self.signature = signature
+            return False
+        # The content changed, so don't trust words.bin's mtime either
+        self.load(recompile=True)
+        return True
+
+    def get_hint(self, category, word):
+        return self.hints.get(category, {}).get(word)
+
+    def query(self, category=None, difficulty=None, length=None, including='', excluding=''):
+        """View of the words matching every given filter, in file order.
+
+        including/excluding are letters that must / must not appear.
+        """
+        order = self.all_words.ids
+        positions = None
+        if category is not None or difficulty is not None:
+            positions = [position for (group_category, group_difficulty), group in self._groups.items()
+                         if category in (None, group_category) and difficulty in (None, group_difficulty)
+                         for position in group]
+        if length is not None:
+            by_length = self._lengths.get(length, ())
+            if positions is None:
+                positions = by_length
+            else:
+                of_length = set(by_length)
+                positions = [p for p in positions if p in of_length]
+        if positions is None:
+            positions = range(len(order))
+
+        include_mask = letter_mask(including)
+        exclude_mask = letter_mask(excluding)
+        if include_mask or exclude_mask:
+            masks = self._masks
+            positions = [p for p in positions
+                         if masks[order[p]] & include_mask == include_mask and not masks[order[p]] & exclude_mask]
+        return self.all_words.view(positions)
+
+
+_repositories = {}
+
+
+def get_repository(words_path='words.txt', hints_path='words_with_hints.txt'):
+    """The shared repository for these files, loaded on first use."""
+    key = (words_path, hints_path)
+    repository = _repositories.get(key)
+    if repository is None:
+        repository = _repositories[key] = WordRepository(words_path, hints_path)
+    return repository
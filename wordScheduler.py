@@ -0,0 +1,92 @@
+"""Hands out words for a play session without repeats.
+
+Each pool (a category/difficulty list, a flat category, the EXPERT union of
+every HARD list, or the AI's whole dictionary) keeps a permutation of its
+word positions and a cursor. Every pick does one step of a Fisher-Yates
+shuffle, so it is O(1), and no word comes back until the pool has been
+used up. The next pass never starts with the word that ended the last one.
+"""
+import random
+from array import array
+
+import wordRepository
+
+
+class WordPool:
+    def __init__(self, words, rng):
+        self.words = words
+        self.rng = rng
+        self.order = array('I', range(len(words)))
+        self.cursor = 0
+        # Completed passes over the pool
+        self.passes = 0
+
+    def __len__(self):
+        return len(self.words)
+
+    def next(self):
+        order = self.order
+        count = len(order)
+        if not count:
+            raise IndexError("cannot pick from an empty word pool")
+        if self.cursor == count:
+            self.cursor = 0
+            self.passes += 1
+        cursor = self.cursor
+        # After a full pass, order[count - 1] was its last pick
+        end = count - 1 if cursor == 0 and self.passes and count > 1 else count
+        j = self.rng.randrange(cursor, end)
+        order[cursor], order[j] = order[j], order[cursor]
+        self.cursor += 1
+        return self.words[order[cursor]]
+
+
+class WordScheduler:
+    """Per-session word pools over a WordRepository."""
+
+    def __init__(self, repository=None, seed=None):
+        self.repository = repository or wordRepository.get_repository()
+        self.rng = random.Random(seed)
+        self.pools = {}
+        self.generation = self.repository.generation
+
+    def pool(self, key, words):
+        if self.generation != self.repository.generation:
+            # The word files were reloaded; the old positions no longer apply
+            self.pools.clear()
+            self.generation = self.repository.generation
+        pool = self.pools.get(key)
+        if pool is None:
+            pool = self.pools[key] = WordPool(words, self.rng)
+        return pool
+
+    def next_word(self, category=None, difficulty=None):
+        """Next word from a category/difficulty list.
+
+        difficulty 'EXPERT' draws from every HARD list outside EXPERT and
+        RANDOM; a category without difficulties ignores difficulty.
+        """
+        if difficulty == 'EXPERT':
+            # One pool whatever category is selected
+            category = None
+            words = self.repository.expert_words
+        else:
+            words = self.repository.categories[category]
+            if isinstance(words, dict):
+                words = words[difficulty]
+        return self.pool((category, difficulty), words).next()
+
+    def next_dictionary_word(self):
+        """Next word from the whole dictionary, as the AI plays it."""
+        return self.pool('*', self.repository.all_words).next()
+
+
+_scheduler = None
+
+
+def get_scheduler(seed=None):
+    """The session's scheduler, created on first use (seed only applies then)."""
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = WordScheduler(seed=seed)
+    return _scheduler
@@ -0,0 +1,255 @@
+"""Streaming ingest of large dictionaries into a compact word store.
+
+iter_dictionary() reads a word file one line at a time, following the
+[CATEGORY:DIFFICULTY] / [CATEGORY] section syntax of words.txt (files
+without sections are plain lists), and yields normalized words that pass
+the same rule play_ai_mode applies to entered words: letters A-Z only,
+3 to 15 long. ingest() feeds that stream into a WordStore, which keeps every
+word once in a single bytearray with an offset array and a hash table of
+word ids for de-duplication, so memory grows with the stored bytes rather
+than with Python objects, and never with the size of the input.
+
+    python wordStore.py big_dictionary.txt
+"""
+import argparse
+import gzip
+import time
+import tracemalloc
+from array import array
+from collections.abc import Sequence
+
+MIN_WORD_LENGTH = 3
+MAX_WORD_LENGTH = 15
+
+
+def normalize_word(line):
+    """Upper-cased word, or None if it isn't 3-15 letters A-Z."""
+    word = line.strip().upper()
+    if MIN_WORD_LENGTH <= len(word) <= MAX_WORD_LENGTH and word.isascii() and word.isalpha():
+        return word
+    return None
+
+
+def open_dictionary(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8', errors='replace')
+    return open(path, 'r', encoding='utf-8', errors='replace')
+
+
+def iter_dictionary(lines, stats=None):
+    """Yield (category, difficulty, word) for each valid word in lines.
+
+    category and difficulty are None outside sections / for [CATEGORY]
+    sections. Invalid lines are counted in stats['invalid'] if given.
+    """
+    category = None
+    difficulty = None
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        if line.startswith('[') and line.endswith(']'):
+            category, _, difficulty = line[1:-1].partition(':')
+            difficulty = difficulty or None
+            continue
+        word = normalize_word(line)
+        if word is None:
+            if stats is not None:
+                stats['invalid'] += 1
+            continue
+        yield category, difficulty, word
+
+
+class WordStore(Sequence):
+    """Append-only set of words in one contiguous buffer.
+
+    Word k is data[offsets[k]:offsets[k + 1]]. groups maps
+    (category, difficulty) to an array of word ids.
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+        self.offsets = array('I', [0])
+        self.groups = {}
+        # Open-addressing table of word id + 1 (0 = empty), kept under 2/3 full
+        self._table = array('I', bytes(4 * 1024))
+        self._mask = len(self._table) - 1
+
+    @classmethod
+    def attach(cls, offsets, data):
+        """Read-only store over existing buffers, e.g. a shared memory block.
+
+        offsets holds len + 1 native uint32 word boundaries and data the
+        encoded words; neither is copied. Nothing can be added to the store
+        and find() isn't available.
+        """
+        store = cls.__new__(cls)
+        store.data = memoryview(data).toreadonly()
+        store.offsets = memoryview(offsets).cast('B').cast('I')
+        store.groups = {}
+        store._table = None
+        store._mask = 0
+        return store
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def word_bytes(self, word_id):
+        return self.data[self.offsets[word_id]:self.offsets[word_id + 1]]
+
+    def __getitem__(self, word_id):
+        if isinstance(word_id, slice):
+            return WordView(self, array('I', range(len(self))[word_id]))
+        if word_id < 0:
+            word_id += len(self)
+        if not 0 <= word_id < len(self):
+            raise IndexError("word id out of range")
+        return str(self.word_bytes(word_id), 'utf-8')
+
+    def __iter__(self):
+        data, offsets = self.data, self.offsets
+        for k in range(len(self)):
+            yield str(data[offsets[k]:offsets[k + 1]], 'utf-8')
+
+    def _slot(self, encoded):
+        """Table slot holding encoded, or the empty slot where it belongs."""
+        table, mask = self._table, self._mask
+        slot = hash(encoded) & mask
+        while True:
+            entry = table[slot]
+            if not entry or self.word_bytes(entry - 1) == encoded:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow(self):
+        self._table = array('I', bytes(8 * len(self._table)))
+        self._mask = len(self._table) - 1
+        for word_id in range(len(self)):
+            self._table[self._slot(bytes(self.word_bytes(word_id)))] = word_id + 1
+
+    def find(self, word):
+        """Id of word, or None."""
+        entry = self._table[self._slot(word.encode('utf-8'))]
+        return entry - 1 if entry else None
+
+    def intern(self, word):
+        """Id of word, storing it first if it is new; returns (word_id, added)."""
+        encoded = word.encode('utf-8')
+        slot = self._slot(encoded)
+        entry = self._table[slot]
+        if entry:
+            return entry - 1, False
+
+        word_id = len(self)
+        self.data += encoded
+        self.offsets.append(len(self.data))
+        self._table[slot] = word_id + 1
+        if 3 * len(self) > 2 * len(self._table):
+            self._grow()
+        return word_id, True
+
+    def add(self, word, category=None, difficulty=None):
+        """Store word (already normalized) in a group unless it is already stored."""
+        word_id, added = self.intern(word)
+        if added:
+            group = self.groups.get((category, difficulty))
+            if group is None:
+                group = self.groups[category, difficulty] = array('I')
+            group.append(word_id)
+        return word_id, added
+
+    def view(self, ids):
+        """WordView of the given word ids (an array('I') or other int sequence)."""
+        return WordView(self, ids)
+
+    def group(self, category=None, difficulty=None):
+        return WordView(self, self.groups.get((category, difficulty), array('I')))
+
+    def nbytes(self):
+        """Bytes held by the buffers (excluding small per-object overhead)."""
+        total = len(self.data) + self.offsets.itemsize * len(self.offsets)
+        total += self._table.itemsize * len(self._table)
+        total += sum(group.itemsize * len(group) for group in self.groups.values())
+        return total
+
+
+class WordView(Sequence):
+    """Read-only sequence of store words selected by an id array.
+
+    Candidate sets and categories are views like this rather than lists of
+    str, so several of them can share one store without copying words.
+    """
+
+    def __init__(self, store, ids):
+        self.store = store
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return WordView(self.store, self.ids[i])
+        return self.store[self.ids[i]]
+
+    def __iter__(self):
+        store = self.store
+        for word_id in self.ids:
+            yield store[word_id]
+
+    def view(self, positions):
+        """WordView of the words at positions within this view."""
+        ids = self.ids
+        return WordView(self.store, array('I', (ids[p] for p in positions)))
+
+    def nbytes(self):
+        return self.ids.itemsize * len(self.ids) if isinstance(self.ids, array) else 8 * len(self.ids)
+
+
+def ingest(path, store=None, keep_sections=False):
+    """Stream the dictionary at path (optionally .gz) into store.
+
+    Returns (store, stats). Every word is stored once; a word seen again in
+    a later section stays only in the group where it first appeared, unless
+    keep_sections is set, in which case it is listed in each section it
+    appears in (the words.txt layout relies on this for EXPERT).
+    """
+    store = store if store is not None else WordStore()
+    stats = {'accepted': 0, 'duplicates': 0, 'invalid': 0}
+    with open_dictionary(path) as lines:
+        for category, difficulty, word in iter_dictionary(lines, stats):
+            word_id, added = store.add(word, category, difficulty)
+            if added:
+                stats['accepted'] += 1
+                continue
+            stats['duplicates'] += 1
+            if keep_sections:
+                # Linear in the section size; meant for curated lists, not huge imports
+                group = store.groups.setdefault((category, difficulty), array('I'))
+                if word_id not in group:
+                    group.append(word_id)
+    return store, stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream a dictionary into a compact word store and report memory.")
+    parser.add_argument('path', help="word file (words.txt format or one word per line, optionally .gz)")
+    parser.add_argument('--trace-memory', action='store_true', help="also report peak Python allocations (slower)")
+    args = parser.parse_args()
+
+    if args.trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    store, stats = ingest(args.path)
+    elapsed = time.perf_counter() - start
+
+    print(f"Accepted {stats['accepted']} words, skipped {stats['duplicates']} duplicates "
+          f"and {stats['invalid']} invalid lines in {elapsed:.2f}s")
+    print(f"Store: {store.nbytes() / 1e6:.2f} MB in {len(store.groups)} groups")
+    if args.trace_memory:
+        print(f"Peak traced memory: {tracemalloc.get_traced_memory()[1] / 1e6:.2f} MB")
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main()